@@ -0,0 +1,90 @@
+"""Blit time of the long-lived Surfaces, before and after conversion.
+
+Every asset is blitted to the display in three forms:
+
+- alpha: per pixel alpha, unconverted (how the assets used to be drawn);
+- raw: as drawn, before the display exists (unconverted);
+- display: converted to the display format, color keys RLE accelerated.
+
+Usage: SDL_VIDEODRIVER=dummy python -m benchmarks.blit_formats
+"""
+import time
+from typing import Callable, Dict
+
+import click
+import pygame
+from pygame.surface import Surface
+
+from games.projectile import MainApp as ProjectileMainApp
+from games.projectile.core import Blueprint, ProjectileManager, Turret
+from games.projectile.terrain import Terrain
+from games.projectile.turret import TurretRenderer
+from games.snake.elements import cell_sprite
+from games.snake.grid import Grid
+
+
+def build_assets() -> Dict[str, Callable[[], Surface]]:
+    """Asset builders, by name. Each call returns the current Surface."""
+    blueprint = Blueprint(name="blocks")
+    terrain = Terrain(blueprint=blueprint)
+    turret = TurretRenderer(
+        turret=Turret(blueprint=blueprint, pm=ProjectileManager(blueprint)),
+        block_size=blueprint.block_size,
+    )
+    app = ProjectileMainApp(
+        bp_name="blocks", debug=False, grid=True, show_fps=False
+    )
+    grid = Grid(size=(20, 20), seed=0)
+    return {
+        "terrain": lambda: terrain.surface,
+        "proj. grid": lambda: app._grid_surface,
+        "turret": lambda: turret.surface,
+        "snake grid": lambda: grid.base_surface,
+        "snake cell": lambda: cell_sprite((0x00, 0xFF, 0x00, 0xFF)),
+    }
+
+
+def per_pixel_alpha(surface: Surface) -> Surface:
+    """Same image, with per pixel alpha instead of a color key.
+
+    Surface alpha, if any, is baked into the pixels.
+    """
+    alpha = Surface(size=surface.get_size(), flags=pygame.SRCALPHA)
+    alpha.blit(surface, (0, 0))
+    return alpha
+
+
+def measure(surface: Surface, display: Surface, repeat: int) -> float:
+    """Average blit time (µs)."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        display.blit(surface, (0, 0))
+
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+@click.command()
+@click.option("-r", "--repeat", default=2000)
+def main(repeat: int):
+    """Print µs/blit per asset and format."""
+    pygame.init()
+    assets = build_assets()
+    raw = {name: build() for name, build in assets.items()}
+
+    display = pygame.display.set_mode((1500, 640))
+    click.echo(
+        f"{'asset':>10}  {'alpha µs':>9}  {'raw µs':>7}  {'display µs':>10}"
+        f"  {'speedup':>7}"
+    )
+    for name, build in assets.items():
+        alpha_us = measure(per_pixel_alpha(raw[name]), display, repeat)
+        raw_us = measure(raw[name], display, repeat)
+        display_us = measure(build(), display, repeat)
+        click.echo(
+            f"{name:>10}  {alpha_us:>9.1f}  {raw_us:>7.1f}"
+            f"  {display_us:>10.1f}  {alpha_us / display_us:>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
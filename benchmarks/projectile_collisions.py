@@ -0,0 +1,63 @@
+"""Scaling of the projectile-vs-projectile collision detection.
+
+Compares the uniform grid broad phase of `ProjectileManager` against a naive
+check of every pair, over the area of a Blueprint.
+
+Usage: python -m benchmarks.projectile_collisions
+"""
+import time
+
+import click
+import numpy as np
+
+from games.projectile.core import Blueprint, ProjectileManager
+
+
+def populate(manager: ProjectileManager, count: int, seed: int) -> None:
+    """Create Projectiles spread over the whole Blueprint."""
+    rng = np.random.default_rng(seed)
+    width, height = manager._blueprint.rect.size
+    for _ in range(count):
+        pos = rng.uniform((0, 0), (width, height))
+        velocity = rng.uniform(-5, 5, 2)
+        manager.create_projectile(velocity=velocity, pos=pos)
+
+
+def naive(manager: ProjectileManager) -> int:
+    """Find the touching pairs out of every pair of Projectiles."""
+    pos = manager.positions
+    offsets = pos[:, None] - pos[None]
+    distance_squared = (offsets**2).sum(axis=2)
+    touching = distance_squared < (2 * manager.RADIUS) ** 2
+    return int(np.triu(touching, k=1).sum())
+
+
+def measure(func, repeat: int) -> float:
+    """Average run time (ms)."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+@click.command()
+@click.option("-b", "--blueprint", default="blocks")
+@click.option("-r", "--repeat", default=5)
+@click.option("--naive-limit", default=4000, help="Skip naive above this.")
+def main(blueprint: str, repeat: int, naive_limit: int):
+    """Print ms/tick for increasing numbers of Projectiles."""
+    click.echo(f"{'projectiles':>11}  {'grid ms':>8}  {'naive ms':>9}")
+    for count in (250, 500, 1000, 2000, 4000, 8000):
+        manager = ProjectileManager(blueprint=Blueprint(name=blueprint))
+        populate(manager, count, seed=count)
+        grid_ms = measure(manager._handle_collisions, repeat)
+        naive_ms = "-"
+        if count <= naive_limit:
+            naive_ms = f"{measure(lambda: naive(manager), 1):.2f}"
+
+        click.echo(f"{count:>11}  {grid_ms:>8.2f}  {naive_ms:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Accuracy vs. cost of the Projectile Integrators.
+
+Every Integrator flies the same Projectile (gravity and drag, no terrain)
+with increasing time steps, as if the logic rate was lowered. The final
+position is compared against a high resolution reference trajectory. The
+cost is measured over a batch of Projectiles, like `ProjectileManager`.
+
+Usage: python -m benchmarks.projectile_integrators
+"""
+import time
+
+import click
+import numpy as np
+
+from games.projectile.core.integrators import INTEGRATORS, VelocityVerlet
+from games.projectile.core.projectile import ProjectileManager
+
+#: Initial state of the Projectile: (position, velocity (px/tick)).
+START = ((0.0, 0.0), (3.0, -3.0))
+
+
+def fly(integrator, duration: int, dt: float, batch: int = 1) -> np.ndarray:
+    """Final position after `duration` ticks, in steps of `dt` ticks."""
+    pos, velocity = (np.tile(value, (batch, 1)) for value in START)
+    for _ in range(round(duration / dt)):
+        pos, velocity = integrator.step(pos, velocity, dt)
+
+    return pos[0]
+
+
+@click.command()
+@click.option("-t", "--duration", default=1000, help="Flight time (ticks).")
+@click.option("-r", "--resolution", default=1000, help="Reference steps/tick.")
+@click.option("-n", "--batch", default=1000, help="Projectiles per step.")
+def main(duration: int, resolution: int, batch: int):
+    """Print the position error and cost of each Integrator."""
+    params = dict(
+        gravity=ProjectileManager.GRAVITY,
+        drag=ProjectileManager.DRAG_CONSTANT,
+    )
+    reference = fly(VelocityVerlet(**params), duration, 1 / resolution)
+
+    click.echo(
+        f"{'integrator':>10}  {'dt':>5}  {'error px':>10}  {'ns/proj':>8}"
+    )
+    for name, cls in sorted(INTEGRATORS.items()):
+        integrator = cls(**params)
+        for dt in (0.25, 1, 2, 5, 10):
+            start = time.perf_counter()
+            pos = fly(integrator, duration, dt, batch)
+            cost = (time.perf_counter() - start) / duration / batch * 1e9
+            error = np.hypot(*(pos - reference))
+            click.echo(f"{name:>10}  {dt:>5}  {error:>10.4f}  {cost:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
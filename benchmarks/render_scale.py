@@ -0,0 +1,78 @@
+"""Frame rate of both games at different render scales.
+
+Renders the same game state repeatedly, without processing any ticks, so
+only the drawing, upscaling and presenting of the frames is measured. Run
+with `SDL_VIDEODRIVER=dummy` to leave the window out of it.
+
+Usage: python -m benchmarks.render_scale
+"""
+import time
+
+import click
+import numpy as np
+import pygame
+
+from games.application import GameApplication
+from games.projectile import MainApp as ProjectileMainApp
+from games.snake.main import MainApp as SnakeMainApp
+
+SCALES = (1.0, 0.75, 0.5, 0.25)
+
+
+def projectile_app(render_scale: float, projectiles: int) -> GameApplication:
+    """Projectile game with shells spread over the whole Blueprint."""
+    app = ProjectileMainApp(
+        bp_name="blocks",
+        debug=False,
+        grid=True,
+        show_fps=False,
+        render_scale=render_scale,
+    )
+    manager = app._proj_mgmt
+    rng = np.random.default_rng(0)
+    width, height = app._blueprint.rect.size
+    for _ in range(projectiles):
+        pos = rng.uniform((0, 0), (width, height))
+        manager.create_projectile(velocity=(0, 0), pos=pos)
+
+    manager.particles.explode(pos=rng.uniform((0, 0), (width, height), (8, 2)))
+    return app
+
+
+def snake_app(render_scale: float, projectiles: int) -> GameApplication:
+    """Snake game on its default Grid."""
+    return SnakeMainApp(debug=False, render_scale=render_scale)
+
+
+def measure(app: GameApplication, frames: int) -> float:
+    """Frames per second."""
+    app._render_graphics()  # Warm up the caches.
+    start = time.perf_counter()
+    for _ in range(frames):
+        app._render_graphics()
+
+    elapsed = time.perf_counter() - start
+    pygame.display.quit()  # Each App opens its own window.
+    return frames / elapsed
+
+
+@click.command()
+@click.option("-f", "--frames", default=300)
+@click.option("-n", "--projectiles", default=500)
+def main(frames: int, projectiles: int):
+    """Print FPS per game and render scale."""
+    games = {"projectile": projectile_app, "snake": snake_app}
+    click.echo(f"{'game':>10}  {'scale':>5}  {'fps':>7}  {'speedup':>7}")
+    for name, build in games.items():
+        baseline = None
+        for scale in SCALES:
+            fps = measure(build(scale, projectiles), frames)
+            baseline = baseline or fps
+            click.echo(
+                f"{name:>10}  {scale:>5.2f}  {fps:>7.1f}"
+                f"  {fps / baseline:>7.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""End-to-end scenarios of both games, gated against a stored baseline.
+
+Every scenario plays a whole game headless and deterministically, ticks and
+frames included, in its own process. Ticks/s, frames/s and peak RSS are
+compared against `baseline.json`, and any regression beyond the tolerances
+stored there fails the run. Ticks and frames must match exactly: a change
+means the scenario itself changed, and the baseline must be updated.
+
+Baselines are machine specific: update them on the machine that gates.
+
+Usage:
+    python -m benchmarks.scenarios            # Compare with the baseline.
+    python -m benchmarks.scenarios --update   # Store a new baseline.
+"""
+import json
+import multiprocessing
+import os
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from random import Random
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+import click
+
+BASELINE = Path(__file__).with_name("baseline.json")
+
+
+class Result(NamedTuple):
+    """Measurements of a scenario."""
+
+    ticks: int
+    frames: int
+    ticks_per_s: float
+    frames_per_s: float
+    peak_rss_mib: float
+
+
+class Timer:
+    """Time the ticks and frames of a game, separately."""
+
+    def __init__(self, app, tick_step: float):
+        """Create a new Timer.
+
+        :param app: Game Application.
+        :param tick_step: Simulated time between ticks (ms).
+        """
+        self._app = app
+        self._tick_step = tick_step
+        self.ticks = 0
+        self.frames = 0
+        self._tick_s = 0.0
+        self._frame_s = 0.0
+
+    def tick(self) -> None:
+        """Process a tick of simulated time."""
+        start = time.perf_counter()
+        self._app._update_game_state(tick=self.ticks * self._tick_step)
+        self._tick_s += time.perf_counter() - start
+        self.ticks += 1
+
+    def frame(self) -> None:
+        """Render and present a frame."""
+        start = time.perf_counter()
+        self._app._render_graphics()
+        self._frame_s += time.perf_counter() - start
+        self.frames += 1
+
+    def result(self) -> Result:
+        """Measurements so far, with the peak RSS of the process."""
+        peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return Result(
+            ticks=self.ticks,
+            frames=self.frames,
+            ticks_per_s=round(self.ticks / self._tick_s, 1),
+            frames_per_s=round(self.frames / self._frame_s, 1),
+            peak_rss_mib=round(peak_kib / 1024, 1),
+        )
+
+
+def snake_length_300() -> Result:
+    """Autopilot on a 100x100 Grid until the Snake is 300 cells long.
+
+    A frame is rendered every 5 ticks.
+    """
+    from games.snake.enums import State
+    from games.snake.main import MainApp
+
+    app = MainApp(debug=False, size=(100, 100), autopilot=True, seed=0)
+    snake = app._grid.snake
+    timer = Timer(app, tick_step=app.TICK_STEP)
+    while len(snake) < 300:
+        timer.tick()
+        if snake.state == State.DEAD:
+            raise RuntimeError(f"Snake died at length {len(snake)}.")
+
+        if timer.ticks % 5 == 0:
+            timer.frame()
+
+    return timer.result()
+
+
+def projectile_500_shells() -> Result:
+    """500 live shells on `blocks` for 60 simulated seconds.
+
+    The Turret fires up to 5 shells per tick, spread around its aim, to keep
+    500 of them alive. A frame is rendered every 2 ticks.
+    """
+    from games.projectile import MainApp
+
+    app = MainApp(bp_name="blocks", debug=False, grid=False, show_fps=False)
+    manager, hero = app._proj_mgmt, app._hero
+    rng = Random(0)
+    timer = Timer(app, tick_step=app.TICK_STEP)
+    for _ in range(round(60_000 / app.TICK_STEP)):
+        for _ in range(min(500 - len(manager), 5)):
+            hero.shoot(angle=hero.angle + rng.uniform(-40, 40))
+
+        timer.tick()
+        if timer.ticks % 2 == 0:
+            timer.frame()
+
+    return timer.result()
+
+
+SCENARIOS: Dict[str, Callable[[], Result]] = {
+    "snake-length-300": snake_length_300,
+    "projectile-500-shells": projectile_500_shells,
+}
+
+
+def run(name: str) -> Result:
+    """Run a scenario in a fresh process, so the peak RSS is its own."""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(SCENARIOS[name]).result()
+
+
+def compare(
+    result: Result, baseline: Result, tolerances: Dict[str, float]
+) -> List[Tuple[str, str]]:
+    """Regressions of a result.
+
+    :return: Pairs of (metric, description).
+    """
+    regressions = []
+    for metric in ("ticks", "frames"):
+        expected, actual = getattr(baseline, metric), getattr(result, metric)
+        if actual != expected:
+            regressions.append((metric, f"{actual} != {expected}"))
+
+    for metric, tolerance in tolerances.items():
+        expected, actual = getattr(baseline, metric), getattr(result, metric)
+        change = actual / expected - 1
+        if metric == "peak_rss_mib":  # Memory must not grow...
+            worse = change > tolerance
+        else:  # ...and throughput must not drop.
+            worse = change < -tolerance
+
+        if worse:
+            regressions.append(
+                (metric, f"{actual} vs {expected} ({change:+.0%})")
+            )
+
+    return regressions
+
+
+@click.command()
+@click.option(
+    "-s",
+    "--scenario",
+    "names",
+    multiple=True,
+    type=click.Choice(sorted(SCENARIOS)),
+    help="Scenarios to run. All by default.",
+)
+@click.option(
+    "--baseline",
+    "path",
+    type=click.Path(dir_okay=False),
+    default=str(BASELINE),
+)
+@click.option("--update", is_flag=True, help="Store the results as baseline.")
+def main(names: Tuple[str, ...], path: str, update: bool):
+    """Run the scenarios and compare them with the baseline."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    path = Path(path)
+    stored = json.loads(path.read_text()) if path.exists() else {}
+    tolerances = stored.get("tolerances", {})
+    baselines = stored.get("scenarios", {})
+
+    failures = 0
+    for name in names or sorted(SCENARIOS):
+        result = run(name)
+        click.echo(
+            f"{name}: {result.ticks} ticks at {result.ticks_per_s} ticks/s,"
+            f" {result.frames} frames at {result.frames_per_s} fps,"
+            f" peak RSS {result.peak_rss_mib} MiB"
+        )
+        if update:
+            baselines[name] = result._asdict()
+            continue
+
+        if name not in baselines:
+            raise click.ClickException(f"No baseline for {name}.")
+
+        baseline = Result(**baselines[name])
+        for metric, description in compare(result, baseline, tolerances):
+            click.secho(f"  REGRESSION {metric}: {description}", fg="red")
+            failures += 1
+
+    if update:
+        stored["scenarios"] = baselines
+        path.write_text(json.dumps(stored, indent=2) + "\n")
+    elif failures:
+        raise click.ClickException(f"{failures} regressions.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Throughput of the batched Snake engine.
+
+Its rules are checked against `SnakeEnv` by `tests/test_batch.py`.
+
+Usage: python -m benchmarks.snake_batch --games 4096
+"""
+import time
+
+import click
+import numpy as np
+
+from games.snake.batch import SnakeBatch
+
+
+@click.command()
+@click.option("-g", "--games", default=4096)
+@click.option("-t", "--ticks", default=1000)
+@click.option("-s", "--size", type=(int, int), default=(20, 20))
+def main(games: int, ticks: int, size: tuple):
+    """Step N games with random actions and report steps/s."""
+    rng = np.random.default_rng(0)
+    batch = SnakeBatch(n=games, size=size, seed=0)
+    actions = rng.integers(len(batch.ACTIONS), size=(ticks, games))
+    start = time.perf_counter()
+    for tick in range(ticks):
+        batch.step(actions[tick])
+
+    elapsed = time.perf_counter() - start
+    click.echo(f"{games * ticks / elapsed:,.0f} steps/s ({games} games)")
+
+
+if __name__ == "__main__":
+    main()
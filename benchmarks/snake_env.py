@@ -0,0 +1,37 @@
+"""Throughput of the headless Snake environment.
+
+Usage: python -m benchmarks.snake_env --steps 1000000
+"""
+import time
+from random import Random
+
+import click
+
+from games.snake.env import SnakeEnv
+
+
+@click.command()
+@click.option("-n", "--steps", default=1_000_000)
+@click.option("-s", "--size", type=(int, int), default=(20, 20))
+def main(steps: int, size: tuple):
+    """Step the environment with random actions and report steps/s."""
+    env = SnakeEnv(size=size)
+    env.reset(seed=0)
+
+    rng = Random(0)
+    actions = [rng.randrange(len(env.ACTIONS)) for _ in range(1 << 16)]
+
+    games = 0
+    start = time.perf_counter()
+    for step in range(steps):
+        _, _, done = env.step(actions[step & 0xFFFF])
+        if done:
+            env.reset(seed=step)
+            games += 1
+
+    elapsed = time.perf_counter() - start
+    click.echo(f"{steps / elapsed:,.0f} steps/s ({games} games)")
+
+
+if __name__ == "__main__":
+    main()
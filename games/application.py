@@ -1,12 +1,18 @@
 """Interfaces for game Applications."""
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from functools import cached_property
+from time import perf_counter
+from typing import ContextManager
 
 import pygame
 from pygame.event import Event
 from pygame.surface import Surface
 from pygame.time import Clock
 
-from games.utils import time_ms
+from games.governor import LEVELS, Quality, QualityGovernor
+from games.tracing import AllocationTracer, Phase
+from games.utils import LatencyTracker, scaled_size, time_ms
 
 
 def handle_quit(event: Event) -> None:
@@ -38,9 +44,26 @@ class GameApplication(ABC):
     #: Difference in time between ticks (ms)
     TICK_STEP = None
 
-    def __init__(self):
+    def __init__(
+        self,
+        render_scale: float = 1.0,
+        trace_alloc: bool = False,
+        adaptive_quality: bool = False,
+    ):
+        """Generic Game Application.
+
+        :param render_scale: Resolution of the frames, relative to the
+          Screen. Frames are drawn onto a smaller canvas and upscaled, so
+          filling and blending get cheaper at the cost of detail.
+        :param trace_alloc: If `True`, log the allocations and GC pauses of
+          the ticks and frames (see `AllocationTracer`).
+        :param adaptive_quality: If `True`, lower the rendering quality when
+          the game can't keep up, and raise it back when it can (see
+          `QualityGovernor`).
+        """
         assert self.CAPTION, "Missing Application Caption."
         assert self.TICK_STEP, "Missing Tick Step."
+        assert 0 < render_scale <= 1, "Render scale must be in (0, 1]."
 
         # Init PyGame
         pygame.init()
@@ -50,6 +73,19 @@ class GameApplication(ABC):
         self._next_tick = time_ms()
         self._render_clock = Clock()
         self._running = True
+        self._render_scale = render_scale
+        self._base_scale = render_scale
+
+        #: Delay between handling inputs and presenting their effect.
+        self._input_latency = LatencyTracker()
+
+        self._alloc_tracer = AllocationTracer() if trace_alloc else None
+
+        self._governor = None
+        if adaptive_quality:
+            self._governor = QualityGovernor(
+                tick_step=self.TICK_STEP, max_frameskip=self.MAX_FRAMESKIP
+            )
 
     # Interface
 
@@ -61,6 +97,19 @@ class GameApplication(ABC):
         Should be implemented as a `cached_property`.
         """
 
+    @cached_property
+    def _canvas(self) -> Surface:
+        """Surface the frames are drawn onto.
+
+        The Screen itself, unless there's a render scale. Then it's a smaller
+        Surface in the Screen format, upscaled to the Screen every frame.
+        """
+        if self._render_scale == 1:
+            return self._screen
+
+        size = scaled_size(self._screen.get_size(), self._render_scale)
+        return Surface(size=size).convert(self._screen)
+
     @abstractmethod
     def _handle_events(self, event: Event) -> None:
         """Handle game events.
@@ -80,14 +129,45 @@ class GameApplication(ABC):
 
     @abstractmethod
     def _draw_graphics(self, interp: float) -> None:
-        """Draw contents of the frame to the Screen.
+        """Draw contents of the frame to the canvas (see `_canvas`).
 
         :param interp: To allow smoother movement on screen, interpolation is
           used when rendering the screen between game state updates,
         """
 
+    def _draw_overlay(self) -> None:
+        """Draw on top of the upscaled frame, at the Screen resolution.
+
+        Meant for text, which doesn't survive the upscaling. Nothing by
+        default.
+        """
+
+    def _apply_quality(self, quality: Quality) -> None:
+        """Switch to another rendering Quality.
+
+        Resizes the canvas. Subclasses extend it to follow the rest of the
+        Quality settings.
+        """
+        self._render_scale = self._base_scale * quality.render_scale
+        self.__dict__.pop("_canvas", None)  # Rebuilt at the new scale.
+
     # Application Methods
 
+    @property
+    def _quality(self) -> Quality:
+        """Current rendering Quality. Always full, unless adaptive."""
+        if self._governor:
+            return self._governor.quality
+
+        return LEVELS[0]
+
+    def _measure(self, phase: Phase) -> ContextManager[None]:
+        """Trace the allocations of a phase, if tracing."""
+        if self._alloc_tracer:
+            return self._alloc_tracer.measure(phase)
+
+        return nullcontext()
+
     def _calc_interpolation(self) -> float:
         """Calculate the Interpolation between game ticks."""
         next_prediction = time_ms() + self.TICK_STEP - self._next_tick
@@ -104,21 +184,45 @@ class GameApplication(ABC):
 
     def _render_graphics(self):
         """Render the frame and display it in the screen."""
-        interpolation = self._calc_interpolation()
+        interpolation = 0.0
+        if self._quality.interpolate:
+            interpolation = self._calc_interpolation()
+
         self._draw_graphics(interp=interpolation)
+        if self._canvas is not self._screen:
+            # Nearest neighbor, so pixels stay crisp.
+            size = self._screen.get_size()
+            pygame.transform.scale(self._canvas, size, self._screen)
+
+        self._draw_overlay()
         pygame.display.flip()
+        self._input_latency.presented()
         self._render_clock.tick()
 
     def _main_loop(self):
         """Main Loop, repeated indefinitely, until it's stopped."""
         loops = 0
+        start = perf_counter()
         current_tick = time_ms()
         while current_tick > self._next_tick and loops < self.MAX_FRAMESKIP:
-            self._update_game_state(tick=current_tick)
+            with self._measure(Phase.TICK):
+                self._update_game_state(tick=current_tick)
+
             self._next_tick += self.TICK_STEP
             loops += 1
 
-        self._render_graphics()
+        rendering = perf_counter()
+        with self._measure(Phase.FRAME):
+            self._render_graphics()
+
+        if self._governor:
+            changed = self._governor.update(
+                ticks=loops,
+                tick_ms=(rendering - start) * 1000,
+                frame_ms=(perf_counter() - rendering) * 1000,
+            )
+            if changed:
+                self._apply_quality(self._governor.quality)
 
     def run(self) -> None:
         """Run the application."""
@@ -127,3 +231,7 @@ class GameApplication(ABC):
                 self._main_loop()
             except QuitApplication:
                 break
+
+        if self._alloc_tracer:
+            self._alloc_tracer.report()
+            self._alloc_tracer.stop()
@@ -0,0 +1,124 @@
+"""Long-lived Surfaces, kept in the pixel format of the display.
+
+Blitting a Surface of a different pixel format converts every pixel, every
+time. Surfaces that outlive a frame are built through this module instead:
+they're converted once the display exists and rebuilt if its format changes.
+"""
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+import pygame
+from pygame.surface import Surface
+
+#: Transparent color of the color keyed Surfaces.
+COLOR_KEY = (0x00, 0x01, 0x02)
+
+#: Bit depth and RGBA masks of a display.
+Format = Tuple[int, Tuple[int, int, int, int]]
+
+
+def display_format() -> Optional[Format]:
+    """Pixel format of the display. `None` until there's a display."""
+    display = pygame.display.get_surface()
+    if display is None:
+        return None
+
+    return display.get_bitsize(), display.get_masks()
+
+
+def convert(surface: Surface) -> Surface:
+    """Convert a Surface to the display format, if there's a display.
+
+    Per pixel alpha is kept. Color keys and surface alpha are RLE
+    accelerated, so transparent runs of pixels are skipped when blitting.
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+
+    colorkey = surface.get_colorkey()
+    alpha = surface.get_alpha()
+    if surface.get_flags() & pygame.SRCALPHA:
+        converted = surface.convert_alpha()
+    else:
+        converted = surface.convert()
+
+    if colorkey is not None:
+        converted.set_colorkey(colorkey, pygame.RLEACCEL)
+
+    if alpha is not None and alpha < 0xFF:
+        converted.set_alpha(alpha, pygame.RLEACCEL)
+
+    return converted
+
+
+def color_keyed(size: Tuple[int, int]) -> Surface:
+    """Transparent Surface, using `COLOR_KEY` instead of per pixel alpha.
+
+    Unlike per pixel alpha, color keys can be RLE accelerated.
+    """
+    surface = Surface(size=size)
+    surface.fill(COLOR_KEY)
+    surface.set_colorkey(COLOR_KEY)
+    return surface
+
+
+class SurfaceCache:
+    """Surfaces by key, in the display format.
+
+    Emptied whenever the display format changes, so every Surface is rebuilt
+    and converted again on the next access.
+    """
+
+    def __init__(self):
+        """Create an empty Surface Cache."""
+        self._surfaces: Dict[Hashable, Surface] = {}
+        self._format: Optional[Format] = None
+
+    def __len__(self) -> int:
+        """Number of cached Surfaces."""
+        return len(self._surfaces)
+
+    def get(
+        self, key: Hashable, build: Callable[[Hashable], Surface]
+    ) -> Surface:
+        """Cached Surface, built and converted on the first access.
+
+        :param key: Identifier of the Surface.
+        :param build: Draws the Surface of a key, in any format.
+        """
+        current = display_format()
+        if current != self._format:
+            self._surfaces.clear()
+            self._format = current
+
+        surface = self._surfaces.get(key)
+        if surface is None:
+            surface = self._surfaces[key] = convert(build(key))
+
+        return surface
+
+
+class display_surface:
+    """Like `cached_property`, for Surfaces in the display format.
+
+    The Surface is rebuilt and converted again whenever the display format
+    changes, including when the display is first created.
+    """
+
+    def __init__(self, func: Callable[[object], Surface]):
+        self._func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attr = f"_{name}_asset"
+
+    def __get__(self, instance: object, owner: type = None) -> Surface:
+        if instance is None:
+            return self
+
+        current = display_format()
+        cached = instance.__dict__.get(self._attr)
+        if cached is None or cached[0] != current:
+            cached = current, convert(self._func(instance))
+            instance.__dict__[self._attr] = cached
+
+        return cached[1]
@@ -1,9 +1,32 @@
 """Application Command Line Interface."""
+import asyncio
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Optional, Tuple
 
 import click
 
 from games.projectile import MainApp as ProjectileMainApp
+from games.projectile.core import Resolution
+from games.projectile.core.generator import Style, generate
+from games.projectile.core.integrators import INTEGRATORS
+from games.projectile.core.terrain import (
+    BINARY_SUFFIX,
+    BLUEPRINT_DIR,
+    write_binary,
+)
+from games.projectile.stress import StressApp
+from games.snake import multiplayer, tournament
+from games.snake.controllers import CONTROLLERS
+from games.snake.level import level_names
 from games.snake.main import MainApp as SnakeMainApp
+from games.snake.settings import GRID_SIZE, TICK_STEP
+
+#: Type of the Grid size options: columns and rows, at least one of each.
+SIZE_TYPE = (click.IntRange(min=1), click.IntRange(min=1))
 
 
 @click.group()
@@ -13,8 +36,141 @@ def cli():
 
 @cli.command()
 @click.option("-d", "--debug/--no-debug", default=False)
-def snake(debug: bool):
-    SnakeMainApp(debug=debug).run()
+@click.option(
+    "-s",
+    "--size",
+    type=SIZE_TYPE,
+    default=GRID_SIZE,
+    help="Number of grid cells (columns rows).",
+)
+@click.option("-a", "--autopilot/--no-autopilot", default=False)
+@click.option(
+    "-l",
+    "--level",
+    type=click.Choice(level_names()),
+    default=None,
+    help="Level with walls. Overrides the size.",
+)
+@click.option(
+    "--render-scale",
+    type=click.FloatRange(0.1, 1.0),
+    default=1.0,
+    help="Frame resolution, relative to the window.",
+)
+@click.option(
+    "--trace-alloc",
+    is_flag=True,
+    help="Log allocations and GC pauses per tick and frame.",
+)
+@click.option(
+    "--adaptive-quality/--fixed-quality",
+    default=False,
+    help="Lower the rendering quality when the game can't keep up.",
+)
+def snake(
+    debug: bool,
+    size: Tuple[int, int],
+    autopilot: bool,
+    level: Optional[str],
+    render_scale: float,
+    trace_alloc: bool,
+    adaptive_quality: bool,
+):
+    if trace_alloc:
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    SnakeMainApp(
+        debug=debug,
+        size=size,
+        autopilot=autopilot,
+        level=level,
+        render_scale=render_scale,
+        trace_alloc=trace_alloc,
+        adaptive_quality=adaptive_quality,
+    ).run()
+
+
+@cli.command()
+@click.option(
+    "-c",
+    "--controller",
+    "controllers",
+    multiple=True,
+    type=click.Choice(sorted(CONTROLLERS)),
+    default=("autopilot", "greedy"),
+)
+@click.option(
+    "--seeds",
+    type=(int, int),
+    default=(0, 1000),
+    help="Range of Grid seeds (start stop).",
+)
+@click.option("-s", "--size", type=SIZE_TYPE, default=GRID_SIZE)
+@click.option("-t", "--max-ticks", type=click.IntRange(min=1), default=10_000)
+@click.option("-w", "--workers", default=os.cpu_count())
+@click.option("--chunk-size", default=50, help="Games per work unit.")
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(dir_okay=False),
+    help="CSV file with the result of every game.",
+)
+def snake_tournament(
+    controllers: Tuple[str, ...],
+    seeds: Tuple[int, int],
+    size: Tuple[int, int],
+    max_ticks: int,
+    workers: int,
+    chunk_size: int,
+    output: Optional[str],
+):
+    seed_range = range(*seeds)
+    games = tournament.run(
+        controllers=controllers,
+        seeds=seed_range,
+        size=size,
+        max_ticks=max_ticks,
+        chunk_size=chunk_size,
+        workers=workers,
+    )
+    total = len(controllers) * len(seed_range)
+    with click.progressbar(games, length=total, label="Games") as bar:
+        results = list(bar)
+
+    click.echo(tournament.format_table(tournament.summarize(results)))
+    if output:
+        tournament.write_csv(Path(output), results)
+
+
+@cli.command()
+@click.option("-h", "--host", default="127.0.0.1")
+@click.option("-p", "--port", default=7777)
+@click.option("-s", "--size", type=SIZE_TYPE, default=GRID_SIZE)
+@click.option("--seed", type=int, default=None)
+@click.option("-t", "--tick-step", default=TICK_STEP, help="Tick step (ms).")
+def snake_server(
+    host: str,
+    port: int,
+    size: Tuple[int, int],
+    seed: Optional[int],
+    tick_step: float,
+):
+    server = multiplayer.Server(size=size, seed=seed, tick_step=tick_step)
+    asyncio.run(server.serve(host=host, port=port))
+
+
+@cli.command()
+@click.option("-h", "--host", default="127.0.0.1")
+@click.option("-p", "--port", default=7777)
+@click.option(
+    "-c",
+    "--controller",
+    type=click.Choice(sorted(CONTROLLERS)),
+    default="autopilot",
+)
+@click.option("-t", "--ticks", type=int, default=None)
+def snake_bot(host: str, port: int, controller: str, ticks: Optional[int]):
+    asyncio.run(multiplayer.run_bot(host, port, controller, ticks))
 
 
 @cli.command()
@@ -22,7 +178,190 @@ def snake(debug: bool):
 @click.option("-d", "--debug/--no-debug", default=False)
 @click.option("-f", "--fps/--no-fps", default=False)
 @click.option("-g", "--grid/--no-grid", default=False)
-def projectile(blueprint: str, debug: bool, fps: bool, grid: bool):
-    ProjectileMainApp(
-        bp_name=blueprint, debug=debug, grid=grid, show_fps=fps
-    ).run()
+@click.option(
+    "-i",
+    "--integrator",
+    type=click.Choice(sorted(INTEGRATORS)),
+    default="euler",
+)
+@click.option(
+    "--max-step",
+    type=float,
+    default=None,
+    help="Maximum distance (px) per physics sub-step.",
+)
+@click.option(
+    "-w",
+    "--workers",
+    default=0,
+    help="Processes stepping the projectiles (0: in the game process)."
+    " Not with --heatmap.",
+)
+@click.option(
+    "--render-scale",
+    type=click.FloatRange(0.1, 1.0),
+    default=1.0,
+    help="Frame resolution, relative to the window.",
+)
+@click.option(
+    "--trace-alloc",
+    is_flag=True,
+    help="Log allocations and GC pauses per tick and frame.",
+)
+@click.option(
+    "--adaptive-quality/--fixed-quality",
+    default=False,
+    help="Lower the rendering quality when the game can't keep up.",
+)
+@click.option(
+    "--heatmap",
+    type=click.Choice([resolution.value for resolution in Resolution]),
+    default=None,
+    help="Record the impacts at this resolution. H toggles the overlay.",
+)
+@click.option(
+    "--heatmap-out",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Save the impact heatmap to this .npy file on exit.",
+)
+@click.option(
+    "--stress",
+    type=int,
+    default=None,
+    help="Auto-fire, up to this number of live projectiles.",
+)
+@click.option("--fire-rate", default=50.0, help="Stress shots per second.")
+@click.option("--duration", default=60.0, help="Stress duration (s).")
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(dir_okay=False),
+    default="stress.csv",
+    help="Stress scaling curve CSV.",
+)
+def projectile(
+    blueprint: str,
+    debug: bool,
+    fps: bool,
+    grid: bool,
+    integrator: str,
+    max_step: Optional[float],
+    workers: int,
+    render_scale: float,
+    trace_alloc: bool,
+    adaptive_quality: bool,
+    heatmap: Optional[str],
+    heatmap_out: Optional[str],
+    stress: Optional[int],
+    fire_rate: float,
+    duration: float,
+    output: str,
+):
+    if workers and (heatmap or heatmap_out):
+        raise click.UsageError(
+            "The heatmap can't record the impacts stepped by --workers."
+        )
+
+    kwargs = dict(
+        bp_name=blueprint,
+        debug=debug,
+        grid=grid,
+        show_fps=fps,
+        integrator=integrator,
+        max_step=max_step,
+        workers=workers,
+        render_scale=render_scale,
+        trace_alloc=trace_alloc,
+        adaptive_quality=adaptive_quality,
+        heatmap=heatmap or (Resolution.BLOCK if heatmap_out else None),
+        heatmap_path=Path(heatmap_out) if heatmap_out else None,
+    )
+    if stress or trace_alloc:
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if not stress:
+        ProjectileMainApp(**kwargs).run()
+        return
+
+    app = StressApp(
+        target=stress, fire_rate=fire_rate, duration=duration, **kwargs
+    )
+    app.run()
+    app.write_csv(Path(output))
+
+
+@cli.command()
+@click.argument("name")
+@click.option(
+    "-s",
+    "--size",
+    type=(int, int),
+    default=(30, 10),
+    help="Number of blocks (width height).",
+)
+@click.option(
+    "--style",
+    type=click.Choice([style.value for style in Style]),
+    default=Style.CAVE.value,
+)
+@click.option("--seed", type=int, default=None)
+@click.option(
+    "--density",
+    type=click.FloatRange(0.0, 1.0),
+    default=None,
+    help="Fraction of walls. Default depends on the style.",
+)
+@click.option(
+    "--block",
+    type=(int, int),
+    default=(50, 50),
+    help="Block size in px (width height).",
+)
+@click.option(
+    "--binary",
+    is_flag=True,
+    help=f"Write the compact binary format ({BINARY_SUFFIX}).",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(file_okay=False),
+    default=str(BLUEPRINT_DIR),
+    help="Directory of the blueprint.",
+)
+def blueprint_gen(
+    name: str,
+    size: Tuple[int, int],
+    style: str,
+    seed: Optional[int],
+    density: Optional[float],
+    block: Tuple[int, int],
+    binary: bool,
+    output: str,
+):
+    """Generate a blueprint, loaded with `projectile -b NAME`."""
+    start = time.perf_counter()
+    try:
+        data = generate(
+            name=name,
+            size=size,
+            style=style,
+            seed=seed,
+            density=density,
+            block_size=block,
+        )
+    except ValueError as error:
+        raise click.UsageError(str(error))
+
+    directory = Path(output)
+    directory.mkdir(parents=True, exist_ok=True)
+    if binary:
+        path = directory / f"{name}{BINARY_SUFFIX}"
+        write_binary(path, data)
+    else:
+        path = directory / f"{name}.json"
+        path.write_text(json.dumps(data, indent=2) + "\n")
+
+    elapsed = time.perf_counter() - start
+    click.echo(f"{path}: {size[0]}x{size[1]} blocks in {elapsed:.2f} s")
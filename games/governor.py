@@ -0,0 +1,134 @@
+"""Adaptive rendering quality, following the load of the main loop."""
+from typing import NamedTuple, Tuple
+
+
+class Quality(NamedTuple):
+    """Rendering quality level."""
+
+    name: str
+    grid: bool  # Draw the grid overlay.
+    text: bool  # Draw the whole debug text, not only the quality level.
+    render_scale: float  # Relative to the configured render scale.
+    interpolate: bool  # Interpolate positions between ticks.
+    stride: int  # Draw one of every `stride` projectiles.
+
+
+#: Quality levels, from best to cheapest.
+LEVELS: Tuple[Quality, ...] = (
+    Quality("full", True, True, 1.0, True, 1),
+    Quality("no grid", False, True, 1.0, True, 1),
+    Quality("no text", False, False, 1.0, True, 1),
+    Quality("3/4 scale", False, False, 0.75, True, 1),
+    Quality("1/2 scale", False, False, 0.5, False, 1),
+    Quality("thinned", False, False, 0.5, False, 2),
+)
+
+
+class QualityGovernor:
+    """Step the rendering quality down under load, and back up after.
+
+    The load is how close the main loop is to `max_frameskip`: the time of a
+    tick, plus the time of a frame spread over `max_frameskip` ticks, over
+    the tick step. At 1 or more, the game can't keep up even skipping the
+    most frames, and slows down.
+
+    Tick and frame times are smoothed, and the quality only changes after
+    the load stays past a threshold for a while. The thresholds are far
+    apart and stepping up takes longer, so the quality doesn't oscillate.
+    """
+
+    #: Load above which the quality steps down.
+    HIGH_LOAD = 0.8
+
+    #: Load below which the quality steps up.
+    LOW_LOAD = 0.4
+
+    #: Consecutive frames above `HIGH_LOAD` before stepping down. Also the
+    #  minimum number of frames between changes.
+    DOWN_FRAMES = 30
+
+    #: Consecutive frames below `LOW_LOAD` before stepping up.
+    UP_FRAMES = 300
+
+    #: Weight of the latest sample in the smoothed times.
+    SMOOTHING = 0.1
+
+    def __init__(self, tick_step: float, max_frameskip: int):
+        """Create a new Quality Governor, at full quality.
+
+        :param tick_step: Difference in time between ticks (ms).
+        :param max_frameskip: Most ticks processed before a frame.
+        """
+        self._tick_step = tick_step
+        self._max_frameskip = max_frameskip
+
+        #: Index of the current Quality in `LEVELS`.
+        self.level = 0
+
+        #: Smoothed time of a tick (ms).
+        self.tick_ms = 0.0
+
+        #: Smoothed time of a frame (ms).
+        self.frame_ms = 0.0
+
+        self._over = 0  # Consecutive frames above HIGH_LOAD.
+        self._under = 0  # Consecutive frames below LOW_LOAD.
+        self._since_change = 0
+
+    def __str__(self) -> str:
+        """Debug information."""
+        return (
+            f"Quality: {self.level}/{len(LEVELS) - 1} ({self.quality.name})"
+            f" | load={self.load:.2f}"
+        )
+
+    @property
+    def quality(self) -> Quality:
+        """Current Quality."""
+        return LEVELS[self.level]
+
+    @property
+    def load(self) -> float:
+        """Smoothed load of the main loop."""
+        frame_ms = self.frame_ms / self._max_frameskip
+        return (self.tick_ms + frame_ms) / self._tick_step
+
+    def update(self, ticks: int, tick_ms: float, frame_ms: float) -> bool:
+        """Account for a main loop iteration.
+
+        :param ticks: Number of ticks processed before the frame.
+        :param tick_ms: Time spent processing them (ms).
+        :param frame_ms: Time spent rendering the frame (ms).
+        :return: If the quality changed.
+        """
+        if ticks:
+            self.tick_ms += self.SMOOTHING * (tick_ms / ticks - self.tick_ms)
+
+        self.frame_ms += self.SMOOTHING * (frame_ms - self.frame_ms)
+        self._since_change += 1
+
+        load = self.load
+        self._over = self._over + 1 if load > self.HIGH_LOAD else 0
+        self._under = self._under + 1 if load < self.LOW_LOAD else 0
+        if self._since_change < self.DOWN_FRAMES:
+            return False
+
+        # Hitting the frameskip limit slows the game down: react right away.
+        behind = ticks >= self._max_frameskip
+        if behind or self._over >= self.DOWN_FRAMES:
+            return self._step(1)
+
+        if self._under >= self.UP_FRAMES:
+            return self._step(-1)
+
+        return False
+
+    def _step(self, direction: int) -> bool:
+        """Move one level down (1) or up (-1) in quality, if possible."""
+        level = min(max(self.level + direction, 0), len(LEVELS) - 1)
+        if level == self.level:
+            return False
+
+        self.level = level
+        self._over = self._under = self._since_change = 0
+        return True
@@ -1,5 +1,13 @@
 """Experimental Project."""
 
-from .main import MainApp
-
 __all__ = ["MainApp"]
+
+
+def __getattr__(name: str):
+    """Import the Application lazily, so `core` can be used without pygame."""
+    if name == "MainApp":
+        from .main import MainApp
+
+        return MainApp
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
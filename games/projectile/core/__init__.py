@@ -0,0 +1,24 @@
+"""Projectile simulation, without pygame.
+
+Only needs the standard library and NumPy, so headless workers don't pay for
+importing and initializing pygame. Rendering and input live in the parent
+package.
+"""
+from games.projectile.core.heatmap import ImpactHeatmap, Resolution
+from games.projectile.core.parallel import ParallelProjectileManager
+from games.projectile.core.projectile import Projectile, ProjectileManager
+from games.projectile.core.terrain import Block, BlockType, Blueprint
+from games.projectile.core.turret import Turret, TurretInput
+
+__all__ = [
+    "Block",
+    "BlockType",
+    "Blueprint",
+    "ImpactHeatmap",
+    "ParallelProjectileManager",
+    "Projectile",
+    "ProjectileManager",
+    "Resolution",
+    "Turret",
+    "TurretInput",
+]
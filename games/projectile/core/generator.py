@@ -0,0 +1,151 @@
+"""Procedural Terrain Blueprints, generated with NumPy."""
+from enum import Enum
+from typing import Optional, Tuple
+
+import numpy as np
+
+from games.projectile.core.terrain import BlockType, BPData, terrain_rows
+
+
+class Style(str, Enum):
+    """Terrain Style."""
+
+    #: Smoothed noise: open caves between masses of rock.
+    CAVE = "cave"
+    #: Floating horizontal platforms, over a solid floor.
+    PLATFORMS = "platforms"
+    #: Scattered single blocks.
+    BLOCKS = "blocks"
+
+
+#: Default fraction of walls, before smoothing, per Style.
+DENSITY = {Style.CAVE: 0.45, Style.PLATFORMS: 0.5, Style.BLOCKS: 0.15}
+
+#: Smoothing passes of the caves.
+CAVE_PASSES = 4
+
+#: Walls in the 3x3 block around a cave cell (itself included) for the
+#  cell to become a wall.
+CAVE_NEIGHBORS = 5
+
+#: Average rows between platforms.
+PLATFORM_SPACING = 4
+
+#: Average length of the platforms (and of the gaps between them).
+PLATFORM_LENGTH = 6
+
+
+def _cave(
+    rng: np.random.Generator, shape: Tuple[int, int], density: float
+) -> np.ndarray:
+    """Random walls, smoothed by a cellular automaton.
+
+    Every pass, a cell becomes a wall if most of the 3x3 block around it
+    is walls. Outside the Terrain counts as wall.
+    """
+    walls = rng.random(shape, dtype=np.float32) < density
+    height, width = shape
+    for _ in range(CAVE_PASSES):
+        padded = np.pad(walls, 1, constant_values=True).view(np.uint8)
+        neighbors = np.zeros(shape, dtype=np.uint8)
+        for y in range(3):
+            for x in range(3):
+                neighbors += padded[slice(y, y + height), slice(x, x + width)]
+
+        walls = neighbors >= CAVE_NEIGHBORS
+
+    return walls
+
+
+def _platforms(
+    rng: np.random.Generator, shape: Tuple[int, int], density: float
+) -> np.ndarray:
+    """Rows of platforms, split into segments that are walls or gaps.
+
+    Segments start at random columns. Each one is a platform with the
+    `density` probability.
+    """
+    height, width = shape
+    rows = rng.random(height) < 1 / PLATFORM_SPACING
+
+    starts = rng.random(shape, dtype=np.float32) < 1 / PLATFORM_LENGTH
+    segments = np.cumsum(starts, axis=1)
+    segments += np.arange(height)[:, None] * (width + 1)  # Unique per row.
+    solid = rng.random(height * (width + 1)) < density
+    walls = solid[segments] & rows[:, None]
+    walls[-1] = True  # Floor.
+    return walls
+
+
+def _blocks(
+    rng: np.random.Generator, shape: Tuple[int, int], density: float
+) -> np.ndarray:
+    """Walls scattered uniformly."""
+    return rng.random(shape, dtype=np.float32) < density
+
+
+_GENERATORS = {
+    Style.CAVE: _cave,
+    Style.PLATFORMS: _platforms,
+    Style.BLOCKS: _blocks,
+}
+
+
+def place_turret(rng: np.random.Generator, walls: np.ndarray) -> np.ndarray:
+    """Pick the Turret block: a free block on top of a wall or the floor.
+
+    If there's none, any free block. If the Terrain is full, the bottom
+    left block, replacing the wall.
+
+    :return: Row and column of the Turret.
+    """
+    free = ~walls
+    grounded = free.copy()
+    grounded[:-1] &= walls[1:]
+    for candidates in (grounded, free):
+        cells = np.flatnonzero(candidates)
+        if cells.size:
+            cell = cells[rng.integers(cells.size)]
+            return np.array(np.unravel_index(cell, walls.shape))
+
+    return np.array((walls.shape[0] - 1, 0))
+
+
+def generate(
+    name: str,
+    size: Tuple[int, int],
+    style: Style = Style.CAVE,
+    seed: Optional[int] = None,
+    density: Optional[float] = None,
+    block_size: Tuple[int, int] = (50, 50),
+) -> BPData:
+    """Generate a Blueprint with a single Turret.
+
+    The same seed always generates the same Blueprint.
+
+    :param name: Blueprint Name.
+    :param size: Number of blocks (width, height).
+    :param style: Terrain Style.
+    :param seed: Seed of the random generator. Random if `None`.
+    :param density: Fraction of walls. Default depends on the Style.
+    :param block_size: Size (px) of a block (width, height).
+    """
+    style = Style(style)
+    width, height = size
+    if width < 1 or height < 1:
+        raise ValueError("Blueprints need at least a block.")
+
+    rng = np.random.default_rng(seed)
+    density = DENSITY[style] if density is None else density
+    walls = _GENERATORS[style](rng, (height, width), density)
+
+    turret = place_turret(rng, walls)
+    chars = np.where(
+        walls, ord(BlockType.WALL.value), ord(BlockType.SPACE.value)
+    )
+    chars[tuple(turret)] = ord(BlockType.HERO.value)
+    return {
+        "name": name,
+        "block": {"width": block_size[0], "height": block_size[1]},
+        "terrain": terrain_rows(chars.astype(np.uint8)),
+    }
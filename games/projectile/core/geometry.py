@@ -0,0 +1,23 @@
+"""Plain geometry records, usable wherever pygame expects a sequence."""
+from typing import NamedTuple, Tuple
+
+
+class Vec(NamedTuple):
+    """2D vector."""
+
+    x: float
+    y: float
+
+
+class Rect(NamedTuple):
+    """Axis aligned rectangle."""
+
+    x: float
+    y: float
+    width: float
+    height: float
+
+    @property
+    def size(self) -> Tuple[float, float]:
+        """Width and height."""
+        return self.width, self.height
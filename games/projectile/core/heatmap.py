@@ -0,0 +1,84 @@
+"""Histogram of where the Projectiles hit."""
+from enum import Enum
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+
+from games.projectile.core.terrain import Blueprint
+
+
+class Resolution(str, Enum):
+    """Size of the Heatmap cells."""
+
+    BLOCK = "block"
+    PIXEL = "pixel"
+
+
+class ImpactHeatmap:
+    """Count of impacts (reflections and explosions) per cell.
+
+    Small batches are added in place with `np.add.at`, large ones with a
+    single `np.bincount`. Either way, the cost depends on the number of
+    impacts, not on the number of cells.
+    """
+
+    #: Batches bigger than this fraction of the cells use `np.bincount`.
+    BINCOUNT_RATIO = 1 / 64
+
+    def __init__(
+        self, blueprint: Blueprint, resolution: Resolution = Resolution.BLOCK
+    ):
+        """Create an empty Heatmap.
+
+        :param blueprint: Terrain Blueprint covered by the Heatmap.
+        :param resolution: Size of the cells: a block or a pixel.
+        """
+        self.resolution = Resolution(resolution)
+        if self.resolution == Resolution.BLOCK:
+            self.cell_size = tuple(blueprint.block_size)
+            shape = blueprint.height, blueprint.width
+        else:
+            self.cell_size = (1, 1)
+            shape = blueprint.rect.height, blueprint.rect.width
+
+        #: Impacts per cell, shaped (rows, columns).
+        self.counts = np.zeros(shape, dtype=np.int64)
+        self._flat = self.counts.reshape(-1)  # Shares its memory.
+
+        #: Incremented whenever impacts are added, so renderers can tell
+        #  if their copy is outdated.
+        self.version = 0
+
+    def __len__(self) -> int:
+        """Total number of impacts inside the Heatmap."""
+        return int(self._flat.sum())
+
+    def add(self, pos: np.ndarray) -> None:
+        """Count impacts. The ones outside the Heatmap are ignored.
+
+        :param pos: Positions (px) of the impacts, shaped (n, 2).
+        """
+        rows, columns = self.counts.shape
+        x = (pos[:, 0] // self.cell_size[0]).astype(np.int64)
+        y = (pos[:, 1] // self.cell_size[1]).astype(np.int64)
+        inside = (x >= 0) & (x < columns) & (y >= 0) & (y < rows)
+        cells = y[inside] * columns + x[inside]
+        if not cells.size:
+            return
+
+        if cells.size > self._flat.size * self.BINCOUNT_RATIO:
+            self._flat += np.bincount(cells, minlength=self._flat.size)
+        else:
+            np.add.at(self._flat, cells, 1)
+
+        self.version += 1
+
+    def clear(self) -> None:
+        """Forget every impact."""
+        self._flat[:] = 0
+        self.version += 1
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the counts to a `.npy` file, shaped (rows, columns)."""
+        np.save(path, self.counts)
@@ -0,0 +1,94 @@
+"""Numerical integrators for the Projectile movement.
+
+Every integrator solves the same motion, under gravity and linear drag:
+
+    dv/dt = gravity + drag * v
+    dx/dt = v
+
+Time is measured in logic ticks, so velocities are in px/tick and `dt` is a
+fraction of a tick when sub-stepping. Positions and velocities are NumPy
+arrays shaped (n, 2), so many Projectiles are integrated at once. `dt` is
+either a scalar or shaped (n, 1).
+"""
+from abc import ABC, abstractmethod
+from typing import Dict, Sequence, Tuple, Type, Union
+
+import numpy as np
+
+#: Integration result: (positions, velocities).
+Motion = Tuple[np.ndarray, np.ndarray]
+
+#: Time step (ticks), shared or one per row.
+Step = Union[float, np.ndarray]
+
+
+class Integrator(ABC):
+    """Advance a position and velocity by a time step."""
+
+    def __init__(self, gravity: Sequence[float], drag: float):
+        """Create a new Integrator.
+
+        :param gravity: Gravity acceleration (px/tick²).
+        :param drag: Linear drag constant (1/tick). Negative slows down.
+        """
+        self.gravity = np.array(gravity, dtype=float)
+        self.drag = drag
+
+    def acceleration(self, velocity: np.ndarray) -> np.ndarray:
+        """Acceleration at a given velocity."""
+        return self.gravity + self.drag * velocity
+
+    @abstractmethod
+    def step(self, pos: np.ndarray, velocity: np.ndarray, dt: Step) -> Motion:
+        """Advance the motion by `dt` ticks.
+
+        :return: New position and velocity. The arguments aren't modified.
+        """
+
+
+class SemiImplicitEuler(Integrator):
+    """Update the velocity first, then move with the new velocity.
+
+    With a single step per tick, this is the original Projectile movement.
+    """
+
+    def step(self, pos: np.ndarray, velocity: np.ndarray, dt: Step) -> Motion:
+        """Advance the motion by `dt` ticks."""
+        velocity = velocity + self.acceleration(velocity) * dt
+        return pos + velocity * dt, velocity
+
+
+class VelocityVerlet(Integrator):
+    """Second order Verlet, with the velocity dependent drag predicted."""
+
+    def step(self, pos: np.ndarray, velocity: np.ndarray, dt: Step) -> Motion:
+        """Advance the motion by `dt` ticks."""
+        accel = self.acceleration(velocity)
+        pos = pos + velocity * dt + accel * (dt * dt / 2)
+        predicted = self.acceleration(velocity + accel * dt)
+        return pos, velocity + (accel + predicted) * (dt / 2)
+
+
+class ExactDrag(Integrator):
+    """Closed form solution for linear drag. Exact for any `dt`."""
+
+    def step(self, pos: np.ndarray, velocity: np.ndarray, dt: Step) -> Motion:
+        """Advance the motion by `dt` ticks."""
+        if not self.drag:
+            pos = pos + velocity * dt + self.gravity * (dt * dt / 2)
+            return pos, velocity + self.gravity * dt
+
+        # Terminal velocity, approached exponentially.
+        terminal = self.gravity / -self.drag
+        decay = np.exp(self.drag * dt)
+        transient = velocity - terminal
+        pos = pos + terminal * dt + transient * ((decay - 1) / self.drag)
+        return pos, terminal + transient * decay
+
+
+#: Available Integrators, by name.
+INTEGRATORS: Dict[str, Type[Integrator]] = {
+    "euler": SemiImplicitEuler,
+    "exact": ExactDrag,
+    "verlet": VelocityVerlet,
+}
@@ -0,0 +1,282 @@
+"""Multi-core Projectile simulation, over shared memory."""
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+from threading import BrokenBarrierError
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from games.projectile.core.projectile import ProjectileManager
+from games.projectile.core.terrain import Blueprint
+
+
+class SharedArray(NamedTuple):
+    """Location of a NumPy array in shared memory."""
+
+    name: str  # Name of the SharedMemory block.
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+def attach(spec: SharedArray) -> Tuple[SharedMemory, np.ndarray]:
+    """Map a shared array into this process.
+
+    :return: The SharedMemory block and a NumPy view of it.
+    """
+    block = SharedMemory(name=spec.name)
+    array = np.ndarray(spec.shape, dtype=spec.dtype, buffer=block.buf)
+    return block, array
+
+
+def partition(count: int, index: int, workers: int) -> Tuple[int, int]:
+    """Rows `[start, stop)` stepped by a worker.
+
+    :param count: Number of live Projectiles.
+    :param index: Index of the worker.
+    :param workers: Number of workers.
+    """
+    return count * index // workers, count * (index + 1) // workers
+
+
+def step_partitions(
+    blueprint: Blueprint,
+    integrator: str,
+    max_step: Optional[float],
+    specs: Dict[str, SharedArray],
+    barrier: multiprocessing.Barrier,
+    index: int,
+    workers: int,
+) -> None:
+    """Step a partition of the Projectiles every tick, until stopped.
+
+    Runs inside the worker processes. Every tick is bracketed by two waits on
+    the barrier: one until the main process publishes the tick, another
+    until every worker has stepped its partition.
+    """
+    blocks = []
+    arrays = {}
+    for key, spec in specs.items():
+        block, arrays[key] = attach(spec)
+        blocks.append(block)
+
+    blueprint.wall_grid = arrays.pop("wall_grid")
+    control = arrays.pop("control")
+    exploded = arrays.pop("exploded")
+    manager = ProjectileManager(
+        blueprint=blueprint,
+        integrator=integrator,
+        max_step=max_step,
+        particles=False,
+    )
+
+    while True:
+        barrier.wait()
+        tick, count, running = control.tolist()
+        if not running:
+            break
+
+        start, stop = partition(count, index, workers)
+        if stop > start:
+            manager.tick = tick
+            manager._count = stop - start
+            for key, array in arrays.items():
+                setattr(manager, key, array[start:stop])
+
+            exploded[start:stop] = manager._advance()
+
+        barrier.wait()
+
+    # Views must be released before their blocks are closed.
+    del manager, arrays, control, exploded, blueprint.wall_grid
+    for block in blocks:
+        block.close()
+
+
+class ParallelProjectileManager(ProjectileManager):
+    """ProjectileManager stepping the Projectiles in worker processes.
+
+    The Projectile arrays and the wall grid live in shared memory. Every tick
+    the live rows are split evenly between the workers, which integrate and
+    collide their partition with the Terrain. Everything else (creation,
+    removal, collisions between Projectiles and particles) runs in the main
+    process, between the steps.
+
+    The capacity is fixed, and impacts with the Terrain don't spawn sparks:
+    the workers have no particles. For the same reason, a `heatmap` only
+    counts the explosions.
+
+    Every tick costs a round trip through the barrier, so ticks with fewer
+    than `MIN_PER_WORKER` Projectiles per worker are stepped in this
+    process instead, sparks and all. A single worker is never worth it.
+    """
+
+    #: Default maximum number of live Projectiles.
+    CAPACITY = 1 << 16
+
+    #: Arrays with a row per Projectile, shared with the workers. The ids
+    #  are only used by the main process.
+    SHARED_ARRAYS = (
+        "_pos",
+        "_vel",
+        "_explosion_tick",
+        "_rest_ticks",
+        "_asleep",
+    )
+
+    #: Fewer live Projectiles per worker are stepped in this process. A
+    #  Projectile takes about 2 us to step, so this is a few ms of work.
+    MIN_PER_WORKER = 2048
+
+    #: Maximum time (s) waiting for the workers to step a tick.
+    TIMEOUT = 30.0
+
+    def __init__(
+        self,
+        blueprint: Blueprint,
+        workers: int,
+        integrator: str = "euler",
+        max_step: Optional[float] = None,
+        margin: float = 0.0,
+        particles: bool = True,
+        capacity: int = CAPACITY,
+    ):
+        """Start the worker processes, and wait until they're up.
+
+        :param blueprint: Terrain Blueprint.
+        :param workers: Number of worker processes.
+        :param integrator: Name of the Integrator (see `INTEGRATORS`).
+        :param max_step: Maximum distance (px) per sub-step.
+        :param margin: Distance (px) outside the Blueprint before Projectiles
+          are retired.
+        :param particles: If `False`, explosions don't spawn particles.
+        :param capacity: Maximum number of live Projectiles.
+        """
+        super().__init__(
+            blueprint=blueprint,
+            integrator=integrator,
+            max_step=max_step,
+            margin=margin,
+            particles=particles,
+        )
+        self._blocks: List[SharedMemory] = []
+        specs = {}
+        for key in self.SHARED_ARRAYS:
+            array = getattr(self, key)
+            shape = (capacity,) + array.shape[1:]
+            specs[key], shared = self._share(shape, array.dtype)
+            setattr(self, key, shared)
+
+        self._ids = np.zeros(capacity, dtype=np.int64)
+
+        grid = blueprint.wall_grid
+        specs["wall_grid"], shared = self._share(grid.shape, grid.dtype)
+        shared[:] = grid
+
+        # Tick, number of live Projectiles and whether the workers run.
+        specs["control"], self._control = self._share((3,), np.int64)
+        specs["exploded"], self._exploded = self._share((capacity,), bool)
+
+        context = multiprocessing.get_context("spawn")
+        self._barrier = context.Barrier(workers + 1)
+        self._workers = [
+            context.Process(
+                target=step_partitions,
+                args=(
+                    blueprint,
+                    integrator,
+                    max_step,
+                    specs,
+                    self._barrier,
+                    index,
+                    workers,
+                ),
+                daemon=True,
+            )
+            for index in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+        # An empty tick, so the first ones don't wait for them to start up.
+        self._control[:] = (self.tick, 0, 1)
+        self._barrier.wait(self.TIMEOUT)
+        self._barrier.wait(self.TIMEOUT)
+
+    def __enter__(self) -> "ParallelProjectileManager":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _share(
+        self, shape: Tuple[int, ...], dtype: np.dtype
+    ) -> Tuple[SharedArray, np.ndarray]:
+        """Allocate a zeroed array in shared memory.
+
+        :return: Its location, for the workers, and a NumPy view of it.
+        """
+        dtype = np.dtype(dtype)
+        size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        block = SharedMemory(create=True, size=size)
+        self._blocks.append(block)
+
+        spec = SharedArray(name=block.name, shape=shape, dtype=dtype.str)
+        array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        array[...] = 0
+        return spec, array
+
+    def _grow(self) -> None:
+        """Shared arrays can't grow, until closed."""
+        if not self._workers:
+            super()._grow()
+            return
+
+        raise RuntimeError(
+            f"More than {len(self._ids)} Projectiles in parallel mode."
+        )
+
+    def _advance(self) -> np.ndarray:
+        """Fuses, movement and resting of every Projectile, in the workers.
+
+        :return: Mask of the exploded Projectiles.
+        """
+        count = self._count
+        workers = len(self._workers)
+        if workers < 2 or count < self.MIN_PER_WORKER * workers:
+            return super()._advance()
+
+        self._control[:] = (self.tick, count, 1)
+        self._barrier.wait(self.TIMEOUT)  # Publish the tick...
+        self._barrier.wait(self.TIMEOUT)  # ...and wait for every partition.
+        return self._exploded[:count].copy()
+
+    def close(self) -> None:
+        """Stop the workers and free the shared memory.
+
+        The Projectiles are kept in private arrays, stepped in this process.
+        """
+        if not self._workers:
+            return
+
+        self._control[2] = 0
+        try:
+            self._barrier.wait(self.TIMEOUT)
+        except BrokenBarrierError:  # A worker died or hung.
+            for worker in self._workers:
+                worker.terminate()
+
+        for worker in self._workers:
+            worker.join()
+
+        self._workers = []
+
+        # Views must be released before their blocks are closed.
+        for key in self.SHARED_ARRAYS:
+            setattr(self, key, getattr(self, key).copy())
+
+        del self._control, self._exploded
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+
+        self._blocks = []
@@ -0,0 +1,162 @@
+"""Pooled particles for explosions and impacts."""
+from typing import Optional, Tuple
+
+import numpy as np
+
+from games.projectile.settings import SPEED_CONSTANT
+
+Color = Tuple[int, int, int]
+
+
+class ParticleSystem:
+    """Particles stored in preallocated NumPy arrays.
+
+    Live particles are packed at the start of the arrays. They're integrated
+    and rendered in batches, never as individual Python objects. If the pool
+    is full, the particles closest to dying are evicted to make room.
+    """
+
+    #: Maximum number of live particles.
+    MAX_PARTICLES = 4096
+
+    #: Particle colors, referenced by index.
+    PALETTE: Tuple[Color, ...] = (
+        (0xFF, 0xC8, 0x00),  # Explosion (yellow)
+        (0xFF, 0x50, 0x00),  # Explosion (orange)
+        (0xDD, 0xDD, 0xDD),  # Impact sparks
+    )
+
+    #: Earth's gravity (px/tick²), same as the Projectiles.
+    GRAVITY = 9.78 * SPEED_CONSTANT
+
+    #: Velocity lost per tick, to air drag.
+    DRAG = 0.02
+
+    #: Explosion parameters: (particles, max speed (px/tick), max life).
+    EXPLOSION = (48, 3.0, 80)
+
+    #: Impact parameters: (particles, speed spread, max life).
+    IMPACT = (6, 0.6, 30)
+
+    def __init__(self, seed: Optional[int] = None):
+        """Create an empty Particle System.
+
+        :param seed: Seed of the random generator. Random if `None`.
+        """
+        self._rng = np.random.default_rng(seed)
+        self._count = 0
+
+        size = self.MAX_PARTICLES
+        self._pos = np.zeros((size, 2), dtype=np.float32)
+        self._vel = np.zeros((size, 2), dtype=np.float32)
+        self._life = np.zeros(size, dtype=np.int32)  # Remaining ticks.
+        self._color = np.zeros(size, dtype=np.uint8)  # Index in PALETTE.
+
+    def __len__(self) -> int:
+        """Number of live particles."""
+        return self._count
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Positions of the live particles, shaped (n, 2)."""
+        return self._pos[: self._count]
+
+    @property
+    def velocities(self) -> np.ndarray:
+        """Velocities of the live particles (px/tick), shaped (n, 2)."""
+        return self._vel[: self._count]
+
+    @property
+    def colors(self) -> np.ndarray:
+        """Index in `PALETTE` of each live particle."""
+        return self._color[: self._count]
+
+    def _allocate(self, count: int) -> np.ndarray:
+        """Find slots for new particles, evicting if the pool is full.
+
+        :return: Indices of the slots.
+        """
+        live = self._count
+        count = min(count, self.MAX_PARTICLES)
+        free = min(count, self.MAX_PARTICLES - live)
+        slots = np.arange(live, live + free)
+        self._count += free
+
+        evicted = count - free
+        if evicted:
+            dying = np.argpartition(self._life[:live], evicted - 1)
+            slots = np.concatenate((slots, dying[:evicted]))
+
+        return slots
+
+    def _emit(
+        self,
+        pos: np.ndarray,
+        velocity: np.ndarray,
+        max_life: int,
+        colors: Tuple[int, ...],
+    ) -> None:
+        """Spawn particles.
+
+        :param pos: Position of each particle, shaped (n, 2).
+        :param velocity: Velocity of each particle, shaped (n, 2).
+        """
+        slots = self._allocate(len(velocity))
+        count = len(slots)
+        # Only the last particles fit, if there's more than the whole pool.
+        self._pos[slots] = pos[-count:]
+        self._vel[slots] = velocity[-count:]
+        self._life[slots] = self._rng.integers(max_life // 2, max_life, count)
+        self._color[slots] = self._rng.choice(colors, count)
+
+    def explode(self, pos: np.ndarray) -> None:
+        """Spawn explosions: particles in every direction.
+
+        :param pos: Explosion centers, in screen coordinates. Shaped (n, 2).
+        """
+        per_explosion, max_speed, max_life = self.EXPLOSION
+        count = len(pos) * per_explosion
+        if not count:
+            return
+
+        angle = self._rng.uniform(0, 2 * np.pi, count)
+        speed = self._rng.uniform(0, max_speed, count)
+        velocity = np.column_stack((np.cos(angle), np.sin(angle)))
+        velocity *= speed[:, None]
+        centers = np.repeat(pos, per_explosion, axis=0)
+        self._emit(centers, velocity, max_life, colors=(0, 1))
+
+    def impact(self, pos: np.ndarray, velocity: np.ndarray) -> None:
+        """Spawn sparks, following reflected velocities.
+
+        :param pos: Impact points, in screen coordinates. Shaped (n, 2).
+        :param velocity: Velocities after the reflections. Shaped (n, 2).
+        """
+        per_impact, spread, max_life = self.IMPACT
+        count = len(pos) * per_impact
+        if not count:
+            return
+
+        sparks = np.repeat(velocity, per_impact, axis=0)
+        sparks += self._rng.normal(0, spread, (count, 2))
+        origins = np.repeat(pos, per_impact, axis=0)
+        self._emit(origins, sparks, max_life, colors=(2,))
+
+    def process_logic(self) -> None:
+        """Integrate every live particle and remove the dead ones."""
+        count = self._count
+        if not count:
+            return
+
+        vel = self._vel[:count]
+        vel *= 1 - self.DRAG
+        vel[:, 1] += self.GRAVITY
+        self._pos[:count] += vel
+        self._life[:count] -= 1
+
+        alive = self._life[:count] > 0
+        alive_count = int(alive.sum())
+        if alive_count < count:
+            for array in (self._pos, self._vel, self._life, self._color):
+                array[:alive_count] = array[:count][alive]
+            self._count = alive_count
@@ -0,0 +1,534 @@
+"""Projectile simulation, held in NumPy arrays."""
+from itertools import product
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from games.projectile.core.geometry import Vec
+from games.projectile.core.heatmap import ImpactHeatmap
+from games.projectile.core.integrators import INTEGRATORS
+from games.projectile.core.particles import ParticleSystem
+from games.projectile.core.terrain import Blueprint
+from games.projectile.settings import SPEED_CONSTANT, TICK_STEP
+
+#: Pairs of Projectile indices: (first, second).
+Pairs = Tuple[np.ndarray, np.ndarray]
+
+
+class Projectile(NamedTuple):
+    """State of a single Projectile."""
+
+    pos: Vec
+    velocity: Vec
+
+
+def round_half_away(values: np.ndarray) -> np.ndarray:
+    """Round to the nearest integer, like the coordinates of a pygame Rect."""
+    return np.sign(values) * np.floor(np.abs(values) + 0.5)
+
+
+class ProjectileManager:
+    """Simulate every Projectile at once.
+
+    The state of each Projectile is a row of the NumPy arrays. Live rows are
+    packed at the start, so every step is a handful of vectorized operations
+    regardless of the number of Projectiles.
+    """
+
+    #: Earth's gravity (m/s²), adjusted to logic update rate.
+    GRAVITY = (0.0, 9.78 * SPEED_CONSTANT)
+
+    #: Drag Constant
+    # TODO: Calculate for air.
+    DRAG_CONSTANT = -0.4 * SPEED_CONSTANT
+
+    #: Time (ms) until a Projectile explodes.
+    EXPLOSION_TIME = 15000
+
+    #: Coefficient of Restitution
+    COR = 0.35
+
+    #: Projectile Radius (px).
+    RADIUS = 3
+
+    #: Maximum number of sub-steps per tick.
+    MAX_SUBSTEPS = 16
+
+    #: Size (px) of the cells of the collision broad phase. Must be at least
+    #  the diameter of the Projectiles.
+    COLLISION_CELL = 8
+
+    #: Neighbor cells checked by each cell. Only half of them, so each pair
+    #  of cells is only checked once.
+    NEIGHBOR_CELLS = ((1, 0), (-1, 1), (0, 1), (1, 1))
+
+    #: Packs a cell (x, y) of the broad phase as `x * CELL_KEY + y`.
+    CELL_KEY = 1 << 32
+
+    #: Initial number of rows of the arrays. They double when full.
+    INITIAL_CAPACITY = 64
+
+    #: Projectiles slower than this (px/tick) are resting.
+    SLEEP_SPEED = 0.1
+
+    #: Consecutive resting ticks before a Projectile falls asleep. Gravity
+    #  speeds up anything that isn't supported, well before that.
+    SLEEP_TICKS = 30
+
+    #: Sleeping Projectiles this close (px) to an explosion wake up.
+    WAKE_RADIUS = 4 * RADIUS
+
+    def __init__(
+        self,
+        blueprint: Blueprint,
+        integrator: str = "euler",
+        max_step: Optional[float] = None,
+        margin: float = 0.0,
+        particles: bool = True,
+    ):
+        """Manage all projectiles.
+
+        :param blueprint: Terrain Blueprint.
+        :param integrator: Name of the Integrator (see `INTEGRATORS`).
+        :param max_step: Maximum distance (px) per sub-step. If `None`, the
+          movement is integrated once per tick.
+        :param margin: Distance (px) outside the Blueprint before Projectiles
+          are retired.
+        :param particles: If `False`, explosions and impacts don't spawn
+          particles. Useful for headless simulations.
+        """
+        self._blueprint = blueprint
+        self._margin = margin
+        self._integrator = INTEGRATORS[integrator](
+            gravity=self.GRAVITY, drag=self.DRAG_CONSTANT
+        )
+        self._max_step = max_step
+        self._explosion_ticks = round(self.EXPLOSION_TIME / TICK_STEP)
+
+        self.particles = ParticleSystem() if particles else None
+
+        #: If set, counts where the Projectiles reflect and explode.
+        self.heatmap: Optional[ImpactHeatmap] = None
+
+        #: Number of logic ticks processed.
+        self.tick = 0
+
+        self._count = 0
+        self._next_id = 0
+        self._latest_id: Optional[int] = None
+
+        capacity = self.INITIAL_CAPACITY
+        self._pos = np.zeros((capacity, 2))
+        self._vel = np.zeros((capacity, 2))  # px/tick
+        self._explosion_tick = np.zeros(capacity, dtype=np.int64)
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        self._rest_ticks = np.zeros(capacity, dtype=np.int64)
+        self._asleep = np.zeros(capacity, dtype=bool)
+
+    def __len__(self) -> int:
+        """Number of live Projectiles."""
+        return self._count
+
+    @property
+    def _arrays(self) -> Tuple[np.ndarray, ...]:
+        """Every array with a row per Projectile."""
+        return (
+            self._pos,
+            self._vel,
+            self._explosion_tick,
+            self._ids,
+            self._rest_ticks,
+            self._asleep,
+        )
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Positions of the live Projectiles, shaped (n, 2)."""
+        return self._pos[: self._count]
+
+    @property
+    def velocities(self) -> np.ndarray:
+        """Velocities of the live Projectiles (px/tick), shaped (n, 2)."""
+        return self._vel[: self._count]
+
+    @property
+    def sleeping(self) -> int:
+        """Number of sleeping Projectiles."""
+        return int(self._asleep[: self._count].sum())
+
+    @property
+    def latest(self) -> Optional[Projectile]:
+        """Latest Projectile created, while it hasn't exploded."""
+        if self._latest_id is None:
+            return None
+
+        rows = np.flatnonzero(self._ids[: self._count] == self._latest_id)
+        if not rows.size:
+            self._latest_id = None
+            return None
+
+        row = rows[0]
+        return Projectile(
+            pos=Vec(*self._pos[row].tolist()),
+            velocity=Vec(*self._vel[row].tolist()),
+        )
+
+    def _grow(self) -> None:
+        """Double the capacity of the arrays."""
+        (
+            self._pos,
+            self._vel,
+            self._explosion_tick,
+            self._ids,
+            self._rest_ticks,
+            self._asleep,
+        ) = (
+            np.concatenate((array, np.zeros_like(array)))
+            for array in self._arrays
+        )
+
+    def create_projectile(
+        self, velocity: Sequence[float], pos: Sequence[float]
+    ) -> None:
+        """Create a Projectile.
+
+        :param velocity: Initial Velocity.
+        :param pos: Initial Position, in screen coordinates.
+        """
+        if self._count == len(self._ids):
+            self._grow()
+
+        row = self._count
+        self._pos[row] = pos
+        self._vel[row] = velocity
+        self._explosion_tick[row] = self.tick + self._explosion_ticks
+        self._ids[row] = self._latest_id = self._next_id
+        self._rest_ticks[row] = 0
+        self._asleep[row] = False
+        self._next_id += 1
+        self._count += 1
+
+    def process_logic(self) -> None:
+        """Process logic and update status."""
+        self.tick += 1
+        if self._count:
+            exploded = self._advance()
+            self._remove(exploded=exploded, retired=self._outside())
+            self._handle_collisions()
+
+        if self.particles is not None:
+            self.particles.process_logic()
+
+    def _advance(self) -> np.ndarray:
+        """Fuses, movement and resting of every Projectile.
+
+        Each Projectile only depends on its own row and the Terrain, so this
+        can run over partitions of the rows in parallel.
+
+        :return: Mask of the exploded Projectiles.
+        """
+        count = self._count
+        exploded = self.tick > self._explosion_tick[:count]
+        moving = ~exploded & ~self._asleep[:count]
+        self._handle_movement(moving=moving)
+        self._handle_rest(moving=moving)
+        return exploded
+
+    def _substeps(self, velocity: np.ndarray) -> np.ndarray:
+        """Number of sub-steps of the current tick, for each Projectile.
+
+        Fast Projectiles take more sub-steps, so each one moves at most
+        `max_step` px.
+        """
+        if not self._max_step:
+            return np.ones(len(velocity), dtype=np.int64)
+
+        speed = np.hypot(velocity[:, 0], velocity[:, 1])
+        steps = np.ceil(speed / self._max_step).astype(np.int64)
+        return np.clip(steps, 1, self.MAX_SUBSTEPS)
+
+    def _handle_movement(self, moving: np.ndarray) -> None:
+        """Handle the Movement calculations.
+
+        Projectiles that stop aren't removed here: they rest and fall asleep
+        (see `_handle_rest`) until their fuse runs out.
+
+        :param moving: Mask of the Projectiles to be moved.
+        """
+        count = self._count
+        pos = self._pos[:count]
+        vel = self._vel[:count]
+        steps = self._substeps(vel)
+        for step in range(int(steps.max())):
+            rows = np.flatnonzero(moving & (steps > step))
+            if not rows.size:
+                break
+
+            dt = 1 / steps[rows][:, None]
+            future, velocity = self._integrator.step(pos[rows], vel[rows], dt)
+            current = pos[rows]
+            floor = self._reflect_floor(current, future, velocity)
+            terrain = self._reflect_walls(current, future, velocity)
+            collided = floor | terrain
+            # Don't use `future`, since the velocity has changed.
+            future[collided] = (
+                current[collided] + velocity[collided] * dt[collided]
+            )
+            pos[rows] = future
+            vel[rows] = velocity
+
+    def _reflect(
+        self,
+        current: np.ndarray,
+        velocity: np.ndarray,
+        hits: np.ndarray,
+        normals: np.ndarray,
+    ) -> None:
+        """Reflect velocities against normal vectors, in place.
+
+        :param current: Positions of the Projectiles, for the sparks.
+        :param velocity: Velocities of the Projectiles.
+        :param hits: Indices or mask of the Projectiles that collided.
+        :param normals: Normal vector of each collision. Not normalized.
+        """
+        normals = normals / np.hypot(normals[:, 0], normals[:, 1])[:, None]
+        reflected = velocity[hits]
+        reflected -= 2 * (reflected * normals).sum(axis=1)[:, None] * normals
+        reflected *= self.COR
+        velocity[hits] = reflected
+        if self.particles is not None:
+            self.particles.impact(pos=current[hits], velocity=reflected)
+        if self.heatmap is not None:
+            self.heatmap.add(pos=current[hits])
+
+    def _reflect_floor(
+        self, current: np.ndarray, future: np.ndarray, velocity: np.ndarray
+    ) -> np.ndarray:
+        """Reflect the Projectiles that collided with the floor.
+
+        :return: Mask of the Projectiles that collided.
+        """
+        hits = future[:, 1] >= self._blueprint.rect.height
+        if hits.any():
+            normal = np.array([[0.0, 1.0]])
+            self._reflect(current, velocity, hits, normal)
+
+        return hits
+
+    def _find_walls(self, future: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """First wall block overlapped by each Projectile.
+
+        Blocks are checked in the same order as `Blueprint.walls`, so this
+        matches `Rect.collidelist` against the walls.
+
+        :return: Column and row of the blocks. `-1` if there's no collision.
+        """
+        block_x, block_y = self._blueprint.block_size
+        grid = self._blueprint.wall_grid
+        rows, columns = grid.shape
+
+        size = 2 * self.RADIUS
+        left, top = (round_half_away(future) - self.RADIUS).astype(np.int64).T
+        first_x, last_x = left // block_x, (left + size - 1) // block_x
+        first_y, last_y = top // block_y, (top + size - 1) // block_y
+        span_x = (size + block_x - 2) // block_x + 1
+        span_y = (size + block_y - 2) // block_y + 1
+
+        hit_x = np.full(len(future), -1)
+        hit_y = np.full(len(future), -1)
+        for offset_y, offset_x in product(range(span_y), range(span_x)):
+            x = first_x + offset_x
+            y = first_y + offset_y
+            valid = (x <= last_x) & (y <= last_y)
+            valid &= (x >= 0) & (x < columns) & (y >= 0) & (y < rows)
+            wall = np.zeros(len(future), dtype=bool)
+            wall[valid] = grid[y[valid], x[valid]]
+            new = wall & (hit_x < 0)
+            hit_x[new] = x[new]
+            hit_y[new] = y[new]
+
+        return hit_x, hit_y
+
+    def _reflect_walls(
+        self, current: np.ndarray, future: np.ndarray, velocity: np.ndarray
+    ) -> np.ndarray:
+        """Reflect the Projectiles that collided with the Terrain walls.
+
+        The normal is found from the 2 corners of the wall closest to the
+        current position. That's the surface that collided.
+
+        :return: Mask of the Projectiles that collided.
+        """
+        hit_x, hit_y = self._find_walls(future)
+        hits = np.flatnonzero(hit_x >= 0)
+        if hits.size:
+            block_x, block_y = self._blueprint.block_size
+            left, top = hit_x[hits] * block_x, hit_y[hits] * block_y
+            right, bottom = left + block_x, top + block_y
+            corners = np.stack(
+                (
+                    np.column_stack((left, top)),
+                    np.column_stack((right, top)),
+                    np.column_stack((left, bottom)),
+                    np.column_stack((right, bottom)),
+                ),
+                axis=1,
+            )
+            offsets = corners - current[hits, None]
+            distance = np.hypot(offsets[..., 0], offsets[..., 1])
+            nearest = np.argsort(distance, axis=1, kind="stable")
+            index = np.arange(hits.size)
+            edge = (
+                corners[index, nearest[:, 1]] - corners[index, nearest[:, 0]]
+            )
+            normals = np.column_stack((-edge[:, 1], edge[:, 0]))  # Rotate 90°
+            self._reflect(current, velocity, hits, normals)
+
+        return hit_x >= 0
+
+    def _handle_rest(self, moving: np.ndarray) -> None:
+        """Put the Projectiles that stopped moving to sleep.
+
+        Sleeping Projectiles aren't moved until something disturbs them.
+        They still collide and explode when their time is due.
+
+        :param moving: Mask of the Projectiles that were moved.
+        """
+        count = self._count
+        vel = self._vel[:count]
+        rest_ticks = self._rest_ticks[:count]
+        speed = np.hypot(vel[:, 0], vel[:, 1])
+        resting = moving & (speed < self.SLEEP_SPEED)
+        rest_ticks[moving] = np.where(resting, rest_ticks + 1, 0)[moving]
+
+        asleep = resting & (rest_ticks >= self.SLEEP_TICKS)
+        self._asleep[:count] |= asleep
+        vel[asleep] = 0
+
+    def _wake(self, rows: np.ndarray) -> None:
+        """Wake up sleeping Projectiles.
+
+        :param rows: Indices or mask of the Projectiles.
+        """
+        self._asleep[rows] = False
+        self._rest_ticks[rows] = 0
+
+    def _outside(self) -> np.ndarray:
+        """Mask of the Projectiles that left the Blueprint sideways.
+
+        The y coordinate isn't checked. Projectiles above the Blueprint are
+        kept, since gravity brings them back (and the fuse bounds the time
+        they spend up there). None can get below it: the ones that would
+        cross the floor bounce back up (see `_reflect_floor`), and the ones
+        pushed apart by collisions are kept on it.
+        """
+        x = self._pos[: self._count, 0]
+        rect = self._blueprint.rect
+        margin = self._margin
+        return (x < rect.x - margin) | (x > rect.x + rect.width + margin)
+
+    def _remove(self, exploded: np.ndarray, retired: np.ndarray) -> None:
+        """Remove Projectiles, keeping the live ones packed.
+
+        :param exploded: Mask of the exploded Projectiles. Sleeping
+          Projectiles close to them wake up.
+        :param retired: Mask of the Projectiles removed silently.
+        """
+        removed = exploded | retired
+        if not removed.any():
+            return
+
+        count = self._count
+        blasts = self._pos[:count][exploded]
+        if self.particles is not None:
+            self.particles.explode(pos=blasts)
+        if self.heatmap is not None:
+            self.heatmap.add(pos=blasts)
+
+        sleepers = np.flatnonzero(self._asleep[:count] & ~removed)
+        if sleepers.size and blasts.size:
+            offsets = self._pos[sleepers, None] - blasts[None]
+            distance = np.hypot(offsets[..., 0], offsets[..., 1])
+            self._wake(sleepers[distance.min(axis=1) <= self.WAKE_RADIUS])
+
+        alive = ~removed
+        alive_count = int(alive.sum())
+        for array in self._arrays:
+            array[:alive_count] = array[:count][alive]
+        self._count = alive_count
+
+    def _collision_pairs(self, pos: np.ndarray) -> Pairs:
+        """Broad phase: pairs of Projectiles in the same or adjacent cells.
+
+        Projectiles are sorted by cell, so the members of any cell are a
+        contiguous range found with a binary search.
+        """
+        cells = np.floor(pos / self.COLLISION_CELL).astype(np.int64)
+        keys = cells[:, 0] * self.CELL_KEY + cells[:, 1]
+        order = np.argsort(keys, kind="stable")
+        unique, starts, counts = np.unique(
+            keys[order], return_index=True, return_counts=True
+        )
+
+        def members(targets: np.ndarray) -> Pairs:
+            """Pair each Projectile with the members of its target cell."""
+            index = np.searchsorted(unique, targets).clip(max=len(unique) - 1)
+            sizes = np.where(unique[index] == targets, counts[index], 0)
+            first = np.repeat(np.arange(len(targets)), sizes)
+            ranks = np.arange(sizes.sum()) - np.repeat(
+                np.cumsum(sizes) - sizes, sizes
+            )
+            return first, order[np.repeat(starts[index], sizes) + ranks]
+
+        first, second = members(keys)
+        same = first < second
+        pairs = [(first[same], second[same])]
+        for offset_x, offset_y in self.NEIGHBOR_CELLS:
+            pairs.append(members(keys + offset_x * self.CELL_KEY + offset_y))
+
+        return tuple(np.concatenate(column) for column in zip(*pairs))
+
+    def _handle_collisions(self) -> None:
+        """Detect and resolve collisions between Projectiles.
+
+        Both have the same mass, so the impulse is split evenly along the
+        collision normal and scaled by the `COR`. Overlapping Projectiles are
+        also pushed apart, so they don't stay stuck together.
+        """
+        count = self._count
+        if count < 2:
+            return
+
+        pos = self._pos[:count]
+        vel = self._vel[:count]
+        first, second = self._collision_pairs(pos)
+        offset = pos[second] - pos[first]
+        distance_squared = (offset**2).sum(axis=1)
+        min_distance = 2 * self.RADIUS
+        touching = distance_squared < min_distance**2
+        touching &= distance_squared > 0
+        first, second, offset, distance_squared = (
+            array[touching]
+            for array in (first, second, offset, distance_squared)
+        )
+
+        distance = np.sqrt(distance_squared)
+        normal = offset / distance[:, None]
+        approach = ((vel[first] - vel[second]) * normal).sum(axis=1)
+        impulse = (
+            normal * (np.maximum(approach, 0) * (1 + self.COR) / 2)[:, None]
+        )
+        np.subtract.at(vel, first, impulse)
+        np.add.at(vel, second, impulse)
+
+        correction = normal * ((min_distance - distance) / 2)[:, None]
+        np.subtract.at(pos, first, correction)
+        np.add.at(pos, second, correction)
+        # Pushing them apart mustn't sink them into the floor.
+        np.minimum(pos[:, 1], self._blueprint.rect.height, out=pos[:, 1])
+
+        # Only real hits wake sleeping Projectiles, not the resting contacts.
+        hits = approach > self.SLEEP_SPEED
+        self._wake(first[hits])
+        self._wake(second[hits])
+        vel[self._asleep[:count]] = 0
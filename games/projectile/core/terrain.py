@@ -0,0 +1,201 @@
+"""Terrain Blueprints."""
+import json
+import struct
+from enum import Enum
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+
+from games.projectile.core.geometry import Rect, Vec
+
+BLUEPRINT_DIR = Path(__file__).parent.parent / "blueprints"
+
+BPData = Dict[
+    str, Union[int, str, dict, List[str]]
+]  # TODO: Convert to dataclass
+
+#: Extension of the binary Blueprints (see `write_binary`).
+BINARY_SUFFIX = ".bpb"
+
+#: Header of the binary Blueprints: magic, block width and height, terrain
+#  width and height, Turret column and row, and length of the name.
+BINARY_HEADER = struct.Struct("<4sHHIIIIH")
+BINARY_MAGIC = b"BPB1"
+
+
+class BlockType(str, Enum):
+
+    HERO = "H"
+    SPACE = " "
+    WALL = "|"
+
+
+class Block:
+    def __init__(self, x: int, y: int, block_size: Vec, block_type: str):
+        self.x = x
+        self.y = y
+        self.block_size = block_size
+        self.type = BlockType(block_type)
+
+    @cached_property
+    def rect(self) -> Rect:
+        x_y = (self.x * self.block_size.x, self.y * self.block_size.y)
+        return Rect(*x_y, *self.block_size)
+
+
+class Blueprint:
+    """Terrain Blueprint."""
+
+    def __init__(self, name: str):
+        """Represent the Terrain as a blueprint."""
+        self._name = name
+
+        # TODO: Verify if all rows have same width
+
+    @cached_property
+    def _data(self) -> BPData:
+        filepath = BLUEPRINT_DIR / f"{self._name}.json"
+        if not filepath.exists():
+            return read_binary(filepath.with_suffix(BINARY_SUFFIX))
+
+        with filepath.open() as fd:
+            return json.load(fd)
+
+    @property
+    def block_size(self) -> Vec:
+        """Size of a single block unit."""
+        return Vec(
+            x=self._data["block"]["width"],
+            y=self._data["block"]["height"],
+        )
+
+    @property
+    def height(self) -> int:
+        """Terrain Height."""
+        return len(self.terrain)
+
+    @property
+    def name(self) -> str:
+        """Blueprint Name."""
+        return self._data["name"]
+
+    @property
+    def rect(self) -> Rect:
+        """Rectangle with total size of the Blueprint."""
+        return Rect(
+            0,
+            0,
+            self.width * self.block_size.x,
+            self.height * self.block_size.y,
+        )
+
+    @property
+    def terrain(self) -> List[str]:
+        """Terrain Coordinates."""
+        return self._data["terrain"]
+
+    @cached_property
+    def blocks(self) -> Tuple[Block]:
+        blocks = []
+        for j, row in enumerate(self.terrain):
+            for i, _type in enumerate(row):
+                blocks.append(
+                    Block(
+                        x=i, y=j, block_size=self.block_size, block_type=_type
+                    )
+                )
+
+        return tuple(blocks)
+
+    @cached_property
+    def walls(self) -> Tuple[Rect]:
+        return tuple(
+            blk.rect for blk in self.blocks if blk.type == BlockType.WALL
+        )
+
+    @cached_property
+    def wall_grid(self) -> np.ndarray:
+        """Which blocks are walls, shaped (height, width)."""
+        return terrain_array(self.terrain) == ord(BlockType.WALL.value)
+
+    @property
+    def width(self) -> int:
+        """Terrain Width."""
+        return len(self.terrain[0])
+
+
+def terrain_array(terrain: List[str]) -> np.ndarray:
+    """Character codes of the terrain rows, shaped (height, width)."""
+    chars = np.frombuffer("".join(terrain).encode("ascii"), dtype=np.uint8)
+    return chars.reshape(len(terrain), -1)
+
+
+def terrain_rows(chars: np.ndarray) -> List[str]:
+    """Terrain rows of an array of character codes (see `terrain_array`)."""
+    chars = np.ascontiguousarray(chars, dtype=np.uint8)
+    rows = chars.view(f"S{chars.shape[1]}").ravel()
+    return np.char.decode(rows, "ascii").tolist()
+
+
+def write_binary(path: Path, data: BPData) -> None:
+    """Write a Blueprint in the compact binary format.
+
+    A fixed header, the name, then a bit per block (set for walls). The
+    single Turret is stored in the header. Any other block is space.
+    """
+    chars = terrain_array(data["terrain"])
+    hero = np.argwhere(chars == ord(BlockType.HERO.value))
+    if not len(hero):
+        raise ValueError("Turret missing from blueprint.")
+
+    row, column = hero[0].tolist()
+    height, width = chars.shape
+    name = data["name"].encode()
+    header = BINARY_HEADER.pack(
+        BINARY_MAGIC,
+        data["block"]["width"],
+        data["block"]["height"],
+        width,
+        height,
+        column,
+        row,
+        len(name),
+    )
+    walls = np.packbits(chars == ord(BlockType.WALL.value))
+    with path.open("wb") as fd:
+        fd.write(header + name)
+        fd.write(walls.tobytes())
+
+
+def read_binary(path: Path) -> BPData:
+    """Read a Blueprint in the compact binary format (see `write_binary`)."""
+    raw = path.read_bytes()
+    (
+        magic,
+        block_x,
+        block_y,
+        width,
+        height,
+        column,
+        row,
+        length,
+    ) = BINARY_HEADER.unpack_from(raw)
+    if magic != BINARY_MAGIC:
+        raise ValueError(f"{path} isn't a binary Blueprint.")
+
+    start = BINARY_HEADER.size
+    end = start + length
+    name = raw[start:end].decode()
+    bits = np.frombuffer(raw, dtype=np.uint8, offset=end)
+    walls = np.unpackbits(bits, count=width * height).reshape(height, -1)
+
+    chars = np.full((height, width), ord(BlockType.SPACE.value), np.uint8)
+    chars[walls.astype(bool)] = ord(BlockType.WALL.value)
+    chars[row, column] = ord(BlockType.HERO.value)
+    return {
+        "name": name,
+        "block": {"width": block_x, "height": block_y},
+        "terrain": terrain_rows(chars),
+    }
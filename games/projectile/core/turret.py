@@ -0,0 +1,158 @@
+"""Define the Turret entity."""
+import math
+from enum import Enum
+from functools import cached_property
+from typing import NamedTuple
+
+from games.projectile.core.geometry import Vec
+from games.projectile.core.projectile import ProjectileManager
+from games.projectile.core.terrain import Blueprint
+from games.projectile.settings import SPEED_CONSTANT
+
+
+class AimState(str, Enum):
+    """Possible Turret Aim States."""
+
+    IDLE = "idle"
+    ROTATING_CW = "cw"
+    ROTATING_CCW = "ccw"
+
+
+class GunState(str, Enum):
+    """Possible Turret Gun states."""
+
+    IDLE = "idle"
+    FIRING = "firing"
+
+
+class TurretInput(NamedTuple):
+    """Turret controls held during a tick."""
+
+    speed_up: bool = False
+    speed_down: bool = False
+    aim_cw: bool = False
+    aim_ccw: bool = False
+    fire: bool = False
+
+
+class Turret:
+
+    CHAR = "H"
+
+    INITIAL_ANGLE = -45
+    AIM_SENSITIVITY = 0.8
+    MIN_FIRE_INTERVAL = 100.0  # ms
+
+    AIM_RATE = 1 / 3.4
+
+    def __init__(self, blueprint: Blueprint, pm: ProjectileManager):
+        """Turret Entity.
+
+        :param blueprint: Blueprint of the Terrain.
+        :param pm: Manager of the fired Projectiles.
+        """
+        self._bp = blueprint
+        self._pm = pm
+        self._bs = self._bp.block_size  #: Block Size Shortcut
+
+        #: States
+        self._aim_state = AimState.IDLE
+        self._gun_state = GunState.IDLE
+
+        #: Last time the gun was fired.
+        self._last_shot = 0.0
+
+        #: Location in the Grid.
+        self._loc: Vec = self._find_in_blueprint()
+
+        #: Aim Angle (degrees).
+        self.angle = float(self.INITIAL_ANGLE)
+
+        #: Barrel Length (px).
+        self.barrel = math.hypot(*self._bs) * self.AIM_RATE
+
+        #: Initial Projectile Speed (m/s).
+        self.speed = 155.0 * SPEED_CONSTANT
+
+    def _find_in_blueprint(self) -> Vec:
+        """Determine the initial position using the Blueprint."""
+        for i, row in enumerate(self._bp.terrain):
+            try:
+                return Vec(x=row.index(self.CHAR), y=i)
+            except ValueError:
+                continue
+
+        raise RuntimeError("Turret missing from blueprint.")
+
+    def _fire_gun(self, tick: float) -> None:
+        """Fire a Projectile from the Turret.
+
+        :param tick: Current tick in ms.
+        """
+        if tick - self._last_shot < self.MIN_FIRE_INTERVAL:
+            return
+
+        self.shoot(angle=self.angle)
+        self._last_shot = tick
+
+    def direction(self, angle: float) -> Vec:
+        """Barrel vector, pointing at an angle (degrees)."""
+        radians = math.radians(angle)
+        return Vec(
+            x=self.barrel * math.cos(radians),
+            y=self.barrel * math.sin(radians),
+        )
+
+    def shoot(self, angle: float) -> None:
+        """Create a Projectile, ignoring the fire interval.
+
+        :param angle: Aim angle (degrees).
+        """
+        aim = self.direction(angle)
+        pos = self.pos
+        self._pm.create_projectile(
+            velocity=(self.speed * aim.x, self.speed * aim.y),
+            pos=(pos.x + aim.x, pos.y + aim.y),
+        )
+
+    @property
+    def aim(self) -> Vec:
+        """Aim Direction. Its length is the barrel length."""
+        return self.direction(self.angle)
+
+    @property
+    def center(self) -> Vec:
+        """Turret Center, in local coordinates."""
+        return Vec(x=self._bs.x / 2, y=self._bs.y / 2)
+
+    @property
+    def pos(self) -> Vec:
+        """Current Position (center), in screen coordinates."""
+        return Vec(
+            x=self.render_pos.x + self.center.x,
+            y=self.render_pos.y + self.center.y,
+        )
+
+    @cached_property
+    def render_pos(self) -> Vec:
+        """Render Position, in screen coordinates. The Turret doesn't move."""
+        return Vec(x=self._loc.x * self._bs.x, y=self._loc.y * self._bs.y)
+
+    def process_logic(self, tick: float, controls: TurretInput) -> None:
+        """Process Turret logic.
+
+        :param tick: Current tick in ms.
+        :param controls: Controls held during the tick.
+        """
+        if controls.speed_up:
+            self.speed += SPEED_CONSTANT
+        elif controls.speed_down:
+            self.speed -= SPEED_CONSTANT
+
+        if controls.aim_cw:
+            self.angle += self.AIM_SENSITIVITY
+        elif controls.aim_ccw:
+            self.angle -= self.AIM_SENSITIVITY
+
+        if controls.fire:
+            self._fire_gun(tick=tick)
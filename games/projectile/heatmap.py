@@ -0,0 +1,99 @@
+"""Impact Heatmap rendering."""
+from typing import Optional, Tuple
+
+import numpy as np
+import pygame
+from pygame import surfarray
+from pygame.surface import Surface
+
+from games.assets import convert
+from games.projectile.core.heatmap import ImpactHeatmap
+from games.utils import SizeTuple, time_ms
+
+
+class HeatmapRenderer:
+    """Color mapped overlay of an Impact Heatmap.
+
+    Counts are log scaled, so a few hot spots don't wash out the rest, and
+    mapped to a palette of `LEVELS` colors. The overlay is redrawn at most
+    every `REFRESH_MS`, and only if there are new impacts.
+    """
+
+    #: Minimum time between redraws (ms).
+    REFRESH_MS = 500
+
+    #: Number of colors of the palette.
+    LEVELS = 256
+
+    #: Palette stops: (level in [0, 1], RGBA). Interpolated in between.
+    COLOR_STOPS: Tuple[Tuple[float, Tuple[int, int, int, int]], ...] = (
+        (0.0, (0x00, 0x00, 0xFF, 0x00)),
+        (0.25, (0x00, 0x00, 0xFF, 0x60)),
+        (0.6, (0xFF, 0x00, 0x00, 0xA0)),
+        (1.0, (0xFF, 0xFF, 0x00, 0xC0)),
+    )
+
+    def __init__(self, heatmap: ImpactHeatmap, size: SizeTuple):
+        """Render an Impact Heatmap.
+
+        :param heatmap: Impact Heatmap to be rendered.
+        :param size: Size (px) of the overlay, usually the Blueprint size.
+        """
+        self._heatmap = heatmap
+        self._size = size
+
+        self._version = -1  # Heatmap version of the current overlay.
+        self._next_refresh = 0.0
+        self._surface: Optional[Surface] = None
+        self._palette: Optional[np.ndarray] = None  # Mapped colors.
+
+    @property
+    def surface(self) -> Surface:
+        """Overlay, in the display format. Redrawn if due."""
+        now = time_ms()
+        outdated = self._version != self._heatmap.version
+        if self._surface is None or outdated and now >= self._next_refresh:
+            self._next_refresh = now + self.REFRESH_MS
+            self._version = self._heatmap.version
+            self._surface = self._draw()
+
+        return self._surface
+
+    def _colors(self) -> np.ndarray:
+        """RGBA palette, shaped (LEVELS, 4)."""
+        stops, colors = zip(*self.COLOR_STOPS)
+        levels = np.linspace(0, 1, self.LEVELS)
+        channels = np.array(colors).T
+        return (
+            np.column_stack(
+                [np.interp(levels, stops, channel) for channel in channels]
+            )
+            .round()
+            .astype(int)
+        )
+
+    def _draw(self) -> Surface:
+        """Upload the counts to a Surface, one pixel per cell, and scale it."""
+        counts = self._heatmap.counts
+        levels = np.log1p(counts)
+        peak = levels.max()
+        if peak:
+            levels *= (self.LEVELS - 1) / peak
+
+        rows, columns = counts.shape
+        surface = Surface(size=(columns, rows), flags=pygame.SRCALPHA)
+        if self._palette is None:
+            self._palette = np.array(
+                [surface.map_rgb(color) for color in self._colors().tolist()]
+            )
+
+        # Surface arrays are indexed (x, y).
+        surfarray.blit_array(surface, self._palette[levels.astype(int).T])
+        if surface.get_size() != tuple(self._size):
+            # Nearest neighbor, so each block stays a solid color.
+            surface = pygame.transform.scale(surface, self._size)
+
+        # Mostly transparent: RLE skips the empty runs when blitting.
+        surface = convert(surface)
+        surface.set_alpha(0xFF, pygame.RLEACCEL)
+        return surface
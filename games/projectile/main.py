@@ -1,6 +1,9 @@
 """Define the Main Application class."""
+import logging
+import os
 from functools import cached_property
-from typing import Iterable
+from pathlib import Path
+from typing import Iterable, Optional
 
 import pygame
 from pygame.event import Event
@@ -8,7 +11,18 @@ from pygame.font import SysFont, get_default_font
 from pygame.surface import Surface
 
 from games.application import GameApplication
-from games.projectile.projectile import ProjectileManager
+from games.assets import display_surface
+from games.governor import Quality
+from games.projectile.core import (
+    Blueprint,
+    ImpactHeatmap,
+    ParallelProjectileManager,
+    ProjectileManager,
+    Resolution,
+    Turret,
+)
+from games.projectile.heatmap import HeatmapRenderer
+from games.projectile.projectile import ProjectileRenderer
 from games.projectile.settings import (
     BG_COLOR,
     FPS_COLOR,
@@ -16,14 +30,17 @@ from games.projectile.settings import (
     GRID_ALPHA,
     GRID_COLOR,
     GRID_WIDTH,
+    MAX_WINDOW,
     PIXEL_SIZE,
     SPEED_CONSTANT,
     TICK_STEP,
 )
-from games.projectile.terrain import Blueprint, Terrain
-from games.projectile.turret import Turret
+from games.projectile.terrain import Terrain
+from games.projectile.turret import TurretRenderer, keyboard_input
 from games.snake.settings import DEBUG_COLOR
-from games.utils import Layer, multi_text
+from games.utils import Layer, LayerScaler, grid_overlay, multi_text
+
+logger = logging.getLogger(__name__)
 
 
 class MainApp(GameApplication):
@@ -32,15 +49,45 @@ class MainApp(GameApplication):
     CAPTION = "Projectile v0.1"
     TICK_STEP = TICK_STEP
 
-    def __init__(self, bp_name: str, debug: bool, grid: bool, show_fps: bool):
+    def __init__(
+        self,
+        bp_name: str,
+        debug: bool,
+        grid: bool,
+        show_fps: bool,
+        integrator: str = "euler",
+        max_step: Optional[float] = None,
+        workers: int = 0,
+        render_scale: float = 1.0,
+        trace_alloc: bool = False,
+        adaptive_quality: bool = False,
+        heatmap: Optional[Resolution] = None,
+        heatmap_path: Optional[Path] = None,
+    ):
         """Main Application.
 
         :param bp_name: Name of the Blueprint to be loaded.
         :param debug: If `True`, display debug messages.
         :param grid: If `True`, draw a grid on top of the screen.
         :param show_fps: If `True`, render the FPS on screen.
+        :param integrator: Name of the Projectile Integrator.
+        :param max_step: Maximum distance (px) per physics sub-step.
+        :param workers: Number of processes stepping the Projectiles. If 0,
+          they're stepped in this process, which is also the fallback for a
+          single worker or as many workers as CPUs.
+        :param render_scale: Resolution of the frames, relative to the Screen.
+        :param trace_alloc: If `True`, log allocations and GC pauses.
+        :param adaptive_quality: If `True`, lower the rendering quality under
+          load.
+        :param heatmap: Resolution of the impact Heatmap. No Heatmap if
+          `None`. The overlay is toggled with `H`.
+        :param heatmap_path: `.npy` file the Heatmap is saved to, on exit.
         """
-        super().__init__()
+        super().__init__(
+            render_scale=render_scale,
+            trace_alloc=trace_alloc,
+            adaptive_quality=adaptive_quality,
+        )
 
         self._debug = debug
         self._grid = grid
@@ -52,24 +99,86 @@ class MainApp(GameApplication):
         self._fps_font = SysFont(get_default_font(), FPS_SIZE)
 
         self._terrain = Terrain(blueprint=self._blueprint)
+        self._scaler = LayerScaler(scale=render_scale)
+
+        cpus = os.cpu_count() or 1
+        if workers and not 2 <= workers < cpus:
+            logger.warning(
+                "%d Projectile workers on %d CPUs wouldn't be faster,"
+                " stepping the Projectiles in the game process.",
+                workers,
+                cpus,
+            )
+            workers = 0
+
+        if workers:
+            self._proj_mgmt = ParallelProjectileManager(
+                blueprint=self._blueprint,
+                workers=workers,
+                integrator=integrator,
+                max_step=max_step,
+            )
+        else:
+            self._proj_mgmt = ProjectileManager(
+                blueprint=self._blueprint,
+                integrator=integrator,
+                max_step=max_step,
+            )
+
+        self._proj_renderer = ProjectileRenderer(
+            manager=self._proj_mgmt,
+            blueprint=self._blueprint,
+            scale=render_scale,
+        )
+        self._heatmap: Optional[ImpactHeatmap] = None
+        self._heatmap_path = heatmap_path
+        self._show_heatmap = True
+        if heatmap:
+            self._heatmap = ImpactHeatmap(
+                blueprint=self._blueprint, resolution=heatmap
+            )
+            self._proj_mgmt.heatmap = self._heatmap
+            self._heatmap_renderer = HeatmapRenderer(
+                heatmap=self._heatmap, size=self._blueprint.rect.size
+            )
 
-        self._proj_mgmt = ProjectileManager(blueprint=self._blueprint)
         self._hero = Turret(blueprint=self._blueprint, pm=self._proj_mgmt)
+        self._hero_renderer = TurretRenderer(
+            turret=self._hero, block_size=self._blueprint.block_size
+        )
 
     @property
     def _debug_surface(self) -> Iterable[Layer]:
-        """Debug Message Layers."""
+        """Blueprint and Projectile stats, or the governor if text is off."""
+        if not self._quality.text:
+            msgs = [str(self._governor)]
+            return multi_text(
+                font=self._fps_font, color=DEBUG_COLOR, msgs=msgs
+            )
+
+        block_size = self._blueprint.block_size
         msgs = [
             f"FPS: {self._render_clock.get_fps()}",
-            f"Block Size (m): {self._blueprint.block_size * PIXEL_SIZE}",
+            f"Block Size (m): {block_size.x * PIXEL_SIZE}"
+            f" x {block_size.y * PIXEL_SIZE}",
             f"Width: {self._blueprint.width * PIXEL_SIZE} m",
             f"Height: {self._blueprint.height * PIXEL_SIZE} m",
             f"Initial Speed: {self._hero.speed / SPEED_CONSTANT} m/s",
         ]
+        msgs.append(
+            f"Projectiles: {len(self._proj_mgmt)}"
+            f" ({self._proj_mgmt.sleeping} asleep)"
+        )
         latest = self._proj_mgmt.latest
         if latest:
             msgs.append(f"Proj. Velocity: {latest.velocity}")
 
+        if self._heatmap is not None:
+            msgs.append(f"Impacts: {len(self._heatmap)}")
+
+        if self._governor:
+            msgs.append(str(self._governor))
+
         return multi_text(font=self._fps_font, color=DEBUG_COLOR, msgs=msgs)
 
     @property
@@ -78,52 +187,91 @@ class MainApp(GameApplication):
         msg = f"FPS: {self._render_clock.get_fps()}"
         return self._fps_font.render(msg, True, FPS_COLOR)
 
-    @cached_property
+    @display_surface
     def _grid_surface(self) -> Surface:
         """A surface representing the Grid."""
         block_size = self._blueprint.block_size
-        size = self._blueprint.rect.size
-        surface = Surface(size=size, flags=pygame.SRCALPHA)
-        surface.set_alpha(GRID_ALPHA)
-        for x in range(0, size[0], int(block_size.x)):
-            for y in range(0, size[1], int(block_size.y)):
-                pygame.draw.rect(
-                    surface=surface,
-                    color=GRID_COLOR,
-                    rect=pygame.Rect((x, y), self._blueprint.block_size),
-                    width=GRID_WIDTH,
-                )
-
-        return surface
+        return grid_overlay(
+            cell_size=(int(block_size.x), int(block_size.y)),
+            size=self._blueprint.rect.size,
+            color=(*GRID_COLOR, GRID_ALPHA),
+            width=GRID_WIDTH,
+        )
 
     @cached_property
     def _screen(self) -> Surface:
-        """Screen surface based on the Blueprint."""
-        return pygame.display.set_mode(size=self._blueprint.rect.size)
+        """Screen surface based on the Blueprint.
+
+        The window takes the size of the Blueprint, so generated Blueprints
+        may not fit in the display. They're opened anyway, with a warning.
+        """
+        width, height = size = self._blueprint.rect.size
+        if width > MAX_WINDOW[0] or height > MAX_WINDOW[1]:
+            logger.warning(
+                "Blueprint of %dx%d px, over the %dx%d px window limit.",
+                width,
+                height,
+                *MAX_WINDOW,
+            )
+
+        return pygame.display.set_mode(size=size)
+
+    def run(self) -> None:
+        """Run the application, then stop the Projectile workers.
+
+        The Heatmap is saved at the end, if there's a path for it.
+        """
+        try:
+            super().run()
+        finally:
+            if isinstance(self._proj_mgmt, ParallelProjectileManager):
+                self._proj_mgmt.close()
+
+            if self._heatmap is not None and self._heatmap_path:
+                self._heatmap.save(self._heatmap_path)
+
+    def _apply_quality(self, quality: Quality) -> None:
+        """Scale the Layers and thin the Projectiles to the Quality."""
+        super()._apply_quality(quality)
+        self._scaler.scale = self._render_scale
+        self._proj_renderer.scale = self._render_scale
+        self._proj_renderer.stride = quality.stride
 
     def _handle_events(self, event: Event) -> None:
-        """No custom events to handle."""
+        """Toggle the Heatmap overlay."""
+        if event.type == pygame.KEYUP and event.key == pygame.K_h:
+            self._show_heatmap = not self._show_heatmap
 
     def _handle_updates(self, tick: float) -> None:
         """Handle updates to the game state."""
-        self._hero.process_logic(tick=tick)
+        self._hero.process_logic(tick=tick, controls=keyboard_input())
         self._proj_mgmt.process_logic()
 
     def _draw_graphics(self, interp: float) -> None:
-        """Draw contents of the frame to the Screen."""
+        """Draw contents of the frame to the canvas."""
+        hero = self._hero_renderer
         layers = [
-            (self._terrain.surface, (0, 0)),
-            (self._proj_mgmt.build_surface(interp), (0, 0)),
-            (self._hero.surface, self._hero.render_pos),
+            self._scaler.layer(self._terrain.surface, (0, 0)),
+            (self._proj_renderer.build_surface(interp), (0, 0)),
+            self._scaler.layer(hero.surface, hero.render_pos),
         ]
-        if self._grid:
-            layers.append((self._grid_surface, (0, 0)))
+        if self._heatmap is not None and self._show_heatmap:
+            overlay = self._heatmap_renderer.surface
+            layers.append(self._scaler.layer(overlay, (0, 0)))
+
+        if self._grid and self._quality.grid:
+            layers.append(self._scaler.layer(self._grid_surface, (0, 0)))
+
+        self._canvas.fill(color=BG_COLOR)
+        self._canvas.blits(layers)
 
+    def _draw_overlay(self) -> None:
+        """Draw the text, at the Screen resolution."""
+        layers = []
         if self._debug:
             layers.extend(self._debug_surface)
 
         if self._show_fps:
             layers.append((self._fps_surface, (0, 0)))
 
-        self._screen.fill(color=BG_COLOR)
         self._screen.blits(layers)
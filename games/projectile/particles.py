@@ -0,0 +1,43 @@
+"""Particle rendering."""
+import numpy as np
+from pygame import surfarray
+from pygame.surface import Surface
+
+from games.projectile.core.particles import ParticleSystem
+
+#: Particle size (px).
+PARTICLE_SIZE = 2
+
+
+def draw_particles(
+    particles: ParticleSystem,
+    surface: Surface,
+    interp: float,
+    scale: float = 1.0,
+) -> None:
+    """Draw every live particle onto a 32 bit Surface, in a single batch.
+
+    :param interp: Interpolation between the current and the next tick.
+    :param scale: Resolution of the Surface, relative to the Blueprint.
+    """
+    if not len(particles):
+        return
+
+    pos = particles.positions + particles.velocities * interp
+    pos *= scale
+    size = max(round(PARTICLE_SIZE * scale), 1)
+    width, height = surface.get_size()
+    x = pos[:, 0].astype(np.int32)
+    y = pos[:, 1].astype(np.int32)
+    inside = (x >= 0) & (x < width - size)
+    inside &= (y >= 0) & (y < height - size)
+    x, y = x[inside], y[inside]
+
+    palette = np.array([surface.map_rgb(c) for c in particles.PALETTE])
+    colors = palette[particles.colors[inside]]
+
+    pixels = surfarray.pixels2d(surface)
+    for offset_x in range(size):
+        for offset_y in range(size):
+            pixels[x + offset_x, y + offset_y] = colors
+    del pixels  # Unlock the Surface.
@@ -1,5 +1,6 @@
 #: Screen/Window parameters.
 BG_COLOR = (0x00, 0x00, 0x00)
+MAX_WINDOW = (3840, 2160)  # Bigger Blueprints still open, with a warning.
 
 FPS_SIZE = 25
 FPS_COLOR = (0xFF, 0x00, 0x00)
@@ -0,0 +1,195 @@
+"""Stress test of the Projectile game, with live scaling metrics."""
+import csv
+import logging
+import math
+import time
+from collections import defaultdict
+from pathlib import Path
+from random import Random
+from typing import List, NamedTuple, Optional
+
+from games.application import QuitApplication
+from games.projectile.main import MainApp
+
+logger = logging.getLogger(__name__)
+
+
+class TickSample(NamedTuple):
+    """Measurement of a single logic tick."""
+
+    projectiles: int  # Live Projectiles after the tick.
+    tick_ms: float
+
+
+class FrameSample(NamedTuple):
+    """Measurement of a single rendered frame."""
+
+    projectiles: int
+    render_ms: float
+    frameskips: int  # Extra ticks processed before the frame.
+
+
+class ScalingRow(NamedTuple):
+    """Aggregated metrics of a range of live Projectiles."""
+
+    projectiles: int  # Lower bound of the range.
+    ticks: int
+    tick_ms: float  # Mean.
+    max_tick_ms: float
+    frames: int
+    render_ms: float  # Mean.
+    frameskips: int
+
+
+class StressApp(MainApp):
+    """Auto-fire from the Turret until there are N live Projectiles.
+
+    Every tick and frame is measured. A summary is logged every second and
+    the scaling curve (live Projectiles vs. ms/tick) is available at the end.
+    """
+
+    CAPTION = "Projectile v0.1 (stress)"
+
+    #: Interval between the logged summaries (ms).
+    LOG_INTERVAL = 1000
+
+    #: Aim randomization, to each side of the Turret aim (degrees).
+    AIM_SPREAD = 40.0
+
+    #: Number of ranges of live Projectiles in the scaling curve.
+    BUCKETS = 20
+
+    def __init__(
+        self,
+        target: int,
+        fire_rate: float,
+        duration: float,
+        seed: Optional[int] = None,
+        **kwargs,
+    ):
+        """Create a new Stress Test.
+
+        :param target: Maximum number of live Projectiles.
+        :param fire_rate: Projectiles fired per second.
+        :param duration: Duration of the test (s).
+        :param seed: Seed of the aim randomization.
+        :param kwargs: Arguments of `MainApp`.
+        """
+        super().__init__(**kwargs)
+
+        self._target = target
+        self._shots_per_tick = fire_rate * self.TICK_STEP / 1000
+        self._rng = Random(seed)
+
+        self._shots = 0.0  # Shots due, accumulated between ticks.
+        self._ticks = 0
+        self._end = time.perf_counter() + duration
+        self._next_log = time.perf_counter()
+        self._logged_ticks = 0  # Samples already in a logged summary.
+        self._logged_frames = 0
+
+        self.tick_samples: List[TickSample] = []
+        self.frame_samples: List[FrameSample] = []
+
+    def _auto_fire(self) -> None:
+        """Fire the due shots, up to the target of live Projectiles."""
+        self._shots += self._shots_per_tick
+        while self._shots >= 1 and len(self._proj_mgmt) < self._target:
+            spread = self._rng.uniform(-self.AIM_SPREAD, self.AIM_SPREAD)
+            self._hero.shoot(angle=self._hero.angle + spread)
+            self._shots -= 1
+
+        self._shots = min(self._shots, 1.0)  # Don't burst after a pause.
+
+    def _handle_updates(self, tick: float) -> None:
+        """Fire and update the game state, measuring the tick."""
+        start = time.perf_counter()
+        self._auto_fire()
+        super()._handle_updates(tick=tick)
+        tick_ms = (time.perf_counter() - start) * 1000
+
+        self._ticks += 1
+        self.tick_samples.append(TickSample(len(self._proj_mgmt), tick_ms))
+
+    def _render_graphics(self):
+        """Render the frame, measuring it."""
+        start = time.perf_counter()
+        super()._render_graphics()
+        render_ms = (time.perf_counter() - start) * 1000
+        self.frame_samples.append(
+            FrameSample(len(self._proj_mgmt), render_ms, 0)
+        )
+
+    def _main_loop(self):
+        """Main Loop, counting frameskips and logging the metrics."""
+        ticks = self._ticks
+        super()._main_loop()
+        frameskips = max(self._ticks - ticks - 1, 0)
+        self.frame_samples[-1] = self.frame_samples[-1]._replace(
+            frameskips=frameskips
+        )
+
+        now = time.perf_counter()
+        if now >= self._next_log:
+            self._next_log = now + self.LOG_INTERVAL / 1000
+            self._log_metrics()
+
+        if now >= self._end:
+            raise QuitApplication
+
+    def _log_metrics(self) -> None:
+        """Log the metrics since the last summary."""
+        first_tick, first_frame = self._logged_ticks, self._logged_frames
+        ticks = self.tick_samples[first_tick:]
+        frames = self.frame_samples[first_frame:]
+        self._logged_ticks = len(self.tick_samples)
+        self._logged_frames = len(self.frame_samples)
+        if not ticks or not frames:
+            return
+
+        logger.info(
+            "live=%d tick=%.2f ms render=%.2f ms fps=%d frameskips=%d",
+            len(self._proj_mgmt),
+            sum(t.tick_ms for t in ticks) / len(ticks),
+            sum(f.render_ms for f in frames) / len(frames),
+            len(frames),
+            sum(f.frameskips for f in frames),
+        )
+
+    def scaling_curve(self) -> List[ScalingRow]:
+        """Aggregate the samples by ranges of live Projectiles."""
+        width = max(math.ceil(self._target / self.BUCKETS), 1)
+        ticks = defaultdict(list)
+        for sample in self.tick_samples:
+            ticks[sample.projectiles // width * width].append(sample.tick_ms)
+
+        frames = defaultdict(list)
+        for sample in self.frame_samples:
+            frames[sample.projectiles // width * width].append(sample)
+
+        rows = []
+        for bucket, tick_ms in sorted(ticks.items()):
+            bucket_frames = frames.get(bucket, [])
+            render_ms = [f.render_ms for f in bucket_frames]
+            rows.append(
+                ScalingRow(
+                    projectiles=bucket,
+                    ticks=len(tick_ms),
+                    tick_ms=round(sum(tick_ms) / len(tick_ms), 3),
+                    max_tick_ms=round(max(tick_ms), 3),
+                    frames=len(bucket_frames),
+                    render_ms=round(
+                        sum(render_ms) / max(len(render_ms), 1), 3
+                    ),
+                    frameskips=sum(f.frameskips for f in bucket_frames),
+                )
+            )
+
+        return rows
+
+    def write_csv(self, path: Path) -> None:
+        """Write the scaling curve to a CSV file."""
+        with path.open("w", newline="") as fd:
+            writer = csv.writer(fd)
+            writer.writerow(ScalingRow._fields)
+            writer.writerows(self.scaling_curve())
@@ -1,5 +1,5 @@
-"""Define the Turret entity."""
-from enum import Enum
+"""Turret rendering and keyboard input."""
+import math
 
 import pygame
 from pygame import draw
@@ -7,156 +7,103 @@ from pygame.color import Color
 from pygame.math import Vector2
 from pygame.surface import Surface
 
-from games.projectile.projectile import ProjectileManager
-from games.projectile.settings import SPEED_CONSTANT
-from games.projectile.terrain import Blueprint
-from games.utils import time_ms
+from games.assets import SurfaceCache, color_keyed
+from games.projectile.core.geometry import Vec
+from games.projectile.core.turret import Turret, TurretInput
 
 
-class AimState(str, Enum):
-    """Possible Turret Aim States."""
+def keyboard_input() -> TurretInput:
+    """Turret controls, from the keys currently pressed."""
+    pressed = pygame.key.get_pressed()
+    return TurretInput(
+        speed_up=pressed[pygame.K_UP],
+        speed_down=pressed[pygame.K_DOWN],
+        aim_cw=pressed[pygame.K_RIGHT],
+        aim_ccw=pressed[pygame.K_LEFT],
+        fire=pressed[pygame.K_SPACE],
+    )
 
-    IDLE = "idle"
-    ROTATING_CW = "cw"
-    ROTATING_CCW = "ccw"
 
-
-class GunState(str, Enum):
-    """Possible Turret Gun states."""
-
-    IDLE = "idle"
-    FIRING = "firing"
-
-
-class Turret:
+class TurretRenderer:
+    """Turret Renderer."""
 
     COLOR = Color(0x00, 0xFF, 0xFF)
-    CHAR = "H"
-
-    INITIAL_ANGLE = -45
-    AIM_SENSITIVITY = 0.8
-    MIN_FIRE_INTERVAL = 100.0  # ms
 
     CIRCLE_RATE = 1 / 6
-    AIM_RATE = 1 / 3.4
     AIM_WIDTH_RATE = 1 / 10.0
 
-    def __init__(self, blueprint: Blueprint, pm: ProjectileManager):
-        """Turret Entity.
-
-        :param initial_pos: Initial Position of the Turret.
-        :param blueprint: Blueprint of the Terrain.
-        """
-        self._bp = blueprint
-        self._pm = pm
-        self._bs = self._bp.block_size  #: Block Size Shortcut
-
-        #: States
-        self._aim_state = AimState.IDLE
-        self._gun_state = GunState.IDLE
-
-        #: Last time the gun was fired.
-        self._last_shot = 0.0
+    def __init__(self, turret: Turret, block_size: Vec):
+        """Render a Turret.
 
-        #: Location in the Grid.
-        self._loc: Vector2 = self._find_in_blueprint()
-
-        #: Aim Direction
-        self.aim = Vector2()
-        self.aim.from_polar(
-            (self._bs.length() * self.AIM_RATE, self.INITIAL_ANGLE)
-        )
-
-        #: Initial Projectile Speed (m/s).
-        self.speed = 155.0 * SPEED_CONSTANT
-
-    def _find_in_blueprint(self) -> Vector2:
-        """Determine the initial position using the Blueprint."""
-        for i, row in enumerate(self._bp.terrain):
-            try:
-                return Vector2(x=row.index(self.CHAR), y=i)
-            except ValueError:
-                continue
-
-        raise RuntimeError("Turret missing from blueprint.")
-
-    def _fire_gun(self, tick: float) -> None:
-        """Fire a Projectile from the Turret.
-
-        :param tick: Current tick in ms.
+        :param turret: Turret to be rendered.
+        :param block_size: Size of a Blueprint block.
         """
-        if tick - self._last_shot < self.MIN_FIRE_INTERVAL:
-            return
+        self._turret = turret
+        self._bs = block_size  #: Block Size Shortcut
 
-        proj_pos = self.pos + self.aim
-        velocity = self.speed * self.aim
-        self._pm.create_projectile(velocity=velocity, pos=proj_pos)
-        self._last_shot = time_ms()
+        #: Rendered sprites, by quantized aim angle (see `aim_step`).
+        self._sprites = SurfaceCache()
 
     @property
     def aim_width(self) -> int:
-        return int(self._bs.length() * self.AIM_WIDTH_RATE)
-
-    @property
-    def center(self) -> Vector2:
-        """Turret Center, in local coordinates."""
-        return Vector2(x=self._bs.x / 2, y=self._bs.y / 2)
-
-    @property
-    def pos(self) -> Vector2:
-        """Current Position (center), in screen coordinates."""
-        return self.render_pos + self.center
+        return int(math.hypot(*self._bs) * self.AIM_WIDTH_RATE)
 
     @property
     def radius(self) -> float:
         """Turret Radius."""
-        return self._bs.length() * self.CIRCLE_RATE
+        return math.hypot(*self._bs) * self.CIRCLE_RATE
 
     @property
-    def render_pos(self) -> Vector2:
+    def render_pos(self) -> Vec:
         """Render Position, in screen coordinates."""
-        return Vector2(x=self._loc.x * self._bs.x, y=self._loc.y * self._bs.y)
+        return self._turret.render_pos
 
     @property
-    def surface(self) -> Surface:
-        """Turret Surface.
+    def aim_step(self) -> int:
+        """Aim angle, in `AIM_SENSITIVITY` steps from `INITIAL_ANGLE`.
 
-        It's drawn every time it's referenced.
+        The Turret only turns in those steps, so every angle it can aim at
+        gets its own sprite.
+        """
+        turret = self._turret
+        steps = round(360 / turret.AIM_SENSITIVITY)
+        turns = (turret.angle - turret.INITIAL_ANGLE) / turret.AIM_SENSITIVITY
+        return round(turns) % steps
 
-        :return: Turret Surface.
+    def _draw_sprite(self, step: int) -> Surface:
+        """Draw the Turret aiming at a quantized angle.
+
+        :param step: Quantized aim angle (see `aim_step`).
         """
-        surface = Surface(size=self._bs, flags=pygame.SRCALPHA)
+        turret = self._turret
+        center = Vector2(turret.center)
+        aim = turret.direction(
+            turret.INITIAL_ANGLE + step * turret.AIM_SENSITIVITY
+        )
+
+        surface = color_keyed(size=self._bs)
         draw.circle(  # Base
             surface=surface,
             color=self.COLOR,
-            center=self.center,
+            center=center,
             radius=self.radius,
         )
         draw.line(  # Aim
             surface=surface,
             color=self.COLOR,
-            start_pos=self.center,
-            end_pos=self.center + self.aim,
+            start_pos=center,
+            end_pos=center + aim,
             width=self.aim_width,
         )
         return surface
 
-    def process_logic(self, tick: float) -> None:
-        """Process Turret logic.
-
-        :param tick: Current tick in ms.
-        """
-        pressed = pygame.key.get_pressed()
-
-        if pressed[pygame.K_UP]:
-            self.speed += SPEED_CONSTANT
-        elif pressed[pygame.K_DOWN]:
-            self.speed -= SPEED_CONSTANT
+    @property
+    def surface(self) -> Surface:
+        """Turret Surface.
 
-        if pressed[pygame.K_RIGHT]:
-            self.aim = self.aim.rotate(self.AIM_SENSITIVITY)
-        elif pressed[pygame.K_LEFT]:
-            self.aim = self.aim.rotate(-self.AIM_SENSITIVITY)
+        Sprites are drawn the first time each aim angle is referenced and
+        then served from the cache, in the display pixel format.
 
-        if pressed[pygame.K_SPACE]:
-            self._fire_gun(tick=tick)
+        :return: Turret Surface.
+        """
+        return self._sprites.get(self.aim_step, self._draw_sprite)
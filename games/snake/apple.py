@@ -2,7 +2,10 @@
 
 from pygame.color import Color
 
-from games.snake.elements import GridElement, RandomPoint
+from games.snake.elements import GridElement
+from games.snake.enums import Cell
+
+Grid = "snake.grid.Grid"
 
 
 class Apple(GridElement):
@@ -11,9 +14,29 @@ class Apple(GridElement):
     #: Apple Color
     COLOR = Color(0xFF, 0x00, 0x00)
 
+    def __init__(self, grid: Grid):
+        """Create a new Apple in a random free cell.
+
+        :param grid: Grid object.
+        """
+        cell = grid.random_free_cell()
+        if cell is None:
+            raise ValueError("There's no free cell for the Apple.")
+
+        super().__init__(grid=grid, cell=cell)
+        grid.cells[self.cell] = Cell.APPLE
+
     def __str__(self) -> str:
         return f"Apple: p={self.p}"
 
     def respawn(self) -> None:
-        """Shuffle the Apple position."""
-        self.p = RandomPoint(grid=self._grid)
+        """Shuffle the Apple position.
+
+        The Apple is kept in place if there are no free cells left.
+        """
+        cell = self._grid.random_free_cell()
+        if cell is None:
+            return
+
+        self.cell = cell
+        self._grid.cells[cell] = Cell.APPLE
@@ -0,0 +1,230 @@
+"""Batch of Snake games, stepped in lockstep with NumPy."""
+from typing import Optional, Tuple
+
+import numpy as np
+
+from games.snake.enums import Cell
+from games.snake.env import SnakeEnv
+from games.snake.grid import Grid
+from games.snake.level import Level
+from games.snake.settings import GRID_SIZE
+from games.snake.snake import Snake
+from games.utils import SizeTuple
+
+#: Batch step result: (observations, rewards, dones).
+BatchResult = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+#: Direction of a game that didn't start moving yet.
+STOPPED = -1
+
+
+class SnakeBatch:
+    """N Snake games, held in NumPy arrays.
+
+    Follows the same rules as `Snake.update_state` and shares the action
+    codes of `SnakeEnv`. Every game has its own board, body (ring buffer of
+    packed cells), direction and apple. Finished games are reset
+    automatically, so the observations of those games are already from the
+    next game.
+    """
+
+    #: Movement States, indexed by the action code.
+    ACTIONS = SnakeEnv.ACTIONS
+
+    #: Reward for eating an apple.
+    APPLE_REWARD = SnakeEnv.APPLE_REWARD
+
+    #: Reward for dying.
+    DEATH_REWARD = SnakeEnv.DEATH_REWARD
+
+    #: Random tries to find a free cell, before scanning the whole board.
+    FREE_CELL_TRIES = Grid.FREE_CELL_TRIES
+
+    def __init__(
+        self,
+        n: int,
+        size: SizeTuple = GRID_SIZE,
+        seed: Optional[int] = None,
+        level: Optional[Level] = None,
+    ):
+        """Create a new Batch, with every game already reset.
+
+        :param n: Number of games.
+        :param size: Number of cells in each coordinate of the Grid. Ignored
+          if there's a Level.
+        :param seed: Seed of the batch random generator. Random if `None`.
+        :param level: Level with the walls of every game. No walls if `None`.
+        """
+        if level:
+            size = level.size
+
+        self.n = n
+        self.columns, self.rows = size
+        self.cells = self.columns * self.rows
+
+        self.rng = np.random.default_rng(seed)
+
+        #: Content of each cell (see `Cell`), shaped (n, rows, columns).
+        self.boards = np.zeros((n, self.rows, self.columns), dtype=np.uint8)
+        #: Board of a new game: the walls, if any.
+        self._blank = np.zeros((self.rows, self.columns), dtype=np.uint8)
+        if level:
+            self._blank[level.walls] = Cell.WALL
+
+        #: Ring buffers of packed cells, one row per game.
+        self.bodies = np.zeros((n, self.cells), dtype=np.int32)
+        #: Buffer index of the head of each game.
+        self.head_index = np.zeros(n, dtype=np.int64)
+        #: Number of segments of each game.
+        self.lengths = np.zeros(n, dtype=np.int64)
+        #: Index of the current movement State in `ACTIONS`.
+        self.directions = np.full(n, STOPPED, dtype=np.int64)
+        #: Packed cell of the apple of each game.
+        self.apples = np.zeros(n, dtype=np.int64)
+
+        offsets = [Snake.MOVEMENT[state] for state in self.ACTIONS]
+        self._offset_x, self._offset_y = np.array(offsets).T
+        self._opposite = np.array(
+            [
+                self.ACTIONS.index(Snake.FORBIDDEN_MOVEMENT[state])
+                for state in self.ACTIONS
+            ]
+        )
+        self._games = np.arange(n)
+
+        self.reset(np.ones(n, dtype=bool))
+
+    @property
+    def _flat_boards(self) -> np.ndarray:
+        """View of the boards, shaped (n, cells)."""
+        return self.boards.reshape(self.n, self.cells)
+
+    @property
+    def heads(self) -> np.ndarray:
+        """Packed cell of the head of each game."""
+        return self.bodies[self._games, self.head_index]
+
+    def _random_free_cells(self, games: np.ndarray) -> np.ndarray:
+        """Pick a random empty cell for each game.
+
+        :param games: Indices of the games.
+        :return: Packed cells. Games with a full board get `-1`.
+        """
+        boards = self._flat_boards
+        cells = np.full(games.size, -1, dtype=np.int64)
+        pending = np.arange(games.size)
+        for _ in range(self.FREE_CELL_TRIES):
+            if not pending.size:
+                return cells
+
+            tries = self.rng.integers(self.cells, size=pending.size)
+            free = boards[games[pending], tries] == Cell.EMPTY
+            cells[pending[free]] = tries[free]
+            pending = pending[~free]
+
+        # Mostly full boards. Pick from all the free cells instead.
+        for i in pending:
+            free = np.flatnonzero(boards[games[i]] == Cell.EMPTY)
+            if free.size:
+                cells[i] = free[self.rng.integers(free.size)]
+
+        return cells
+
+    def reset(self, mask: np.ndarray) -> None:
+        """Start new games.
+
+        :param mask: Boolean mask of the games to be reset.
+        """
+        games = np.flatnonzero(mask)
+        if not games.size:
+            return
+
+        self.boards[games] = self._blank
+        heads = self._random_free_cells(games)
+        self._flat_boards[games, heads] = Cell.HEAD
+        self.bodies[games, 0] = heads
+        self.head_index[games] = 0
+        self.lengths[games] = 1
+        self.directions[games] = STOPPED
+
+        apples = self._random_free_cells(games)
+        self._flat_boards[games, apples] = Cell.APPLE
+        self.apples[games] = apples
+
+    def load(self, index: int, grid: Grid) -> None:
+        """Copy the state of a Grid into one of the games.
+
+        :param index: Index of the game to be overwritten.
+        :param grid: Grid with the same size as the batch.
+        """
+        assert (grid.columns, grid.rows) == (self.columns, self.rows)
+        assert np.array_equal(grid.board == Cell.WALL, self._blank > 0)
+
+        body = list(grid.snake.body)
+        self.boards[index] = grid.board
+        self.bodies[index, : len(body)] = body
+        self.head_index[index] = 0
+        self.lengths[index] = len(body)
+        self.apples[index] = grid.apple.cell
+
+        state = grid.snake.state
+        moving = state in self.ACTIONS
+        self.directions[index] = (
+            self.ACTIONS.index(state) if moving else STOPPED
+        )
+
+    def step(self, actions: np.ndarray) -> BatchResult:
+        """Advance every game a single tick.
+
+        :param actions: Action code of each game (see `SnakeEnv.step`).
+        :return: Observations (the boards, updated in place), rewards and
+          which games are done. Done games are already reset.
+        """
+        boards = self._flat_boards
+        games = self._games
+
+        # Reversing on itself is ignored.
+        actions = np.asarray(actions)
+        reverse = actions == self._opposite[self.directions]
+        reverse &= self.directions != STOPPED
+        self.directions = np.where(reverse, self.directions, actions)
+
+        heads = self.heads
+        y, x = np.divmod(heads, self.columns)
+        x += self._offset_x[self.directions]
+        y += self._offset_y[self.directions]
+
+        # The tail is still in place, so moving into it is a collision.
+        outside = (x < 0) | (x >= self.columns) | (y < 0) | (y >= self.rows)
+        cells = np.where(outside, 0, y * self.columns + x)
+        dead = outside | (boards[games, cells] >= Cell.BODY)
+
+        alive = np.flatnonzero(~dead)
+        cells = cells[alive]
+        boards[alive, heads[alive]] = Cell.BODY
+        boards[alive, cells] = Cell.HEAD
+        self.head_index[alive] = (self.head_index[alive] - 1) % self.cells
+        self.bodies[alive, self.head_index[alive]] = cells
+        self.lengths[alive] += 1
+
+        ate = cells == self.apples[alive]
+        grown = alive[ate]
+
+        # Remove tail after each movement to preserve its length.
+        moved = alive[~ate]
+        tails = (self.head_index[moved] + self.lengths[moved] - 1) % self.cells
+        boards[moved, self.bodies[moved, tails]] = Cell.EMPTY
+        self.lengths[moved] -= 1
+
+        # Apples are kept in place if there are no free cells left.
+        apples = self._random_free_cells(grown)
+        respawn = apples >= 0
+        boards[grown[respawn], apples[respawn]] = Cell.APPLE
+        self.apples[grown[respawn]] = apples[respawn]
+
+        rewards = np.zeros(self.n, dtype=np.float32)
+        rewards[grown] = self.APPLE_REWARD
+        rewards[dead] = self.DEATH_REWARD
+
+        self.reset(dead)
+        return self.boards, rewards, dead
@@ -0,0 +1,69 @@
+"""Define the viewport over the Grid."""
+from typing import Tuple
+
+from games.snake.settings import GRID_STEP, UI_HEIGHT, VIEW_SIZE
+from games.utils import Position, SizeTuple
+
+Grid = "snake.grid.Grid"
+
+
+class Camera:
+    """Viewport that follows the Snake's head.
+
+    Only the cells inside the viewport are rendered, so the rendering cost
+    depends on the size of the window, not on the size of the Grid.
+    """
+
+    def __init__(self, grid: Grid, size: SizeTuple = VIEW_SIZE):
+        """Create a new Camera.
+
+        :param grid: Grid object.
+        :param size: Maximum number of visible cells in each coordinate.
+        """
+        self._grid = grid
+
+        self.columns = min(size[0], grid.columns)
+        self.rows = min(size[1], grid.rows)
+        self.resolution = self.columns * GRID_STEP, self.rows * GRID_STEP
+
+    @property
+    def origin(self) -> Tuple[int, int]:
+        """Grid coordinates of the top-left visible cell.
+
+        The head is kept centered, unless the viewport hits a Grid border.
+        Without a main Snake, the center of the Grid is.
+        """
+        snake = self._grid.snake
+        if snake is None:
+            x, y = self._grid.columns // 2, self._grid.rows // 2
+        else:
+            x, y = self._grid.unpack(snake.body.head)
+        x = min(
+            max(x - self.columns // 2, 0), self._grid.columns - self.columns
+        )
+        y = min(max(y - self.rows // 2, 0), self._grid.rows - self.rows)
+        return x, y
+
+    @property
+    def window(self) -> Tuple[slice, slice]:
+        """Visible (rows, columns) slices of `Grid.board`."""
+        x, y = self.origin
+        return slice(y, y + self.rows), slice(x, x + self.columns)
+
+    def is_visible(self, cell: int) -> bool:
+        """Check if a packed cell is inside the viewport."""
+        x, y = self._grid.unpack(cell)
+        origin_x, origin_y = self.origin
+        return (
+            origin_x <= x < origin_x + self.columns
+            and origin_y <= y < origin_y + self.rows
+        )
+
+    def render_pos(self, cell: int) -> Position:
+        """Render position of a packed cell, in screen coordinates."""
+        x, y = self._grid.unpack(cell)
+        origin_x, origin_y = self.origin
+        return Position(
+            (x - origin_x) * GRID_STEP,
+            (y - origin_y) * GRID_STEP + UI_HEIGHT,
+        )
@@ -0,0 +1,250 @@
+"""Controllers that drive the Snake instead of the keyboard."""
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from heapq import heappop, heappush
+from typing import Callable, Deque, Dict, List, Optional, Type
+
+from games.snake.enums import Cell, State
+
+Grid = "snake.grid.Grid"
+
+
+class Controller(ABC):
+    """Decide the Snake movement, once per tick."""
+
+    @abstractmethod
+    def decide(self, grid: Grid) -> Optional[State]:
+        """Movement State for the next tick.
+
+        :param grid: Grid with the Snake to be controlled.
+        :return: A movement State, or `None` to keep the current one.
+        """
+
+
+def find_path(
+    grid: Grid,
+    start: int,
+    goal: int,
+    blocked: Callable[[int], bool],
+    forbidden: Optional[int] = None,
+) -> Optional[List[int]]:
+    """Find the shortest path between two cells with A*.
+
+    :param grid: Grid to be searched.
+    :param start: Packed start cell.
+    :param goal: Packed goal cell. It's accepted even if blocked.
+    :param blocked: Return `True` for cells that can't be crossed.
+    :param forbidden: Cell that can't be the first step.
+    :return: Packed cells from the first step to the goal, or `None` if the
+      goal can't be reached.
+    """
+    columns = grid.columns
+    goal_y, goal_x = divmod(goal, columns)
+
+    def distance(cell: int) -> int:
+        y, x = divmod(cell, columns)  # Inlined `Grid.unpack`: hot path.
+        return abs(x - goal_x) + abs(y - goal_y)
+
+    # Steps of the best path found to each cell, and the cell before it.
+    costs = [len(grid.cells)] * len(grid.cells)  # Longer than any path.
+    costs[start] = 0
+    parents = costs.copy()
+
+    # Ties are broken by the deepest node, so open areas are crossed in a
+    # straight line instead of being flooded.
+    frontier = [(distance(start), 0, start)]
+    while frontier:
+        _, depth, cell = heappop(frontier)
+        if -depth > costs[cell]:
+            continue  # Outdated entry, superseded by a cheaper path.
+        if cell == goal:
+            path = []
+            while cell != start:
+                path.append(cell)
+                cell = parents[cell]
+            return path[::-1]
+
+        cost = 1 - depth
+        for neighbor in grid.neighbors(cell):
+            if cost >= costs[neighbor]:
+                continue
+            if neighbor != goal and blocked(neighbor):
+                continue
+            if cell == start and neighbor == forbidden:
+                continue
+
+            costs[neighbor] = cost
+            parents[neighbor] = cell
+            heappush(frontier, (cost + distance(neighbor), -cost, neighbor))
+
+    return None
+
+
+class RandomController(Controller):
+    """Pick a random movement every tick. Useful as a baseline."""
+
+    def decide(self, grid: Grid) -> Optional[State]:
+        """Movement State for the next tick.
+
+        :param grid: Grid with the Snake to be controlled.
+        """
+        return grid.rng.choice(tuple(grid.snake.MOVEMENT))
+
+
+class GreedyController(Controller):
+    """Move to the free neighbor closest to the Apple, without planning."""
+
+    def decide(self, grid: Grid) -> Optional[State]:
+        """Movement State for the next tick.
+
+        :param grid: Grid with the Snake to be controlled.
+        """
+        head = grid.snake.body.head
+        apple_x, apple_y = grid.unpack(grid.apple.cell)
+
+        def distance(cell: int) -> int:
+            x, y = grid.unpack(cell)
+            return abs(x - apple_x) + abs(y - apple_y)
+
+        free = [
+            cell
+            for cell in grid.neighbors(head)
+            if grid.cells[cell] < Cell.BODY
+        ]
+        if not free:
+            return None
+
+        return grid.direction(head, min(free, key=distance))
+
+
+class Autopilot(Controller):
+    """Follow the shortest safe path to the Apple.
+
+    A path is only taken if the tail can still be reached after eating the
+    Apple, so the Snake doesn't trap itself. Otherwise it follows its own
+    tail. Paths are reused between ticks and only replanned when the Apple
+    moves or the path gets blocked.
+    """
+
+    #: Number of decisions kept for the latency metrics.
+    LATENCY_WINDOW = 100
+
+    def __init__(self):
+        """Create a new Autopilot."""
+        self._path: Deque[int] = deque()
+        self._target: Optional[int] = None  # Apple cell of the current path.
+        self._expected: Optional[int] = None  # Head cell after last decision.
+
+        #: Decision latency (ms) of the latest ticks.
+        self.latency: Deque[float] = deque(maxlen=self.LATENCY_WINDOW)
+
+        #: Number of times a path to the Apple was planned.
+        self.replans = 0
+
+    def __str__(self) -> str:
+        """Debug information."""
+        latest = self.latency[-1] if self.latency else 0.0
+        worst = max(self.latency, default=0.0)
+        return (
+            f"Autopilot: {latest:.3f} ms | max={worst:.3f} ms"
+            f" | replans={self.replans}"
+        )
+
+    def _is_valid(self, grid: Grid) -> bool:
+        """Check if the previous path can be reused."""
+        return (
+            self._path
+            and self._target == grid.apple.cell
+            and self._expected == grid.snake.body.head
+            and grid.cells[self._path[0]] < Cell.BODY
+        )
+
+    def _is_safe(self, grid: Grid, path: List[int]) -> bool:
+        """Check if the tail is reachable after following the path."""
+        body = list(grid.snake.body)
+        # The Apple makes it grow, so a segment is kept besides the path.
+        kept = max(len(body) + 1 - len(path), 0)
+        future = path[::-1][: len(body) + 1] + body[:kept]
+        if len(future) < 3:
+            return True
+
+        occupied = set(future)
+        current = set(body)
+
+        def blocked(cell: int) -> bool:
+            if cell in occupied:
+                return True
+            return cell not in current and grid.cells[cell] >= Cell.BODY
+
+        # The tail still blocks the cell it's in, so it can't be adjacent.
+        tail_path = find_path(grid, future[0], future[-1], blocked)
+        return tail_path is not None and len(tail_path) > 1
+
+    def _plan(self, grid: Grid, forbidden: Optional[int]) -> None:
+        """Plan a new path to the Apple."""
+        self.replans += 1
+        self._path.clear()
+        self._target = grid.apple.cell
+
+        def blocked(cell: int) -> bool:
+            return grid.cells[cell] >= Cell.BODY
+
+        head = grid.snake.body.head
+        path = find_path(grid, head, grid.apple.cell, blocked, forbidden)
+        if path and self._is_safe(grid, path):
+            self._path.extend(path)
+
+    def _follow_tail(self, grid: Grid, forbidden: Optional[int]) -> int:
+        """Next cell towards the tail, or any free neighbor."""
+        body = grid.snake.body
+
+        def blocked(cell: int) -> bool:
+            return grid.cells[cell] >= Cell.BODY
+
+        # The tail still blocks the cell it's in, so it can't be adjacent.
+        path = find_path(grid, body.head, body.tail, blocked, forbidden)
+        if path and len(path) > 1:
+            return path[0]
+
+        free = [
+            cell
+            for cell in grid.neighbors(body.head)
+            if cell != forbidden and grid.cells[cell] < Cell.BODY
+        ]
+        return free[0] if free else body.head
+
+    def decide(self, grid: Grid) -> Optional[State]:
+        """Movement State for the next tick.
+
+        :param grid: Grid with the Snake to be controlled.
+        """
+        start = time.perf_counter()
+
+        snake = grid.snake
+        head = snake.body.head
+        forbidden = None
+        if len(snake) == 1 and snake.state in snake.MOVEMENT:
+            # A single segment can't reverse either.
+            reverse = snake.FORBIDDEN_MOVEMENT[snake.state]
+            forbidden = grid.step(head, reverse)
+
+        if not self._is_valid(grid):
+            self._plan(grid, forbidden)
+
+        if self._path:
+            cell = self._path.popleft()
+        else:
+            cell = self._follow_tail(grid, forbidden)
+
+        self._expected = cell
+        self.latency.append((time.perf_counter() - start) * 1000)
+        return grid.direction(head, cell)
+
+
+#: Available Controllers, by name.
+CONTROLLERS: Dict[str, Type[Controller]] = {
+    "autopilot": Autopilot,
+    "greedy": GreedyController,
+    "random": RandomController,
+}
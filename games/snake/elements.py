@@ -1,15 +1,13 @@
 """Define base game elements that interact with the grid."""
 from dataclasses import dataclass
-from functools import cached_property
-from random import randint
-from typing import Optional
+from typing import Tuple
 
 from pygame.color import Color
 from pygame.rect import Rect
 from pygame.surface import Surface
 
-from games.snake.enums import State
-from games.snake.settings import GRID_SIZE, GRID_STEP, UI_HEIGHT
+from games.assets import SurfaceCache
+from games.snake.settings import GRID_STEP
 from games.utils import PINK, Layer, Position
 
 Grid = "snake.grid.Grid"
@@ -25,32 +23,27 @@ class Point:
     def __str__(self) -> str:
         return f"({self.x}, {self.y})"
 
-    def clone(self, state: State) -> "Point":
-        """Return a new point in a location based on the State."""
-        new_x, new_y = self.x, self.y
-        if state == State.UP:
-            new_y -= 1
-        elif state == State.DOWN:
-            new_y += 1
-        elif state == State.RIGHT:
-            new_x += 1
-        elif state == State.LEFT:
-            new_x -= 1
 
-        return Point(x=new_x, y=new_y)
+#: Cell sprites, by color.
+_CELL_SPRITES = SurfaceCache()
 
-    def collision(self: "Point", other: "Point") -> bool:
-        """Detect collision between two points."""
-        return self.x == other.x and self.y == other.y
 
+def _draw_cell(color: Tuple[int, ...]) -> Surface:
+    """Fill a whole grid cell with a solid color."""
+    surface = Surface(size=(GRID_STEP, GRID_STEP))
+    surface.fill(color=color)
+    return surface
 
-class RandomPoint(Point):
-    """A random point in the grid."""
 
-    def __init__(self, grid: Grid):
-        x = randint(0, GRID_SIZE[0] - 1)
-        y = randint(0, GRID_SIZE[1] - 1)
-        super().__init__(x=x, y=y)
+def cell_sprite(color: Tuple[int, ...]) -> Surface:
+    """Sprite filling a whole grid cell with a solid color.
+
+    Sprites are cached, so every element of the same color shares a single
+    Surface, in the display format.
+
+    :param color: RGBA tuple (`pygame.Color` isn't hashable).
+    """
+    return _CELL_SPRITES.get(color, _draw_cell)
 
 
 class GridElement:
@@ -59,45 +52,40 @@ class GridElement:
     # Use pink to highlight default case.
     COLOR: Color = PINK
 
-    def __init__(
-        self,
-        grid: Grid,
-        point: Optional[Point] = None,
-    ):
+    def __init__(self, grid: Grid, cell: int):
         """Create new Grid Element.
 
         :param grid: Grid object.
-        :param point: Element coordinates in the grid.
+        :param cell: Packed element coordinates in the grid.
         """
         self._grid = grid
-        self.p: Point = point or RandomPoint(grid=grid)
+        self.cell = cell
+
+    @property
+    def p(self) -> Point:
+        """Element coordinates in the grid."""
+        return Point(*self._grid.unpack(self.cell))
 
     @property
     def layer(self) -> Layer:
         """Rendering Layer."""
         return Layer(self.surface, self.render_pos)
 
-    @cached_property
+    @property
     def surface(self) -> Surface:
         """Element Surface.
 
-        Needs to fit into a grid cell.
+        Fits into a grid cell and is shared by all elements of the same color.
         """
-        surface = Surface(size=(GRID_STEP, GRID_STEP))
-        surface.fill(color=self.COLOR)
-        return surface
+        return cell_sprite(tuple(self.COLOR))
 
     @property
     def rect(self) -> Rect:
         """Rectangle representing the element."""
-        return Rect(
-            self.p.x * GRID_STEP,
-            self.p.y * GRID_STEP,
-            GRID_STEP,
-            GRID_STEP,
-        )
+        x, y = self._grid.unpack(self.cell)
+        return Rect(x * GRID_STEP, y * GRID_STEP, GRID_STEP, GRID_STEP)
 
     @property
     def render_pos(self) -> Position:
         """Render position in screen coordinates."""
-        return Position(self.p.x * GRID_STEP, self.p.y * GRID_STEP + UI_HEIGHT)
+        return self._grid.camera.render_pos(self.cell)
@@ -1,5 +1,5 @@
 """Game Enums."""
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class State(str, Enum):
@@ -12,3 +12,16 @@ class State(str, Enum):
     DOWN = "D"
     RIGHT = "R"
     LEFT = "L"
+
+
+class Cell(IntEnum):
+    """Content of a Grid cell.
+
+    Codes are ordered so that anything from `BODY` upwards blocks the snake.
+    """
+
+    EMPTY = 0
+    APPLE = 1
+    BODY = 2
+    HEAD = 3
+    WALL = 4
@@ -0,0 +1,84 @@
+"""Headless Snake environment, to be driven by bots."""
+from typing import Optional, Tuple
+
+import numpy as np
+
+from games.snake.enums import State
+from games.snake.grid import Grid, GridState
+from games.snake.level import Level
+from games.snake.settings import GRID_SIZE
+from games.utils import SizeTuple
+
+#: Environment step result: (observation, reward, done).
+StepResult = Tuple[np.ndarray, float, bool]
+
+
+class SnakeEnv:
+    """Snake game with a step/reset API.
+
+    The game runs as fast as it's stepped: there's no window and no real time
+    tick. The observation is the Grid board, a (rows, columns) `uint8` array
+    of `Cell` codes. It's updated in place, so copy it to keep a history.
+    """
+
+    #: Movement States, indexed by the action code.
+    ACTIONS: Tuple[State, ...] = (
+        State.UP,
+        State.RIGHT,
+        State.DOWN,
+        State.LEFT,
+    )
+
+    #: Reward for eating an apple.
+    APPLE_REWARD = 1.0
+
+    #: Reward for dying.
+    DEATH_REWARD = -1.0
+
+    def __init__(
+        self, size: SizeTuple = GRID_SIZE, level: Optional[Level] = None
+    ):
+        """Create a new Environment.
+
+        :param size: Number of cells in each coordinate of the Grid.
+        :param level: Level with the walls of the Grid. No walls if `None`.
+        """
+        self.size = size
+        self.level = level
+        self.grid = Grid(size=size, level=level)
+
+    def reset(self, seed: Optional[int] = None) -> np.ndarray:
+        """Start a new game.
+
+        :param seed: Seed for the apple and snake positions.
+        :return: Initial observation.
+        """
+        self.grid = Grid(size=self.size, seed=seed, level=self.level)
+        return self.grid.board
+
+    def step(self, action: int) -> StepResult:
+        """Advance the game a single tick.
+
+        :param action: Index of the movement State in `ACTIONS`. Reversing
+          on itself is ignored, same as the keyboard input.
+        :return: Observation, reward and if the game is done.
+        """
+        snake = self.grid.snake
+        length = len(snake.body)
+
+        snake.turn(state=self.ACTIONS[action])
+        snake.update_state()
+
+        if snake.state == State.DEAD:
+            return self.grid.board, self.DEATH_REWARD, True
+
+        reward = self.APPLE_REWARD if len(snake.body) > length else 0.0
+        return self.grid.board, reward, False
+
+    def snapshot(self) -> GridState:
+        """Copy the game state, to be restored later (e.g. for lookahead)."""
+        return self.grid.snapshot()
+
+    def restore(self, snapshot: GridState) -> None:
+        """Restore a state taken with `snapshot` from the same game."""
+        self.grid.restore(snapshot)
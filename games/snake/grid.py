@@ -1,14 +1,17 @@
 """Define the grid and its generic elements."""
-from functools import cached_property
-from itertools import chain
-from typing import Iterable
+from itertools import chain, repeat
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
-import pygame
+import numpy as np
 from pygame.event import Event
-from pygame.rect import Rect
 from pygame.surface import Surface
 
+from games.assets import convert, display_format, display_surface
 from games.snake.apple import Apple
+from games.snake.camera import Camera
+from games.snake.elements import cell_sprite
+from games.snake.enums import Cell, State
+from games.snake.level import Level
 from games.snake.settings import (
     GRID_ALPHA,
     GRID_COLOR,
@@ -16,48 +19,200 @@ from games.snake.settings import (
     GRID_SIZE,
     GRID_STEP,
     UI_HEIGHT,
+    WALL_COLOR,
 )
-from games.snake.snake import Snake
-from games.utils import Layer, Position
+from games.snake.snake import Snake, SnakeState
+from games.utils import (
+    Layer,
+    Position,
+    SizeTuple,
+    SplitMixRandom,
+    grid_overlay,
+)
+
+
+class GridState(NamedTuple):
+    """Snapshot of a Grid and everything in it."""
+
+    snakes: Tuple[SnakeState, ...]
+    apple: int
+    rng: int  # See `SplitMixRandom.getstate`.
 
 
 class Grid:
     """Game Grid."""
 
-    def __init__(self):
-        """Create a new Grid."""
-        self.resolution = GRID_SIZE[0] * GRID_STEP, GRID_SIZE[1] * GRID_STEP
-        self.width, self.height = self.resolution
-        self.rect = Rect((0, UI_HEIGHT), self.resolution)
+    #: Random tries to find a free cell, before scanning the whole grid.
+    FREE_CELL_TRIES = 16
 
-        self.apple = Apple(grid=self)
-        self.snake = Snake(grid=self)
+    def __init__(
+        self,
+        size: SizeTuple = GRID_SIZE,
+        seed: Optional[int] = None,
+        snakes: int = 1,
+        level: Optional[Level] = None,
+    ):
+        """Create a new Grid.
+
+        :param size: Number of cells in each coordinate. Ignored if there's a
+          Level: the Grid takes its size.
+        :param seed: Seed of the Grid's random generator. Random if `None`.
+        :param snakes: Number of Snakes created with the Grid. `ValueError`
+          if they don't fit.
+        :param level: Level with the walls of the Grid. No walls if `None`.
+        """
+        if level:
+            size = level.size
+
+        self.columns, self.rows = size
 
-        self._surface = Surface(size=self.resolution)
+        #: Random generator for everything placed in the Grid.
+        self.rng = SplitMixRandom(seed)
+
+        #: Content of each cell (see `Cell`), packed row by row.
+        self.cells = bytearray(self.columns * self.rows)
+        #: NumPy view of `cells`, shaped (rows, columns). Shares its memory.
+        self.board = np.frombuffer(self.cells, dtype=np.uint8).reshape(
+            self.rows, self.columns
+        )
+
+        #: Level of the Grid, if any.
+        self.level = level
+
+        #: Which cells are walls, shaped (rows, columns). Shared with the
+        #  Level. They're also in `cells` as `Cell.WALL`, so colliding with
+        #  them and finding free cells cost the same as without walls.
+        self.walls = np.zeros((self.rows, self.columns), dtype=bool)
+        if level:
+            self.walls = level.walls
+            self.board[self.walls] = Cell.WALL
+
+        self._static_key = None  # Display format and camera origin.
+        self._static_surface: Optional[Surface] = None
+
+        #: Every Snake in the Grid. They block each other.
+        self.snakes: List[Snake] = [Snake(grid=self) for _ in range(snakes)]
+        #: Main Snake, followed by the camera. `None` without Snakes.
+        self.snake: Optional[Snake] = self.snakes[0] if snakes else None
+
+        self.apple = Apple(grid=self)
+        self.camera = Camera(grid=self)
 
-    @cached_property
+    @property
     def base_surface(self) -> Surface:
-        """Base surface representing the Grid."""
-        surface = Surface(size=self.resolution, flags=pygame.SRCALPHA)
-        surface.set_alpha(GRID_ALPHA)
-        for x in range(0, self.width, GRID_STEP):
-            for y in range(0, self.height, GRID_STEP):
-                pygame.draw.rect(
-                    surface=surface,
-                    color=GRID_COLOR,
-                    rect=pygame.Rect((x, y), (GRID_STEP, GRID_STEP)),
-                    width=GRID_LINE,
-                )
+        """Base surface representing the visible part of the Grid.
+
+        Grid lines, with the visible walls drawn in. Walls only change with
+        the camera position, so they're drawn when the camera moves instead
+        of every frame.
+        """
+        if self.level is None:
+            return self._lines_surface
+
+        key = display_format(), self.camera.origin
+        if key != self._static_key:
+            self._static_key = key
+            self._static_surface = convert(self._draw_walls())
 
+        return self._static_surface
+
+    @display_surface
+    def _lines_surface(self) -> Surface:
+        """Grid lines over the visible part of the Grid.
+
+        The camera moves a whole cell at a time, so the same overlay fits any
+        viewport position.
+        """
+        return grid_overlay(
+            cell_size=(GRID_STEP, GRID_STEP),
+            size=self.camera.resolution,
+            color=(*GRID_COLOR[:3], GRID_ALPHA),
+            width=GRID_LINE,
+        )
+
+    def _draw_walls(self) -> Surface:
+        """Grid lines, with the walls visible from the camera."""
+        surface = self._lines_surface.copy()
+        rows, columns = np.nonzero(self.walls[self.camera.window])
+        positions = zip(
+            (columns * GRID_STEP).tolist(), (rows * GRID_STEP).tolist()
+        )
+        surface.blits(zip(repeat(cell_sprite(WALL_COLOR)), positions))
         return surface
 
+    def pack(self, x: int, y: int) -> int:
+        """Pack grid coordinates into a single cell index."""
+        return y * self.columns + x
+
+    def unpack(self, cell: int) -> Tuple[int, int]:
+        """Unpack a cell index into grid coordinates (x, y)."""
+        y, x = divmod(cell, self.columns)
+        return x, y
+
+    def neighbors(self, cell: int) -> Iterator[int]:
+        """Packed cells next to a cell, inside the Grid."""
+        x = cell % self.columns
+        if cell >= self.columns:
+            yield cell - self.columns
+        if x < self.columns - 1:
+            yield cell + 1
+        if cell < len(self.cells) - self.columns:
+            yield cell + self.columns
+        if x > 0:
+            yield cell - 1
+
+    def step(self, cell: int, state: State) -> Optional[int]:
+        """Packed cell next to a cell, following a movement State.
+
+        :return: `None` if the step leaves the Grid.
+        """
+        x, y = self.unpack(cell)
+        offset_x, offset_y = Snake.MOVEMENT[state]
+        x, y = x + offset_x, y + offset_y
+        if 0 <= x < self.columns and 0 <= y < self.rows:
+            return self.pack(x, y)
+
+        return None
+
+    def direction(self, cell: int, neighbor: int) -> Optional[State]:
+        """Movement State that goes from a cell to one of its neighbors."""
+        for state in Snake.MOVEMENT:
+            if self.step(cell, state) == neighbor:
+                return state
+
+        return None
+
+    def random_cell(self) -> int:
+        """Packed index of a random cell."""
+        return self.rng.randrange(len(self.cells))
+
+    def random_free_cell(self) -> Optional[int]:
+        """Packed index of a random empty cell.
+
+        :return: `None` if the grid is full.
+        """
+        for _ in range(self.FREE_CELL_TRIES):
+            cell = self.random_cell()
+            if self.cells[cell] == Cell.EMPTY:
+                return cell
+
+        # Mostly full grid. Pick from all the free cells instead.
+        free = np.flatnonzero(self.board == Cell.EMPTY)
+        if not free.size:
+            return None
+
+        return int(free[self.rng.randrange(free.size)])
+
     @property
     def layers(self) -> Iterable[Layer]:
         """Surface layers to be blitted to the screen."""
-        layers = (
-            Layer(self.base_surface, Position(0, UI_HEIGHT)),
-            self.apple.layer,
-        )
+        layers = [Layer(self.base_surface, Position(0, UI_HEIGHT))]
+        if self.camera.is_visible(self.apple.cell):
+            layers.append(self.apple.layer)
+
+        if self.snake is None:
+            return layers
+
         return chain(layers, self.snake.layers)
 
     def handle_event(self, event: Event) -> None:
@@ -65,8 +220,62 @@ class Grid:
 
         :param event: Pygame Event to be handled.
         """
-        self.snake.handle_event(event=event)
+        if self.snake is not None:
+            self.snake.handle_event(event=event)
+
+    def add_snake(self) -> Optional[Snake]:
+        """Create a new Snake in a random free cell.
+
+        :return: `None` if the Grid is full.
+        """
+        if Cell.EMPTY not in self.cells:
+            return None
+
+        snake = Snake(grid=self)
+        self.snakes.append(snake)
+        return snake
+
+    def remove_snake(self, snake: Snake) -> None:
+        """Remove a Snake and clear its cells."""
+        snake.clear()
+        self.snakes.remove(snake)
+
+    def snapshot(self) -> GridState:
+        """Copy the game state, including the random generator.
+
+        Takes O(length) of the snakes, regardless of the Grid size.
+        """
+        return GridState(
+            snakes=tuple(snake.snapshot() for snake in self.snakes),
+            apple=self.apple.cell,
+            rng=self.rng.getstate(),
+        )
+
+    def restore(self, snapshot: GridState) -> None:
+        """Restore a previous game state.
+
+        The Grid must have the same Snakes it had when the snapshot was taken.
+        """
+        assert len(snapshot.snakes) == len(self.snakes), "Snakes changed."
+
+        for snake in self.snakes:
+            snake.clear()
+        if self.cells[self.apple.cell] == Cell.APPLE:
+            self.cells[self.apple.cell] = Cell.EMPTY
+
+        for snake, snake_state in zip(self.snakes, snapshot.snakes):
+            snake.restore(snake_state)
+
+        self.apple.cell = snapshot.apple
+        if self.cells[snapshot.apple] == Cell.EMPTY:
+            self.cells[snapshot.apple] = Cell.APPLE
+
+        self.rng.setstate(snapshot.rng)
 
     def update_state(self) -> None:
-        """Update Grid State."""
-        self.snake.update_state()
+        """Update Grid State.
+
+        Snakes are updated in order, so they see each other's new positions.
+        """
+        for snake in self.snakes:
+            snake.update_state()
@@ -0,0 +1,76 @@
+"""Snake Levels: walls laid out in the Grid."""
+import json
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+
+from games.utils import SizeTuple
+
+LEVEL_DIR = Path(__file__).parent / "levels"
+
+LevelData = Dict[str, Union[str, List[str]]]
+
+#: Characters of the terrain rows.
+SPACE = " "
+WALL = "|"
+
+
+def level_names() -> Tuple[str, ...]:
+    """Names of the Levels in `LEVEL_DIR`."""
+    return tuple(sorted(path.stem for path in LEVEL_DIR.glob("*.json")))
+
+
+class Level:
+    """Snake Level, loaded from `LEVEL_DIR`.
+
+    Same format as the Projectile Blueprints: the terrain is a list of rows,
+    one character per cell, with `|` for walls.
+    """
+
+    def __init__(self, name: str):
+        """Represent a Level file.
+
+        :param name: File name, without extension.
+        """
+        self._name = name
+
+    @cached_property
+    def _data(self) -> LevelData:
+        filepath = LEVEL_DIR / f"{self._name}.json"
+        with filepath.open() as fd:
+            return json.load(fd)
+
+    @property
+    def name(self) -> str:
+        """Level Name."""
+        return self._data["name"]
+
+    @property
+    def terrain(self) -> List[str]:
+        """Terrain rows."""
+        return self._data["terrain"]
+
+    @property
+    def size(self) -> SizeTuple:
+        """Number of cells in each coordinate."""
+        return self.walls.shape[1], self.walls.shape[0]
+
+    @cached_property
+    def walls(self) -> np.ndarray:
+        """Which cells are walls, shaped (rows, columns).
+
+        Compiled once, so the Grid can copy it in a single operation.
+        """
+        terrain = self.terrain
+        columns = len(terrain[0])
+        if any(len(row) != columns for row in terrain):
+            raise ValueError(f"Rows of {self._name} have different widths.")
+
+        chars = np.frombuffer("".join(terrain).encode("ascii"), np.uint8)
+        unknown = set(np.unique(chars).tobytes().decode()) - {SPACE, WALL}
+        if unknown:
+            raise ValueError(f"Unknown cells in {self._name}: {unknown}")
+
+        return (chars == ord(WALL)).reshape(len(terrain), columns)
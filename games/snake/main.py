@@ -1,7 +1,7 @@
 """Main Application."""
 from functools import cached_property
 from itertools import chain
-from typing import Iterable
+from typing import Iterable, Optional
 
 import pygame
 from pygame.event import Event
@@ -9,17 +9,21 @@ from pygame.font import SysFont, get_default_font
 from pygame.surface import Surface
 
 from games.application import GameApplication
+from games.governor import Quality
+from games.snake.controllers import Autopilot
 from games.snake.grid import Grid
+from games.snake.level import Level
 from games.snake.settings import (
     BG_COLOR,
     CAPTION,
     DEBUG_COLOR,
     DEBUG_SIZE,
-    SCREEN_SIZE,
+    GRID_SIZE,
     TICK_STEP,
+    UI_HEIGHT,
 )
 from games.snake.ui import UserInterface
-from games.utils import Layer, multi_text
+from games.utils import Layer, LayerScaler, SizeTuple, multi_text
 
 
 class MainApp(GameApplication):
@@ -28,42 +32,86 @@ class MainApp(GameApplication):
     CAPTION = CAPTION
     TICK_STEP = TICK_STEP
 
-    def __init__(self, debug: bool):
+    def __init__(
+        self,
+        debug: bool,
+        size: SizeTuple = GRID_SIZE,
+        autopilot: bool = False,
+        render_scale: float = 1.0,
+        trace_alloc: bool = False,
+        seed: Optional[int] = None,
+        adaptive_quality: bool = False,
+        level: Optional[str] = None,
+    ):
         """Main Application.
 
-        :param bp_name: Name of the Blueprint to be loaded.
-        :param grid: If `True`, draw a grid on top of the screen.
         :param debug: If `True`, render the debug info on screen.
+        :param size: Number of cells in each coordinate of the Grid.
+        :param autopilot: If `True`, the Snake is driven by the Autopilot.
+        :param render_scale: Resolution of the frames, relative to the Screen.
+        :param trace_alloc: If `True`, log allocations and GC pauses.
+        :param seed: Seed of the Grid. Random if `None`.
+        :param adaptive_quality: If `True`, lower the rendering quality under
+          load.
+        :param level: Name of the Level to be loaded. It sets the Grid size.
         """
-        super().__init__()
+        super().__init__(
+            render_scale=render_scale,
+            trace_alloc=trace_alloc,
+            adaptive_quality=adaptive_quality,
+        )
 
         self._debug = debug
 
         # Game Elements
         self._fps_font = SysFont(get_default_font(), size=DEBUG_SIZE)
-        self._grid = Grid()
+        self._grid = Grid(
+            size=size, seed=seed, level=Level(name=level) if level else None
+        )
+        if autopilot:
+            self._grid.snake.controller = Autopilot()
+        else:
+            self._grid.snake.input_latency = self._input_latency
         self._ui = UserInterface(grid=self._grid)
+        self._scaler = LayerScaler(scale=render_scale)
 
     @property
     def _debug_layers(self) -> Iterable[Layer]:
-        """Debug text layers."""
-        return multi_text(
-            font=self._fps_font,
-            color=DEBUG_COLOR,
-            msgs=(
-                f"FPS: {self._render_clock.get_fps()}",
-                str(self._grid.snake),
-                str(self._grid.apple),
-            ),
-        )
+        """Snake and input stats, or only the governor when text is off."""
+        if not self._quality.text:
+            msgs = [str(self._governor)]
+            return multi_text(
+                font=self._fps_font, color=DEBUG_COLOR, msgs=msgs
+            )
+
+        msgs = [
+            f"FPS: {self._render_clock.get_fps()}",
+            str(self._grid.snake),
+            str(self._grid.apple),
+        ]
+        controller = self._grid.snake.controller
+        msgs.append(str(controller or self._input_latency))
+        if self._governor:
+            msgs.append(str(self._governor))
+
+        return multi_text(font=self._fps_font, color=DEBUG_COLOR, msgs=msgs)
 
     @cached_property
     def _screen(self) -> Surface:
+        width, height = self._grid.camera.resolution
         return pygame.display.set_mode(
-            size=SCREEN_SIZE,
+            size=(width, height + UI_HEIGHT),
             flags=pygame.SCALED,
         )
 
+    def _apply_quality(self, quality: Quality) -> None:
+        """Scale the Layers to the Quality.
+
+        The grid lines are part of the Grid background, so they stay.
+        """
+        super()._apply_quality(quality)
+        self._scaler.scale = self._render_scale
+
     def _handle_events(self, event: Event) -> None:
         """Handle Game Events."""
         self._grid.handle_event(event=event)
@@ -72,12 +120,12 @@ class MainApp(GameApplication):
         self._grid.update_state()
 
     def _draw_graphics(self, interp: float) -> None:
-        """Render the frame and display it in the screen."""
-        layer_groups = [self._grid.layers, self._ui.layers]
-        if self._debug:
-            layer_groups.append(self._debug_layers)
+        """Render the frame onto the canvas."""
+        layers = chain(self._grid.layers, self._ui.layers)
+        self._canvas.fill(color=BG_COLOR)
+        self._canvas.blits(self._scaler.layers(layers))
 
-        self._screen.fill(color=BG_COLOR)
-        self._screen.blits(chain(*layer_groups))
-        pygame.display.flip()
-        self._render_clock.tick()
+    def _draw_overlay(self) -> None:
+        """Draw the debug text, at the Screen resolution."""
+        if self._debug:
+            self._screen.blits(self._debug_layers)
@@ -0,0 +1,366 @@
+"""Networked multiplayer Snake.
+
+An asyncio server owns the Grid and runs the tick loop. Clients connect over
+TCP, send one byte per movement (an action code of `SnakeEnv.ACTIONS`) and
+receive a full snapshot once, followed by one delta message per tick.
+
+Every message is prefixed by its length (`uint32`). Deltas only carry what
+changed: new heads, popped tails, deaths, joins and apple moves. Each event
+takes 6 bytes, regardless of the Grid size or the snake lengths.
+"""
+import asyncio
+import struct
+from enum import IntEnum
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from games.snake.controllers import CONTROLLERS
+from games.snake.enums import Cell, State
+from games.snake.env import SnakeEnv
+from games.snake.grid import Grid
+from games.snake.settings import TICK_STEP
+from games.snake.snake import Body, Snake
+from games.utils import SizeTuple
+
+#: Message length prefix.
+LENGTH = struct.Struct("<I")
+
+#: Snapshot header: (type, player id, columns, rows, apple, snake count).
+WELCOME = struct.Struct("<BBIIIH")
+
+#: Snake in a snapshot: (snake id, length), followed by its cells.
+SNAKE = struct.Struct("<BI")
+
+#: Delta header: (type, tick, event count).
+TICK = struct.Struct("<BIH")
+
+#: Delta event: (kind, snake id, cell).
+EVENT = struct.Struct("<BBI")
+
+#: Maximum bytes waiting to be sent to a client before it's dropped.
+MAX_BACKLOG = 1 << 20
+
+
+class Message(IntEnum):
+    """Server message types."""
+
+    WELCOME = 0
+    TICK = 1
+
+
+class Event(IntEnum):
+    """Kinds of delta events."""
+
+    MOVE = 0  # New head at `cell`. The tail was popped.
+    GROW = 1  # New head at `cell`. The tail was kept.
+    DIED = 2  # The whole snake was removed.
+    JOIN = 3  # New snake with a single segment at `cell`.
+    APPLE = 4  # The apple moved to `cell`.
+
+
+class Delta(NamedTuple):
+    """A single delta event."""
+
+    kind: Event
+    snake_id: int
+    cell: int
+
+
+def frame(payload: bytes) -> bytes:
+    """Prefix a message with its length."""
+    return LENGTH.pack(len(payload)) + payload
+
+
+async def read_message(reader: asyncio.StreamReader) -> bytes:
+    """Read a single length prefixed message."""
+    header = await reader.readexactly(LENGTH.size)
+    return await reader.readexactly(LENGTH.unpack(header)[0])
+
+
+def encode_tick(tick: int, events: List[Delta]) -> bytes:
+    """Encode the events of a tick."""
+    payload = [TICK.pack(Message.TICK, tick, len(events))]
+    payload.extend(EVENT.pack(*event) for event in events)
+    return frame(b"".join(payload))
+
+
+def decode_tick(message: bytes) -> Tuple[int, List[Delta]]:
+    """Decode the events of a tick.
+
+    :return: Tick number and its events.
+    """
+    _, tick, count = TICK.unpack_from(message)
+    offset = TICK.size
+    events = [
+        Delta(Event(kind), snake_id, cell)
+        for kind, snake_id, cell in EVENT.iter_unpack(message[offset:])
+    ]
+    assert len(events) == count, "Truncated tick message."
+    return tick, events
+
+
+class Player(NamedTuple):
+    """Connected client."""
+
+    snake_id: int
+    writer: asyncio.StreamWriter
+
+
+class Server:
+    """Authoritative multiplayer server."""
+
+    #: Maximum number of players, limited by the snake id size.
+    MAX_PLAYERS = 256
+
+    def __init__(
+        self,
+        size: SizeTuple,
+        seed: Optional[int] = None,
+        tick_step: float = TICK_STEP,
+    ):
+        """Create a new Server, with an empty Grid.
+
+        :param size: Number of cells in each coordinate of the Grid.
+        :param seed: Seed of the Grid.
+        :param tick_step: Difference in time between ticks (ms).
+        """
+        self.grid = Grid(size=size, seed=seed, snakes=0)
+        self.tick_step = tick_step
+        self.tick = 0
+
+        self._players: Dict[int, Player] = {}
+        self._snakes: Dict[int, Snake] = {}
+        self._events: List[Delta] = []  # Events since the last tick.
+
+        #: Total bytes broadcast in deltas, for bandwidth measurements.
+        self.bytes_sent = 0
+
+    def _spawn(self, snake_id: int) -> bool:
+        """Create the Snake of a player.
+
+        :return: `False` if the Grid is full, so there's no Snake.
+        """
+        snake = self.grid.add_snake()
+        if snake is None:
+            return False
+
+        self._snakes[snake_id] = snake
+        self._events.append(Delta(Event.JOIN, snake_id, snake.body.head))
+        return True
+
+    def _kill(self, snake_id: int) -> None:
+        """Remove the Snake of a player, if it has one."""
+        snake = self._snakes.pop(snake_id, None)
+        if snake is None:
+            return
+
+        self.grid.remove_snake(snake)
+        self._events.append(Delta(Event.DIED, snake_id, 0))
+
+    def _snapshot(self, snake_id: int) -> bytes:
+        """Full Grid state, sent once to new players."""
+        grid = self.grid
+        payload = [
+            WELCOME.pack(
+                Message.WELCOME,
+                snake_id,
+                grid.columns,
+                grid.rows,
+                grid.apple.cell,
+                len(self._snakes),
+            )
+        ]
+        for other_id, snake in self._snakes.items():
+            cells = list(snake.body)
+            payload.append(SNAKE.pack(other_id, len(cells)))
+            payload.append(struct.pack(f"<{len(cells)}I", *cells))
+
+        return frame(b"".join(payload))
+
+    def _update(self) -> bytes:
+        """Advance a tick and encode what changed."""
+        apple = self.grid.apple.cell
+        for snake_id, snake in list(self._snakes.items()):
+            length = len(snake)
+            snake.update_state()
+            if snake.state == State.DEAD:
+                # Respawn right away, so the player can keep playing. If
+                # there's no room, the player is dropped and can join again.
+                self._kill(snake_id)
+                if not self._spawn(snake_id):
+                    self._players[snake_id].writer.close()
+            elif snake.state != State.STOPPED:
+                kind = Event.GROW if len(snake) > length else Event.MOVE
+                self._events.append(Delta(kind, snake_id, snake.body.head))
+
+            if self.grid.apple.cell != apple:
+                apple = self.grid.apple.cell
+                self._events.append(Delta(Event.APPLE, 0, apple))
+
+        self.tick += 1
+        message = encode_tick(self.tick, self._events)
+        self._events.clear()
+        return message
+
+    def _broadcast(self, message: bytes) -> None:
+        """Send a message to every player, dropping slow ones."""
+        for player in list(self._players.values()):
+            transport = player.writer.transport
+            if transport.is_closing():
+                continue
+            if transport.get_write_buffer_size() > MAX_BACKLOG:
+                transport.close()
+                continue
+
+            player.writer.write(message)
+            self.bytes_sent += len(message)
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Register a player and apply its inputs until it disconnects."""
+        free = set(range(self.MAX_PLAYERS)) - set(self._players)
+        if not free:
+            writer.close()
+            return
+
+        snake_id = min(free)
+        if not self._spawn(snake_id):  # Full Grid.
+            writer.close()
+            return
+
+        self._players[snake_id] = Player(snake_id, writer)
+        writer.write(self._snapshot(snake_id))
+
+        try:
+            while True:
+                actions = await reader.read(64)
+                if not actions:
+                    break
+
+                # Only the latest input of a tick counts, like the keyboard.
+                snake = self._snakes.get(snake_id)
+                if snake is None:  # Dropped on respawn.
+                    break
+
+                snake.turn(state=SnakeEnv.ACTIONS[actions[-1] % 4])
+        except ConnectionError:
+            pass
+        finally:
+            del self._players[snake_id]
+            self._kill(snake_id)
+            writer.close()
+
+    async def serve(self, host: str, port: int) -> None:
+        """Accept players and run the tick loop forever."""
+        server = await asyncio.start_server(self._handle_client, host, port)
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        async with server:
+            while True:
+                self._broadcast(self._update())
+                next_tick += self.tick_step / 1000
+                await asyncio.sleep(max(next_tick - loop.time(), 0))
+
+
+class Replica:
+    """Client copy of the server Grid, rebuilt from snapshots and deltas.
+
+    The player's Snake is `grid.snake`, so any Controller can drive it.
+    """
+
+    def __init__(self, snapshot: bytes):
+        """Create a new Replica from a snapshot message."""
+        (_, self.snake_id, columns, rows, apple, count) = WELCOME.unpack_from(
+            snapshot
+        )
+        self.grid = Grid(size=(columns, rows), snakes=1)
+        self.grid.cells[:] = bytes(len(self.grid.cells))
+        self.grid.apple.cell = apple
+        self.grid.cells[apple] = Cell.APPLE
+
+        #: Bodies of every Snake, by id.
+        self.bodies: Dict[int, Body] = {}
+
+        offset = WELCOME.size
+        for _ in range(count):
+            snake_id, length = SNAKE.unpack_from(snapshot, offset)
+            offset += SNAKE.size
+            cells = struct.unpack_from(f"<{length}I", snapshot, offset)
+            offset += length * 4
+            self._join(snake_id, cells[-1])
+            for cell in reversed(cells[:-1]):
+                self._push(snake_id, cell)
+
+    @property
+    def alive(self) -> bool:
+        """Check if the player's Snake is in the Grid."""
+        return self.snake_id in self.bodies
+
+    def _join(self, snake_id: int, cell: int) -> None:
+        """Add a Snake with a single segment."""
+        body = Body(capacity=len(self.grid.cells), head=cell)
+        self.bodies[snake_id] = body
+        self.grid.cells[cell] = Cell.HEAD
+        if snake_id == self.snake_id:
+            self.grid.snake.body = body
+            self.grid.snake.state = State.STOPPED
+
+    def _push(self, snake_id: int, cell: int) -> None:
+        """Add a new head to a Snake."""
+        body = self.bodies[snake_id]
+        previous = body.head
+        self.grid.cells[previous] = Cell.BODY
+        self.grid.cells[cell] = Cell.HEAD
+        body.push(cell)
+        if snake_id == self.snake_id:
+            self.grid.snake.state = self.grid.direction(previous, cell)
+
+    def apply(self, message: bytes) -> int:
+        """Apply a tick message.
+
+        :return: Tick number.
+        """
+        tick, events = decode_tick(message)
+        for kind, snake_id, cell in events:
+            if kind in (Event.MOVE, Event.GROW):
+                self._push(snake_id, cell)
+                if kind == Event.MOVE:
+                    tail = self.bodies[snake_id].pop()
+                    self.grid.cells[tail] = Cell.EMPTY
+            elif kind == Event.JOIN:
+                self._join(snake_id, cell)
+            elif kind == Event.DIED:
+                for segment in self.bodies.pop(snake_id, ()):
+                    self.grid.cells[segment] = Cell.EMPTY
+            elif kind == Event.APPLE:
+                self.grid.apple.cell = cell
+                self.grid.cells[cell] = Cell.APPLE
+
+        return tick
+
+
+async def run_bot(
+    host: str, port: int, controller: str, ticks: Optional[int] = None
+) -> Replica:
+    """Connect a Controller to a server and play.
+
+    :param controller: Name of the Controller (see `CONTROLLERS`).
+    :param ticks: Number of ticks to play. Forever if `None`.
+    :return: Final Replica of the Grid.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    replica = Replica(await read_message(reader))
+    bot = CONTROLLERS[controller]()
+    played = 0
+    while ticks is None or played < ticks:
+        replica.apply(await read_message(reader))
+        played += 1
+        if not replica.alive:
+            continue
+
+        state = bot.decide(grid=replica.grid)
+        if state:
+            writer.write(bytes((SnakeEnv.ACTIONS.index(state),)))
+
+    writer.close()
+    return replica
@@ -10,18 +10,19 @@ BG_COLOR = Color(0x00, 0x00, 0x00)
 DEBUG_SIZE = 25
 DEBUG_COLOR = Color(0xFF, 0x00, 0x00)
 
-#: Screen Size
-SCREEN_WIDTH = 600
-SCREEN_HEIGHT = 640
-SCREEN_SIZE = (SCREEN_WIDTH, SCREEN_HEIGHT)
-
 #: Grid parameters.
 GRID_ALPHA = 50
 GRID_COLOR = Color(0xFF, 0xFF, 0xFF)
 GRID_LINE = 1
-GRID_SIZE = (20, 20)  # Total number of cells in each coordinate.
+GRID_SIZE = (20, 20)  # Default number of cells in each coordinate.
 GRID_STEP = 30  # The length of each cell in px.
 
+#: Level parameters.
+WALL_COLOR = (0x80, 0x80, 0x80, 0xFF)  # RGBA, so the sprite can be cached.
+
+#: Viewport parameters. The screen size is based on the visible cells.
+VIEW_SIZE = (20, 20)  # Maximum number of visible cells in each coordinate.
+
 #: UI parameters.
 UI_HEIGHT = 40
 
@@ -1,14 +1,28 @@
 """Represent the Main Protagonist."""
+from array import array
 from collections import deque
-from typing import Iterable, Mapping
-
+from itertools import repeat
+from typing import (
+    Deque,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
 import pygame
 from pygame.color import Color
 from pygame.event import Event
+from pygame.surface import Surface
 
-from games.snake.elements import GridElement
-from games.snake.enums import State
-from games.utils import Layer
+from games.snake.controllers import Controller
+from games.snake.elements import Point, cell_sprite
+from games.snake.enums import Cell, State
+from games.snake.settings import GRID_STEP, UI_HEIGHT
+from games.utils import LatencyTracker, SizeTuple, time_ms
 
 Grid = "snake.grid.Grid"
 
@@ -17,15 +31,99 @@ class KillSnake(Exception):
     """Raised if the Snake eats itself or go off screen."""
 
 
-class Segment(GridElement):
-    """Snake Body Segment."""
+class SnakeState(NamedTuple):
+    """Snapshot of a Snake."""
 
-    COLOR = Color(0x00, 0xBB, 0x00)
+    body: np.ndarray  # Packed cells, from head to tail.
+    state: State
+    next_state: State
+
+
+class Body:
+    """Snake Body, stored as a ring buffer of packed grid cells.
+
+    The buffer is allocated once, big enough to fill the whole grid, so
+    moving and growing the snake never allocates new objects.
+    """
+
+    def __init__(self, capacity: int, head: int):
+        """Create a new Body with a single segment.
+
+        :param capacity: Maximum number of segments (number of grid cells).
+        :param head: Packed cell of the head.
+        """
+        self._cells = array("i", bytes(capacity * array("i").itemsize))
+        self._view = np.frombuffer(self._cells, dtype=np.intc)
+        self._capacity = capacity
+        self._head = 0  # Buffer index of the head.
+        self._length = 1
+
+        self._cells[0] = head
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over the packed cells, from head to tail."""
+        for i in range(self._head, self._head + self._length):
+            yield self._cells[i % self._capacity]
+
+    def __len__(self) -> int:
+        """Number of segments."""
+        return self._length
+
+    @property
+    def head(self) -> int:
+        """Packed cell of the head."""
+        return self._cells[self._head]
+
+    @property
+    def tail(self) -> int:
+        """Packed cell of the tail."""
+        index = (self._head + self._length - 1) % self._capacity
+        return self._cells[index]
+
+    def push(self, cell: int) -> None:
+        """Add a new head.
+
+        :param cell: Packed cell of the new head.
+        """
+        self._head = (self._head - 1) % self._capacity
+        self._cells[self._head] = cell
+        self._length += 1
+
+    def pop(self) -> int:
+        """Remove the tail.
+
+        :return: Packed cell of the removed tail.
+        """
+        tail = self.tail
+        self._length -= 1
+        return tail
+
+    def to_array(self) -> np.ndarray:
+        """Copy of the packed cells, from head to tail."""
+        head = self._head
+        end = head + self._length
+        if end <= self._capacity:
+            return self._view[head:end].copy()
+
+        wrapped = end - self._capacity
+        return np.concatenate((self._view[head:], self._view[:wrapped]))
+
+    def load(self, cells: np.ndarray) -> None:
+        """Replace every segment.
+
+        :param cells: Packed cells, from head to tail.
+        """
+        self._view[: cells.size] = cells
+        self._head = 0
+        self._length = cells.size
 
 
 class Snake:
     """🐍."""
 
+    #: Body Color.
+    COLOR = Color(0x00, 0xBB, 0x00)
+
     #: Convert a pygame event into a Snake State.
     STATE_MAP: Mapping[Event, State] = {
         pygame.K_UP: State.UP,
@@ -35,36 +133,56 @@ class Snake:
     }
 
     #: Prevent the snake from reversing on itself.
-    FORBIDDEN_MOVEMENT: Mapping[State, Event] = {
-        State.UP: pygame.K_DOWN,
-        State.DOWN: pygame.K_UP,
-        State.RIGHT: pygame.K_LEFT,
-        State.LEFT: pygame.K_RIGHT,
+    FORBIDDEN_MOVEMENT: Mapping[State, State] = {
+        State.UP: State.DOWN,
+        State.DOWN: State.UP,
+        State.RIGHT: State.LEFT,
+        State.LEFT: State.RIGHT,
     }
 
+    #: Grid offset (x, y) of the head for each movement State.
+    MOVEMENT: Mapping[State, Tuple[int, int]] = {
+        State.UP: (0, -1),
+        State.DOWN: (0, 1),
+        State.RIGHT: (1, 0),
+        State.LEFT: (-1, 0),
+    }
+
+    #: Maximum number of turns buffered between ticks.
+    INPUT_BUFFER = 3
+
     def __init__(self, grid: Grid):
         """Create new Snake, controlled by the player.
 
         :param grid: Object representing the grid.
-        :param apple: Apple object.
         """
         self._grid = grid
-        self._apple = grid.apple
+
+        #: If set, drives the Snake instead of the keyboard.
+        self.controller: Optional[Controller] = None
+
+        #: Records how long inputs take to be presented, if set.
+        self.input_latency: Optional[LatencyTracker] = None
 
         self._state = State.STOPPED
         self._next_state = State.STOPPED  # State after handling input.
 
-        #: Snake Body, represented as a Deque.
-        #:
-        #: The leftmost (body[0]) element is the head and the last element is
-        #: the tail.
+        #: Keyboard turns and when they were handled, one applied per tick.
+        self._inputs: Deque[Tuple[State, float]] = deque()
+
+        #: Snake Body, represented as a ring buffer of packed cells.
         #:
-        #: For every step (without collision), a new head is created in the
+        #: For every step (without collision), a new head is pushed in the
         #: next grid cell (position based on next state) and the tail segment
-        #: is removed. If it collides with the apple, the tail is kept, giving
+        #: is popped. If it collides with the apple, the tail is kept, giving
         #: the impression that the snake has grown. Each in-between segment is
         #: kept in place, preserving its shape.
-        self.body: deque[Segment] = deque([Segment(grid=grid)])
+        head = grid.random_free_cell()
+        if head is None:
+            raise ValueError("There's no free cell for the Snake.")
+
+        self.body = Body(capacity=len(grid.cells), head=head)
+        grid.cells[self.body.head] = Cell.HEAD
 
     def __len__(self) -> int:
         """Number of segments."""
@@ -72,77 +190,147 @@ class Snake:
 
     def __str__(self) -> str:
         """Debug information."""
-        head = self.body[0]
-        return f"Snake: p={head.p} | B={len(self)} | S={self._state}"
+        head = Point(*self._grid.unpack(self.body.head))
+        return f"Snake: p={head} | B={len(self)} | S={self._state}"
 
     @property
-    def layers(self) -> Iterable[Layer]:
-        return (b.layer for b in self.body)
+    def state(self) -> State:
+        """Current State."""
+        return self._state
 
-    def _body_collision(self) -> bool:
-        """Detect collision between the head and the rest of the body."""
-        head = self.body[0].p
-        body_segments = iter(self.body)
-        next(body_segments)  # Skip the Head
-        for segment in body_segments:
-            if head.collision(segment.p):
-                return True
+    @state.setter
+    def state(self, state: State) -> None:
+        """Overwrite the current State, for copies of a remote Snake."""
+        self._state = state
+        self._next_state = state
 
-        return False
+    @property
+    def layers(self) -> Iterable[Tuple[Surface, SizeTuple]]:
+        """Body segments, all sharing a single sprite.
+
+        Segments are read straight from the visible Grid cells, so they can be
+        blitted in one batch together with the other layers.
+        """
+        visible = self._grid.board[self._grid.camera.window]
+        segments = (visible == Cell.BODY) | (visible == Cell.HEAD)
+        rows, columns = np.nonzero(segments)
+        xs = (columns * GRID_STEP).tolist()
+        ys = (rows * GRID_STEP + UI_HEIGHT).tolist()
+        return zip(repeat(cell_sprite(tuple(self.COLOR))), zip(xs, ys))
+
+    def snapshot(self) -> SnakeState:
+        """Copy the Snake state. Takes O(length)."""
+        return SnakeState(self.body.to_array(), self._state, self._next_state)
+
+    def clear(self) -> None:
+        """Clear the Grid cells occupied by the Snake."""
+        self._grid.board.reshape(-1)[self.body.to_array()] = Cell.EMPTY
+
+    def restore(self, snapshot: SnakeState) -> None:
+        """Restore a previous state. Takes O(length).
+
+        The cells of the current body must be cleared first (see `clear`).
+        """
+        self.body.load(snapshot.body)
+        cells = self._grid.board.reshape(-1)
+        cells[snapshot.body] = Cell.BODY
+        cells[snapshot.body[0]] = Cell.HEAD
+        self._state = snapshot.state
+        self._next_state = snapshot.next_state
 
     def handle_event(self, event: Event) -> None:
         """Handle Game Events.
 
         :param event: Pygame Event to be handled.
         """
-        if event.type != pygame.KEYDOWN:
+        if event.type != pygame.KEYDOWN or self.controller:
             return
 
-        forbidden = self.FORBIDDEN_MOVEMENT.get(self._state)
-        if event.key == forbidden:
+        next_state = self.STATE_MAP.get(event.key)
+        if next_state and len(self._inputs) < self.INPUT_BUFFER:
+            self._inputs.append((next_state, time_ms()))
+
+    def _apply_input(self) -> None:
+        """Apply the first buffered turn that changes the movement.
+
+        Turns are validated against the State they'll be applied to, so
+        quick sequences (e.g. UP then LEFT) are played over the next ticks.
+        """
+        while self._inputs:
+            state, timestamp = self._inputs.popleft()
+            if state == self._state:
+                continue
+            if state == self.FORBIDDEN_MOVEMENT.get(self._state):
+                continue
+
+            self._next_state = state
+            if self.input_latency:
+                self.input_latency.applied(timestamp=timestamp)
             return
 
-        next_state = self.STATE_MAP.get(event.key)
-        if next_state:
-            self._next_state = next_state
+    def turn(self, state: State) -> None:
+        """Set the movement State for the next update.
+
+        Reversing on itself is ignored.
 
-    def _process_movement(self) -> None:
+        :param state: One of the movement States.
+        """
+        if state != self.FORBIDDEN_MOVEMENT.get(self._state):
+            self._next_state = state
+
+    def _process_movement(self) -> Tuple[int, int]:
         """Process the Snake movement.
 
-        Create new head, based on the current state.
+        :return: Coordinates of the new head, based on the current state.
         """
-        new_point = self.body[0].p.clone(state=self._state)
-        new_head = Segment(grid=self._grid, point=new_point)
-        self.body.appendleft(new_head)
-
-    def _process_collision(self) -> None:
-        """Detect Collision between Snake and other game elements."""
-        head = self.body[0]
-        if self._body_collision():
-            self._next_state = State.DEAD
+        x, y = self._grid.unpack(self.body.head)
+        offset_x, offset_y = self.MOVEMENT[self._state]
+        return x + offset_x, y + offset_y
+
+    def _process_collision(self, x: int, y: int) -> None:
+        """Detect Collision between Snake and other game elements.
+
+        :param x: Column of the new head.
+        :param y: Row of the new head.
+        """
+        grid = self._grid
+        if not (0 <= x < grid.columns and 0 <= y < grid.rows):
             raise KillSnake
 
-        if not head.rect.colliderect(self._grid.rect):
+        # The tail is still in place, so moving into it is a collision. So
+        # are walls, compiled into the same cells when the Grid is created.
+        cell = grid.pack(x, y)
+        if grid.cells[cell] >= Cell.BODY:
             raise KillSnake
 
-        if head.p.collision(self._apple.p):
-            self._apple.respawn()
+        grid.cells[self.body.head] = Cell.BODY
+        grid.cells[cell] = Cell.HEAD
+        self.body.push(cell)
+
+        if cell == grid.apple.cell:
+            grid.apple.respawn()
             return  # Skip the pop, so it'll grow.
 
         # Remove tail after each movement to preserve its length.
-        self.body.pop()
+        grid.cells[self.body.pop()] = Cell.EMPTY
 
     def update_state(self) -> None:
         """Update the Snake state."""
         if self._state == State.DEAD:
             return
 
+        if self.controller:
+            next_state = self.controller.decide(grid=self._grid)
+            if next_state:
+                self.turn(state=next_state)
+        elif self._inputs:
+            self._apply_input()
+
         self._state = self._next_state
         if self._state == State.STOPPED:
             return
 
-        self._process_movement()
         try:
-            self._process_collision()
+            self._process_collision(*self._process_movement())
         except KillSnake:
             self._state = State.DEAD
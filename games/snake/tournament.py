@@ -0,0 +1,174 @@
+"""Headless tournament between Snake Controllers."""
+import csv
+from collections import defaultdict
+from itertools import islice
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Sequence, Tuple
+
+from games.snake.controllers import CONTROLLERS
+from games.snake.enums import State
+from games.snake.grid import Grid
+from games.utils import SizeTuple
+
+
+class GameResult(NamedTuple):
+    """Outcome of a single tournament game."""
+
+    controller: str
+    seed: int
+    score: int  # Number of apples eaten.
+    length: int
+    ticks: int
+    outcome: str  # One of "dead", "starved" or "timeout".
+
+
+class Chunk(NamedTuple):
+    """Unit of work of the tournament: games of one Controller."""
+
+    controller: str
+    seeds: Tuple[int, ...]
+    size: SizeTuple
+    max_ticks: int
+
+
+def play(
+    controller: str, seed: int, size: SizeTuple, max_ticks: int
+) -> GameResult:
+    """Play a single game until the snake dies, starves or times out.
+
+    The snake starves if it goes a whole grid worth of ticks without eating.
+
+    :param controller: Name of the Controller (see `CONTROLLERS`).
+    :param seed: Seed of the Grid.
+    :param size: Number of cells in each coordinate of the Grid.
+    :param max_ticks: Maximum number of ticks of the game.
+    """
+    grid = Grid(size=size, seed=seed)
+    snake = grid.snake
+    snake.controller = CONTROLLERS[controller]()
+
+    starvation = len(grid.cells)
+    last_meal = 0
+    outcome = "timeout"
+    tick = 0
+    for tick in range(1, max_ticks + 1):
+        length = len(snake)
+        grid.update_state()
+        if snake.state == State.DEAD:
+            outcome = "dead"
+            break
+
+        if len(snake) > length:
+            last_meal = tick
+        elif tick - last_meal > starvation:
+            outcome = "starved"
+            break
+
+    return GameResult(
+        controller=controller,
+        seed=seed,
+        score=len(snake) - 1,
+        length=len(snake),
+        ticks=tick,
+        outcome=outcome,
+    )
+
+
+def play_chunk(chunk: Chunk) -> List[GameResult]:
+    """Play every game of a Chunk. Runs inside the worker processes."""
+    return [
+        play(chunk.controller, seed, chunk.size, chunk.max_ticks)
+        for seed in chunk.seeds
+    ]
+
+
+def build_chunks(
+    controllers: Sequence[str],
+    seeds: Sequence[int],
+    size: SizeTuple,
+    max_ticks: int,
+    chunk_size: int,
+) -> Iterator[Chunk]:
+    """Split the tournament into Chunks of at most `chunk_size` games."""
+    for controller in controllers:
+        seed_iter = iter(seeds)
+        while True:
+            batch = tuple(islice(seed_iter, chunk_size))
+            if not batch:
+                break
+
+            yield Chunk(controller, batch, size, max_ticks)
+
+
+def run(
+    controllers: Sequence[str],
+    seeds: Sequence[int],
+    size: SizeTuple,
+    max_ticks: int,
+    chunk_size: int,
+    workers: int,
+) -> Iterator[GameResult]:
+    """Play every Controller against every seed in a process pool.
+
+    Chunks are fed to the workers as they become idle, so slow Controllers
+    don't hold the others back. Results are yielded as they arrive.
+
+    :param workers: Number of worker processes.
+    """
+    chunks = build_chunks(controllers, seeds, size, max_ticks, chunk_size)
+    with Pool(processes=workers) as pool:
+        for results in pool.imap_unordered(play_chunk, chunks):
+            yield from results
+
+
+def summarize(results: Iterable[GameResult]) -> List[Dict[str, str]]:
+    """Aggregate results by Controller, as rows of the summary table."""
+    by_controller = defaultdict(list)
+    for result in results:
+        by_controller[result.controller].append(result)
+
+    rows = []
+    for controller, games in sorted(by_controller.items()):
+        count = len(games)
+        deaths = sum(game.outcome == "dead" for game in games)
+        rows.append(
+            {
+                "controller": controller,
+                "games": str(count),
+                "mean score": f"{sum(g.score for g in games) / count:.2f}",
+                "max score": str(max(g.score for g in games)),
+                "mean length": f"{sum(g.length for g in games) / count:.2f}",
+                "mean ticks": f"{sum(g.ticks for g in games) / count:.1f}",
+                "deaths": f"{deaths / count:.1%}",
+            }
+        )
+
+    return rows
+
+
+def format_table(rows: List[Dict[str, str]]) -> str:
+    """Render summary rows as a plain text table."""
+    if not rows:
+        return ""
+
+    headers = list(rows[0])
+    widths = [max(len(h), *(len(row[h]) for row in rows)) for h in headers]
+    lines = [
+        "  ".join(h.ljust(w) for h, w in zip(headers, widths)),
+        "  ".join("-" * w for w in widths),
+    ]
+    for row in rows:
+        lines.append(
+            "  ".join(row[h].ljust(w) for h, w in zip(headers, widths))
+        )
+
+    return "\n".join(lines)
+
+
+def write_csv(path: Path, results: Iterable[GameResult]) -> None:
+    """Write the result of every game to a CSV file."""
+    with path.open("w", newline="") as fd:
+        writer = csv.writer(fd)
+        writer.writerow(GameResult._fields)
+        writer.writerows(results)
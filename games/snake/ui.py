@@ -3,8 +3,9 @@ from typing import Iterable
 
 from pygame.surface import Surface
 
+from games.assets import display_surface
 from games.snake.grid import Grid
-from games.snake.settings import SCREEN_WIDTH, UI_HEIGHT
+from games.snake.settings import UI_HEIGHT
 from games.utils import Layer, Position
 
 
@@ -18,8 +19,13 @@ class UserInterface:
         """
         self._grid = grid
 
+    @display_surface
+    def surface(self) -> Surface:
+        """Background of the User Interface."""
+        width = self._grid.camera.resolution[0]
+        return Surface(size=(width, UI_HEIGHT))
+
     @property
     def layers(self) -> Iterable[Layer]:
         """Rendering Layers."""
-        surface = Surface(size=(SCREEN_WIDTH, UI_HEIGHT))
-        return (Layer(surface, Position(0, 0)),)
+        return (Layer(self.surface, Position(0, 0)),)
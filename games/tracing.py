@@ -0,0 +1,192 @@
+"""Allocation and garbage collection tracing of the main loop."""
+import gc
+import logging
+import statistics
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from enum import Enum
+from typing import Deque, Dict, Iterator, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Phase(str, Enum):
+    """Measured parts of the main loop."""
+
+    TICK = "tick"
+    FRAME = "frame"
+
+
+class PhaseSample(NamedTuple):
+    """Measurement of a single tick or frame."""
+
+    phase: Phase
+    duration_ms: float
+    allocated: int  # Bytes allocated and still alive at the end.
+    peak_growth: int  # Bytes the phase raised the traced high-water mark.
+    gc_ms: float  # Time spent in garbage collections.
+    gc_generation: int  # Oldest generation collected, -1 if none.
+
+
+class AllocationTracer:
+    """Measure allocations and GC pauses of every tick and frame.
+
+    Python allocations are traced by `tracemalloc` and collections timed with
+    `gc.callbacks`. A summary of a rolling window is logged periodically: the
+    cost of each phase, the source lines whose allocations grew the most and
+    the slow frames that had a collection in them.
+
+    Pixel buffers of Surfaces are allocated by SDL, not Python, so only the
+    Python objects around them are traced.
+    """
+
+    #: Samples of each phase kept for the statistics.
+    WINDOW = 600
+
+    #: Interval between the logged reports (ms).
+    REPORT_INTERVAL = 5000
+
+    #: Number of source lines in the report.
+    TOP_ALLOCATORS = 10
+
+    #: Frames slower than this many times the median are spikes.
+    SPIKE_FACTOR = 2.0
+
+    #: Allocations of these files aren't reported.
+    IGNORED_FILES = (tracemalloc.__file__, __file__, "<frozen importlib.*>")
+
+    def __init__(self):
+        """Start tracing."""
+        tracemalloc.start()
+        gc.callbacks.append(self._on_gc)
+
+        self._gc_start: Optional[float] = None
+        self._gc_ms = 0.0
+        self._gc_generation = -1
+
+        self._samples: Dict[Phase, Deque[PhaseSample]] = {
+            phase: deque(maxlen=self.WINDOW) for phase in Phase
+        }
+        self._spikes: List[PhaseSample] = []  # Since the last report.
+        self._snapshot = self._take_snapshot()
+        self._next_report = time.perf_counter() + self.REPORT_INTERVAL / 1000
+
+    def _on_gc(self, phase: str, info: Dict[str, int]) -> None:
+        """Time a garbage collection."""
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            self._gc_ms += (time.perf_counter() - self._gc_start) * 1000
+            self._gc_generation = max(self._gc_generation, info["generation"])
+            self._gc_start = None
+
+    def _take_snapshot(self) -> tracemalloc.Snapshot:
+        """Snapshot of the traced allocations, without the ignored files."""
+        filters = [
+            tracemalloc.Filter(False, pattern)
+            for pattern in self.IGNORED_FILES
+        ]
+        return tracemalloc.take_snapshot().filter_traces(filters)
+
+    @contextmanager
+    def measure(self, phase: Phase) -> Iterator[None]:
+        """Measure a tick or frame.
+
+        Collections that happen between phases aren't counted. The peak of
+        `tracemalloc` can't be reset before Python 3.9, so instead of the
+        peak of each phase, the growth of the overall peak is measured: it's
+        zero unless the phase allocates more than ever before.
+        """
+        self._gc_ms = 0.0
+        self._gc_generation = -1
+        before, peak_before = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            current, peak = tracemalloc.get_traced_memory()
+            sample = PhaseSample(
+                phase=phase,
+                duration_ms=(end - start) * 1000,
+                allocated=current - before,
+                peak_growth=peak - peak_before,
+                gc_ms=self._gc_ms,
+                gc_generation=self._gc_generation,
+            )
+            self._add(sample)
+
+            if end >= self._next_report:
+                self._next_report = end + self.REPORT_INTERVAL / 1000
+                self.report()
+
+    def _add(self, sample: PhaseSample) -> None:
+        """Keep a sample, flagging it if it's a spike."""
+        samples = self._samples[sample.phase]
+        if samples:
+            median = statistics.median(s.duration_ms for s in samples)
+            if sample.duration_ms > median * self.SPIKE_FACTOR:
+                self._spikes.append(sample)
+
+        samples.append(sample)
+
+    def report(self) -> None:
+        """Log the window summary, top allocators and spikes."""
+        for phase, samples in self._samples.items():
+            if not samples:
+                continue
+
+            count = len(samples)
+            collections = [s for s in samples if s.gc_generation >= 0]
+            logger.info(
+                "%s: n=%d mean=%.2f ms max=%.2f ms | mean alloc=%.1f KiB"
+                " peak growth=%.1f KiB | gc=%d (max %.2f ms)",
+                phase.value,
+                count,
+                sum(s.duration_ms for s in samples) / count,
+                max(s.duration_ms for s in samples),
+                sum(s.allocated for s in samples) / count / 1024,
+                sum(s.peak_growth for s in samples) / count / 1024,
+                len(collections),
+                max((s.gc_ms for s in collections), default=0.0),
+            )
+
+        snapshot = self._take_snapshot()
+        stats = snapshot.compare_to(self._snapshot, "lineno")
+        self._snapshot = snapshot
+        growth = [stat for stat in stats if stat.size_diff > 0]
+        if growth:
+            logger.info("Top allocators (growth since the last report):")
+
+        for stat in growth[: self.TOP_ALLOCATORS]:
+            frame = stat.traceback[0]
+            logger.info(
+                "  %s:%d: %+.1f KiB (%+d blocks)",
+                frame.filename,
+                frame.lineno,
+                stat.size_diff / 1024,
+                stat.count_diff,
+            )
+
+        spikes, self._spikes = self._spikes, []
+        with_gc = [s for s in spikes if s.gc_generation >= 0]
+        if spikes:
+            logger.info(
+                "Spikes: %d, %d with GC pauses", len(spikes), len(with_gc)
+            )
+
+        for spike in with_gc:
+            logger.info(
+                "  %s of %.2f ms: gen %d GC took %.2f ms",
+                spike.phase.value,
+                spike.duration_ms,
+                spike.gc_generation,
+                spike.gc_ms,
+            )
+
+    def stop(self) -> None:
+        """Stop tracing."""
+        gc.callbacks.remove(self._on_gc)
+        tracemalloc.stop()
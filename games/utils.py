@@ -1,12 +1,29 @@
 """Declare auxiliary functions."""
 
+import hashlib
+import os
 import time
-from typing import Iterable, NamedTuple, Tuple
+from collections import deque
+from random import Random
+from typing import (
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+from weakref import WeakKeyDictionary
 
+from pygame import BLEND_RGBA_MAX, SRCALPHA, draw, transform
 from pygame.color import Color
 from pygame.font import Font
 from pygame.surface import Surface
 
+from games.assets import convert
+
 SizeTuple = Tuple[int, int]
 
 Point = "snake.elements.Point"
@@ -34,6 +51,169 @@ class Layer(NamedTuple):
         self.pos = Position(self.pos.y + offset.y, self.pos.y + offset.y)
 
 
+class LatencyTracker:
+    """Measure the delay between inputs and the frame that presents them."""
+
+    #: Number of samples kept for the statistics.
+    WINDOW = 100
+
+    def __init__(self):
+        """Create a new Latency Tracker."""
+        self._pending: List[float] = []  # Applied, but not presented yet.
+
+        #: Latest latency samples (ms).
+        self.samples: Deque[float] = deque(maxlen=self.WINDOW)
+
+    def __str__(self) -> str:
+        """Summary of the latest samples."""
+        if not self.samples:
+            return "Input Latency: -"
+
+        ordered = sorted(self.samples)
+        p95 = ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)]
+        mean = sum(ordered) / len(ordered)
+        return (
+            f"Input Latency: mean={mean:.0f} ms | p95={p95:.0f} ms"
+            f" | max={ordered[-1]:.0f} ms"
+        )
+
+    def applied(self, timestamp: float) -> None:
+        """Register an input whose effect is part of the game state.
+
+        :param timestamp: When the input was handled (ms).
+        """
+        self._pending.append(timestamp)
+
+    def presented(self) -> None:
+        """Register that a frame was presented on screen."""
+        now = time_ms()
+        self.samples.extend(now - timestamp for timestamp in self._pending)
+        self._pending.clear()
+
+
+class LayerScaler:
+    """Scale Layers down to the resolution of a render canvas.
+
+    Scaled Surfaces are cached while the original Surface is alive, so it's
+    meant for sprites and backgrounds that are reused between frames. Surfaces
+    redrawn every frame should be drawn at the canvas resolution instead.
+    """
+
+    def __init__(self, scale: float):
+        """Create a new Layer Scaler.
+
+        :param scale: Size of the canvas, relative to the Screen.
+        """
+        self._scale = scale
+        self._cache: "WeakKeyDictionary[Surface, Surface]" = (
+            WeakKeyDictionary()
+        )
+
+    @property
+    def scale(self) -> float:
+        """Size of the canvas, relative to the Screen."""
+        return self._scale
+
+    @scale.setter
+    def scale(self, scale: float) -> None:
+        """Change the scale, dropping the Surfaces scaled so far."""
+        if scale != self._scale:
+            self._cache.clear()
+            self._scale = scale
+
+    def surface(self, surface: Surface) -> Surface:
+        """Scaled copy of a Surface, in the display format.
+
+        Filtered if it's 24 or 32 bit, without a color key.
+        """
+        if self.scale == 1:
+            return surface
+
+        scaled = self._cache.get(surface)
+        if scaled is None:
+            size = scaled_size(surface.get_size(), self.scale)
+            keyed = surface.get_colorkey() is not None
+            if surface.get_bitsize() >= 24 and not keyed:
+                scaled = transform.smoothscale(surface, size)
+            else:  # Filtering would blend in the color key.
+                scaled = transform.scale(surface, size)
+
+            self._cache[surface] = scaled = convert(scaled)
+
+        return scaled
+
+    def pos(self, pos: Tuple[float, float]) -> Position:
+        """Scaled render position."""
+        return Position(round(pos[0] * self.scale), round(pos[1] * self.scale))
+
+    def layer(self, surface: Surface, pos: Tuple[float, float]) -> Layer:
+        """Scaled Layer."""
+        return Layer(self.surface(surface), self.pos(pos))
+
+    def layers(
+        self, layers: Iterable[Tuple[Surface, Tuple[float, float]]]
+    ) -> Iterator[Layer]:
+        """Scale every Layer."""
+        return (self.layer(surface, pos) for surface, pos in layers)
+
+
+class SplitMixRandom(Random):
+    """Random generator whose whole state is a single integer (SplitMix64).
+
+    Drop-in replacement for `random.Random`, but `getstate` and `setstate`
+    are O(1), which makes snapshots of the game state cheap.
+    """
+
+    MASK = (1 << 64) - 1
+
+    def seed(
+        self, a: Optional[Union[int, str, bytes]] = None, version: int = 2
+    ) -> None:
+        """Initialize the generator. Random if `a` is `None`.
+
+        Strings and bytes are digested, instead of hashed: their hash is
+        salted per process, so they wouldn't reproduce the same sequence.
+        """
+        if a is None:
+            a = int.from_bytes(os.urandom(8), "little")
+        elif not isinstance(a, int):
+            if isinstance(a, str):
+                a = a.encode()
+
+            digest = hashlib.blake2b(a, digest_size=8).digest()
+            a = int.from_bytes(digest, "little")
+
+        self._state = a & self.MASK
+
+    def _next(self) -> int:
+        """Next 64 random bits."""
+        self._state = (self._state + 0x9E3779B97F4A7C15) & self.MASK
+        z = self._state
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & self.MASK
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & self.MASK
+        return z ^ (z >> 31)
+
+    def getrandbits(self, k: int) -> int:
+        """Integer with `k` random bits."""
+        bits = 0
+        for shift in range(0, k, 64):
+            bits |= self._next() << shift
+
+        return bits & ((1 << k) - 1)
+
+    def random(self) -> float:
+        """Float in the interval [0, 1)."""
+        return (self._next() >> 11) * (1.0 / (1 << 53))
+
+    def getstate(self) -> int:
+        """Current state, to be passed to `setstate`."""
+        return self._state
+
+    def setstate(self, state: int) -> None:
+        """Restore a state returned by `getstate`."""
+        self._state = state
+
+
 def multi_text(
     font: Font, color: Color, msgs: Iterable[str]
 ) -> Iterable[Layer]:
@@ -44,6 +224,52 @@ def multi_text(
     return (Layer(s, p) for s, p in zip(surfaces, positions))
 
 
+def scaled_size(size: SizeTuple, scale: float) -> SizeTuple:
+    """Size of a Surface rendered at a scale, of at least 1 px."""
+    return max(round(size[0] * scale), 1), max(round(size[1] * scale), 1)
+
+
+def tile_surface(tile: Surface, size: SizeTuple) -> Surface:
+    """Fill a new Surface by repeating a tile pattern.
+
+    Tiles are copied as they are, per pixel alpha included.
+
+    :param tile: Surface to be repeated, starting from the top left corner.
+    :param size: Size of the new Surface.
+    """
+    surface = Surface(size=size, flags=tile.get_flags())
+    step_x, step_y = tile.get_size()
+    surface.blits(
+        (  # Max with the blank Surface, so pixels are copied, not blended.
+            (tile, (x, y), None, BLEND_RGBA_MAX)
+            for x in range(0, size[0], step_x)
+            for y in range(0, size[1], step_y)
+        ),
+        doreturn=False,
+    )
+    return surface
+
+
+def grid_overlay(
+    cell_size: SizeTuple,
+    size: SizeTuple,
+    color: Tuple[int, int, int, int],
+    width: int,
+) -> Surface:
+    """Outlines of every cell of a grid, tiled from a single one.
+
+    :param cell_size: Size (px) of a cell.
+    :param size: Size (px) of the overlay.
+    :param color: RGBA color of the lines.
+    :param width: Width (px) of the lines.
+    """
+    # Alpha in the pixels: blits of surface alpha plus a color key are much
+    # slower.
+    tile = Surface(size=cell_size, flags=SRCALPHA)
+    draw.rect(surface=tile, color=color, rect=tile.get_rect(), width=width)
+    return tile_surface(tile=tile, size=size)
+
+
 def time_ms() -> float:
     """Return current time in milliseconds."""
     return time.time() * 1000
@@ -8,10 +8,11 @@ setup(
     include_package_data=True,
     install_requires=[
         "Click==7.1.2",
+        "numpy==1.19.5",
         "pygame==2.0.1 ",
     ],
     extras_require={
-        "dev": ["pre-commit"],
+        "dev": ["pre-commit", "pytest"],
     },
     entry_points="""
         [console_scripts]
@@ -0,0 +1,32 @@
+"""Surfaces kept in the display format."""
+import pygame
+import pytest
+from pygame.surface import Surface
+
+from games import assets
+
+
+@pytest.fixture
+def display(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    yield pygame.display.set_mode((8, 8))
+    pygame.display.quit()
+
+
+def test_surface_cache_rebuilds_on_a_format_change(display, monkeypatch):
+    built = []
+
+    def build(key: int) -> Surface:
+        built.append(key)
+        return Surface((key, key))
+
+    cache = assets.SurfaceCache()
+    sprite = cache.get(4, build)
+    assert cache.get(4, build) is sprite
+    assert sprite.get_bitsize() == display.get_bitsize()
+
+    # The dummy video driver has a single format: fake another one.
+    monkeypatch.setattr(assets, "display_format", lambda: (16, (0, 0, 0, 0)))
+    assert cache.get(4, build) is not sprite
+    assert built == [4, 4]
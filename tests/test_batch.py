@@ -0,0 +1,45 @@
+"""Batched Snake engine, against the reference Snake rules."""
+from typing import Optional
+
+import numpy as np
+import pytest
+
+from games.snake.batch import SnakeBatch
+from games.snake.env import SnakeEnv
+from games.snake.level import Level
+
+
+@pytest.mark.parametrize("level_name", [None, "rooms"])
+def test_batch_follows_the_snake_rules(level_name: Optional[str]):
+    """Step the batch in lockstep with `SnakeEnv` games and compare them.
+
+    Apple positions come from different random generators, so the batch
+    copies the reference Grid after every respawn and reset.
+    """
+    level = Level(name=level_name) if level_name else None
+    size = level.size if level else (12, 10)
+    batch = SnakeBatch(n=32, size=size, level=level)
+    envs = [SnakeEnv(size=size, level=level) for _ in range(batch.n)]
+    for i, env in enumerate(envs):
+        env.reset(seed=i)
+        batch.load(i, env.grid)
+
+    rng = np.random.default_rng(0)
+    deaths = 0
+    for tick in range(300):
+        actions = rng.integers(len(batch.ACTIONS), size=batch.n)
+        boards, rewards, dones = batch.step(actions)
+        for i, env in enumerate(envs):
+            board, reward, done = env.step(actions[i])
+            assert reward == rewards[i], (tick, i)
+            assert done == dones[i], (tick, i)
+            if done:
+                deaths += 1
+                env.reset(seed=tick * batch.n + i)
+                batch.load(i, env.grid)
+            elif reward:
+                batch.load(i, env.grid)
+            else:
+                assert np.array_equal(board, boards[i]), (tick, i)
+
+    assert deaths
@@ -0,0 +1,12 @@
+"""Command line options."""
+from click.testing import CliRunner
+
+from games.cli import cli
+
+
+def test_projectile_workers_reject_the_heatmap():
+    result = CliRunner().invoke(
+        cli, ["projectile", "--workers", "2", "--heatmap-out", "impacts.npy"]
+    )
+    assert result.exit_code == 2
+    assert "--workers" in result.output
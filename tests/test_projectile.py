@@ -0,0 +1,51 @@
+"""Projectile simulation core."""
+import numpy as np
+import pytest
+
+from games.projectile.core import (
+    Blueprint,
+    ParallelProjectileManager,
+    ProjectileManager,
+)
+
+
+def test_dropped_shell_rests_on_the_floor():
+    blueprint = Blueprint(name="blocks")
+    column = int(np.flatnonzero(~blueprint.wall_grid.any(axis=0))[0])
+    x = (column + 0.5) * blueprint.block_size.x
+    floor = blueprint.rect.height
+
+    manager = ProjectileManager(blueprint, particles=False)
+    manager.create_projectile(velocity=(0.0, 0.0), pos=(x, floor - 100))
+    for _ in range(1000):
+        manager.process_logic()
+        assert manager.latest.pos.y <= floor
+        if manager.sleeping:
+            break
+
+    assert manager.sleeping == 1
+    assert manager.latest.pos.y == pytest.approx(floor, abs=1)
+
+
+@pytest.mark.parametrize("min_per_worker", [0, 1 << 20])
+def test_parallel_steps_like_serial(monkeypatch, min_per_worker):
+    monkeypatch.setattr(
+        ParallelProjectileManager, "MIN_PER_WORKER", min_per_worker
+    )
+    rng = np.random.default_rng(0)
+    salvo = [
+        (rng.uniform(-5, 5, 2), rng.uniform((0, 0), (800, 300)))
+        for _ in range(200)
+    ]
+    serial = ProjectileManager(Blueprint(name="blocks"), particles=False)
+    with ParallelProjectileManager(
+        Blueprint(name="blocks"), workers=2, particles=False, capacity=256
+    ) as parallel:
+        for manager in (serial, parallel):
+            for velocity, pos in salvo:
+                manager.create_projectile(velocity=velocity, pos=pos)
+            for _ in range(50):
+                manager.process_logic()
+
+        assert len(parallel) == len(serial) > 0
+        np.testing.assert_allclose(parallel.positions, serial.positions)
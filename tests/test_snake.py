@@ -0,0 +1,72 @@
+"""Snake game logic."""
+import numpy as np
+import pytest
+
+from games.snake.controllers import find_path
+from games.snake.env import SnakeEnv
+from games.snake.grid import Grid
+
+#: Start, goal and walls where closing the cells as soon as they're reached
+#  finds a path of 13 steps, instead of the shortest one of 11.
+DETOUR = (
+    "....##.",
+    ".###...",
+    "G###.##",
+    ".#.....",
+    "..#....",
+    "....##S",
+    "...#...",
+)
+
+
+def test_find_path_takes_the_shortest_detour():
+    grid = Grid(size=(7, 7), seed=0, snakes=0)
+    cells = "".join(DETOUR)
+    start, goal = cells.index("S"), cells.index("G")
+    walls = {cell for cell, char in enumerate(cells) if char == "#"}
+
+    path = find_path(grid, start=start, goal=goal, blocked=walls.__contains__)
+
+    assert path is not None
+    assert len(path) == 11
+    assert path[-1] == goal
+    steps = zip([start] + path, path)
+    assert all(cell in grid.neighbors(previous) for previous, cell in steps)
+    assert not walls.intersection(path)
+
+
+def test_grid_rejects_snakes_that_dont_fit():
+    with pytest.raises(ValueError):
+        Grid(size=(2, 1), seed=1, snakes=3)
+
+
+def test_full_grid_adds_no_snake():
+    grid = Grid(size=(2, 1), seed=1, snakes=1)
+    assert grid.add_snake() is None
+
+
+def test_env_replays_from_a_snapshot():
+    env = SnakeEnv(size=(8, 6))
+    first = env.reset(seed=3).copy()
+    assert np.array_equal(env.reset(seed=3), first)
+
+    rng = np.random.default_rng(0)
+    actions = rng.integers(len(env.ACTIONS), size=200)
+    snapshot = env.snapshot()
+    runs = []
+    for _ in range(2):
+        env.restore(snapshot)
+        run = []
+        for action in actions:
+            board, reward, done = env.step(action)
+            run.append((board.copy(), reward, done))
+            if done:
+                break
+
+        runs.append(run)
+
+    assert runs[0][-1][2]
+    assert len(runs[0]) == len(runs[1])
+    for (board, reward, _), (other, other_reward, _) in zip(*runs):
+        assert np.array_equal(board, other)
+        assert reward == other_reward